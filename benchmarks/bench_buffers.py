@@ -0,0 +1,78 @@
+"""
+Benchmark : découpage d'un gros fichier en texte ou en buffer.
+
+Lit un fichier de N Mo puis en extrait des tranches d'un quart du fichier à
+des positions qui avancent : avec read_file + substring chaque tranche copie
+le texte, avec buf_read_file + buf_slice la tranche est une vue sur le même
+contenu. Le hachage final du fichier entier (hash_sha256) encode le texte en
+UTF-8 dans le premier cas et lit le buffer sur place dans le second.
+
+Usage : python benchmarks/bench_buffers.py [taille en Mo] [nombre de tranches]
+"""
+import io
+import os
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jsonscript.compiler import JSSCompiler
+from jsonscript.factory import InstructionFactory
+from jsonscript.runner import JsonScript
+
+
+VARIANTS = {
+    "read_file + substring": """
+var data = read_file("%(path)s")
+var size = len(data)
+var result = 0
+var quarter = to_int(size / 4)
+for (i, 0, %(slices)d, 1) {
+    var start = to_int(size * i / %(slices)d * 3 / 4)
+    result = result + len(substring(data, start, start + quarter))
+}
+var digest = hash_sha256(data)
+""",
+    "buf_read_file + buf_slice": """
+var data = buf_read_file("%(path)s")
+var size = buf_len(data)
+var result = 0
+var quarter = to_int(size / 4)
+for (i, 0, %(slices)d, 1) {
+    var start = to_int(size * i / %(slices)d * 3 / 4)
+    result = result + buf_len(buf_slice(data, start, start + quarter))
+}
+var digest = hash_sha256(data)
+""",
+}
+
+
+def run(source: str):
+    program = JsonScript(InstructionFactory.build_block(JSSCompiler().compile(source)))
+    start = time.perf_counter()
+    with redirect_stdout(io.StringIO()) as output:
+        env = program.run(engine="closure")
+    if "Error" in output.getvalue():
+        raise RuntimeError(output.getvalue())
+    return time.perf_counter() - start, env.get_variable("result"), env.get_variable("digest")
+
+
+def main():
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    slices = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "payload.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("0123456789abcdef" * (size_mb * (1 << 16)))
+
+        print(f"{size_mb} MB file, {slices} slices of a quarter of the file, then sha256 of the whole file")
+        for name, body in VARIANTS.items():
+            elapsed, total, digest = run(body % {"path": path, "slices": slices})
+            print(f"  {name:<28} {elapsed * 1000:9.1f} ms   sliced={total} bytes  sha256={digest[:16]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Benchmark : coût des appels de fonction (fib récursif).
+
+Chaque appel de fib se termine par un "return" : c'est le chemin le plus
+sensible au protocole de fin d'exécution des instructions.
+
+Usage : python benchmarks/bench_calls.py [n] [répétitions]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jsonscript.compiler import JSSCompiler
+from jsonscript.factory import InstructionFactory
+from jsonscript.runner import JsonScript
+
+
+SOURCE = """
+func fib(n) {
+    if (n < 2) { return n }
+    return fib(n - 1) + fib(n - 2)
+}
+var result = fib(%d)
+"""
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    raw_program = JSSCompiler().compile(SOURCE % n)
+    print(f"fib({n}), best of {repeat}")
+    for engine in ("tree", "closure"):
+        for scoping in ("lexical", "dynamic"):
+            best = None
+            for _ in range(repeat):
+                program = JsonScript(InstructionFactory.build_block(raw_program))
+                start = time.perf_counter()
+                env = program.run(engine=engine, scoping=scoping)
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            print(f"  {engine:<8} {scoping:<8} : {best:.3f}s  (fib={env.get_variable('result')})")
+
+
+if __name__ == "__main__":
+    main()
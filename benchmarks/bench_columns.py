@@ -0,0 +1,82 @@
+"""
+Benchmark : agrégations sur un CSV en liste de dicts ou en colonnes typées.
+
+Génère un CSV de N lignes puis lance `main.py` sur deux programmes qui
+calculent la somme, la moyenne et le total par client d'une colonne
+numérique : l'un avec read_csv (dicts de chaînes, conversions et boucle dans
+le script), l'autre avec read_csv_columns + col_* / group_by_sum (tableaux
+typés, boucles natives, ramasse-miettes suspendu pendant le chargement avec
+l'option pause_gc). Mesure la durée et le pic de mémoire (RSS) de chaque
+processus.
+
+Usage : python benchmarks/bench_columns.py [nombre de lignes]
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ROWS = """
+var rows = read_csv("%(source)s")
+var total = 0
+var count = 0
+var by_customer = {}
+for (c, 0, 5000, 1) { put(by_customer, "customer-" + c, 0) }
+for (row in rows) {
+    if (at(row, "status") == "ok") {
+        var amount = to_int(at(row, "amount"))
+        var customer = at(row, "customer")
+        total = total + amount
+        count = count + 1
+        put(by_customer, customer, at(by_customer, customer) + amount)
+    }
+}
+print("total=" + total + " mean=" + total / count + " customers=" + len(by_customer))
+"""
+
+COLUMNS = """
+var table = col_filter(read_csv_columns("%(source)s", {"pause_gc": 1}), "status", "==", "ok")
+var by_customer = group_by_sum(table, "customer", "amount")
+print("total=" + col_sum(table, "amount") + " mean=" + col_mean(table, "amount") + " customers=" + len(by_customer))
+"""
+
+
+def write_csv(path: str, rows: int) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("id,customer,status,amount,comment\n")
+        for i in range(rows):
+            status = "ok" if i % 3 else "failed"
+            f.write(f"{i},customer-{i % 5000},{status},{i % 1000},order placed through the web shop\n")
+
+
+def measure(program_path: str):
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, os.path.join(ROOT, "main.py"), program_path],
+                               stdout=subprocess.PIPE, text=True)
+    lines = [line.strip() for line in process.stdout]
+    # wait4 : ressources de ce processus seul (ru_maxrss en Ko sous Linux)
+    _, _, usage = os.wait4(process.pid, 0)
+    return time.perf_counter() - start, usage.ru_maxrss / 1024, lines[-1]
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "orders.csv")
+        write_csv(source, rows)
+        print(f"{rows} rows, {os.path.getsize(source) / 1e6:.1f} MB")
+
+        for label, template in (("read_csv + loop", ROWS), ("read_csv_columns + col_*", COLUMNS)):
+            program_path = os.path.join(directory, "program.jss")
+            with open(program_path, "w", encoding="utf-8") as f:
+                f.write(template % {"source": source})
+            elapsed, peak_mb, last = measure(program_path)
+            print(f"  {label:<25} total {elapsed:6.2f}s   peak RSS {peak_mb:7.1f} MB   ({last})")
+
+
+if __name__ == "__main__":
+    main()
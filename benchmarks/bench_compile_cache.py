@@ -0,0 +1,71 @@
+"""
+Benchmark : chargement d'une grosse bibliothèque .jss avec et sans le cache d'AST.
+
+Génère une bibliothèque de N fonctions dans un dossier temporaire, puis compare
+JSSCompiler().compile (lexer + parser à chaque fois) au chargement depuis
+__jsscache__ (en-tête + marshal.loads), à froid (premier chargement, écriture
+du cache) et à chaud.
+
+Usage : python benchmarks/bench_compile_cache.py [nombre de fonctions] [répétitions]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jsonscript.ast_cache import ASTCache
+from jsonscript.compiler import JSSCompiler
+
+
+FUNCTION = """
+func helper_%d(a, b) {
+    var total = 0
+    for (i, 0, b, 1) {
+        if (i %% 2 == 0) { total = total + a * i } else { total = total - i }
+    }
+    print "helper_%d: " + total
+    return total
+}
+"""
+
+
+def best_of(repeat: int, action) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        action()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    functions = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "big_lib.jss")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("".join(FUNCTION % (i, i) for i in range(functions)))
+
+        def compile_source():
+            with open(path, "r", encoding="utf-8") as f:
+                JSSCompiler().compile(f.read())
+
+        cache = ASTCache()
+        start = time.perf_counter()
+        cache.load(path)
+        cold = time.perf_counter() - start
+
+        no_cache = best_of(repeat, compile_source)
+        warm = best_of(repeat, lambda: cache.load(path))
+
+        print(f"{functions} functions, {os.path.getsize(path) // 1024} KB of source")
+        print(f"  no cache   : {no_cache * 1000:8.2f} ms")
+        print(f"  cold cache : {cold * 1000:8.2f} ms (compile + write)")
+        print(f"  warm cache : {warm * 1000:8.2f} ms (x{no_cache / warm:.1f})")
+
+
+if __name__ == "__main__":
+    main()
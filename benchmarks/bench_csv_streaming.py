@@ -0,0 +1,83 @@
+"""
+Benchmark : CSV volumineux chargé en liste ou lu / écrit en flux.
+
+Génère un CSV de N lignes puis lance `main.py` sur deux programmes qui
+filtrent les lignes et en écrivent une copie réduite : l'un avec read_csv +
+write_csv (tout le fichier en liste de dicts, puis la sortie en liste),
+l'autre avec csv_open + csv_writer_*. Mesure la durée et le pic de mémoire
+(RSS) de chaque processus.
+
+Usage : python benchmarks/bench_csv_streaming.py [nombre de lignes]
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+WHOLE_FILE = """
+var rows = read_csv("%(source)s")
+var kept = []
+var total = 0
+for (row in rows) {
+    if (at(row, "status") == "ok") {
+        total = total + to_int(at(row, "amount"))
+        push(kept, row)
+    }
+}
+write_csv("%(target)s", kept)
+print("total=" + total)
+"""
+
+STREAMING = """
+var out = csv_writer_open("%(target)s", {"columns": ["id", "amount"]})
+var total = 0
+for (row in csv_open("%(source)s", {"columns": ["id", "status", "amount"]})) {
+    if (at(row, "status") == "ok") {
+        total = total + to_int(at(row, "amount"))
+        csv_write_row(out, at(row, "id"), at(row, "amount"))
+    }
+}
+csv_writer_close(out)
+print("total=" + total)
+"""
+
+
+def write_csv(path: str, rows: int) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("id,customer,status,amount,comment\n")
+        for i in range(rows):
+            status = "ok" if i % 3 else "failed"
+            f.write(f"{i},customer-{i % 5000},{status},{i % 1000},order placed through the web shop\n")
+
+
+def measure(program_path: str):
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, os.path.join(ROOT, "main.py"), program_path],
+                               stdout=subprocess.PIPE, text=True)
+    lines = [line.strip() for line in process.stdout]
+    # wait4 : ressources de ce processus seul (ru_maxrss en Ko sous Linux)
+    _, _, usage = os.wait4(process.pid, 0)
+    return time.perf_counter() - start, usage.ru_maxrss / 1024, lines[-1]
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "orders.csv")
+        write_csv(source, rows)
+        print(f"{rows} rows, {os.path.getsize(source) / 1e6:.1f} MB")
+
+        for label, template in (("read_csv + write_csv", WHOLE_FILE), ("csv_open + csv_writer", STREAMING)):
+            program_path = os.path.join(directory, "program.jss")
+            with open(program_path, "w", encoding="utf-8") as f:
+                f.write(template % {"source": source, "target": os.path.join(directory, "out.csv")})
+            elapsed, peak_mb, last = measure(program_path)
+            print(f"  {label:<22} total {elapsed:6.2f}s   peak RSS {peak_mb:7.1f} MB   ({last})")
+
+
+if __name__ == "__main__":
+    main()
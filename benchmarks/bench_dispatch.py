@@ -0,0 +1,44 @@
+"""
+Microbenchmark : résolution d'une commande dans ExpressionEvaluator.
+
+Compare l'ancien parcours linéaire des handlers (can_handle sur chacun)
+avec la table de dispatch O(1), pour une commande en tête de liste ("get")
+et une commande en fin de liste ("gui_get").
+
+Usage : python benchmarks/bench_dispatch.py [iterations]
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jsonscript.environment import Environment
+from jsonscript.evaluator import ExpressionEvaluator
+
+
+def linear_lookup(command):
+    for handler in ExpressionEvaluator.load_all_handlers():
+        if handler.can_handle(command):
+            return handler
+    return None
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+
+    print(f"Command lookup x {iterations}")
+    for command in ("get", "+", "gui_get"):
+        linear = timeit.timeit(lambda: linear_lookup(command), number=iterations)
+        table = timeit.timeit(lambda: ExpressionEvaluator.lookup(command), number=iterations)
+        print(f"  {command:<8} linear scan : {linear:.3f}s   table : {table:.3f}s   x{linear / table:.1f}")
+
+    env = Environment()
+    env.set_variable("x", 41)
+    expression = ["+", ["get", "x"], 1]
+    elapsed = timeit.timeit(lambda: ExpressionEvaluator.evaluate(expression, env), number=iterations)
+    print(f"\nevaluate {expression} x {iterations} : {elapsed:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
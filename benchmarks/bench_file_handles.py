@@ -0,0 +1,80 @@
+"""
+Benchmark : journal écrit ligne par ligne avec write_file ou un fichier ouvert.
+
+write_file ouvre, tronque, écrit et ferme le fichier à chaque appel : pour
+ajouter une ligne, le script réécrit tout le journal (E/S totales en N²).
+file_open + file_write_line garde le fichier ouvert et n'écrit qu'à chaque
+remplissage du tampon. Compare ensuite plusieurs tailles de tampon (et
+l'écriture ligne par ligne, line_buffered) sur un million de lignes.
+
+Usage : python benchmarks/bench_file_handles.py [lignes réécrites] [lignes en tampon]
+"""
+import io
+import os
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jsonscript.compiler import JSSCompiler
+from jsonscript.factory import InstructionFactory
+from jsonscript.runner import JsonScript
+
+
+# Les chaînes JSS n'ont pas de séquences d'échappement : le saut de ligne est écrit tel quel
+REWRITE = """
+var text = ""
+for (i, 0, %(lines)d, 1) {
+    text = text + "2026-10-17 12:00:00 INFO request " + i + "
+"
+    write_file("%(path)s", text)
+}
+"""
+
+HANDLE = """
+var log = file_open("%(path)s", "w"%(options)s)
+for (i, 0, %(lines)d, 1) {
+    file_write_line(log, "2026-10-17 12:00:00 INFO request ", i)
+}
+file_close(log)
+"""
+
+BUFFERS = {
+    "line_buffered": ', {"line_buffered": 1}',
+    "4 KB buffer": ', {"buffer_size": 4096}',
+    "64 KB (default)": "",
+    "1 MB buffer": ', {"buffer_size": 1048576}',
+}
+
+
+def run(source: str) -> float:
+    program = JsonScript(InstructionFactory.build_block(JSSCompiler().compile(source)))
+    start = time.perf_counter()
+    with redirect_stdout(io.StringIO()):
+        program.run()
+    return time.perf_counter() - start
+
+
+def main():
+    rewritten = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    buffered = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "app.log")
+
+        print(f"{rewritten} log lines")
+        elapsed = run(REWRITE % {"path": path, "lines": rewritten})
+        print(f"  {'write_file (rewrite)':<22} {elapsed * 1000:9.1f} ms   {os.path.getsize(path)} bytes")
+        elapsed = run(HANDLE % {"path": path, "lines": rewritten, "options": ""})
+        print(f"  {'file_open + append':<22} {elapsed * 1000:9.1f} ms   {os.path.getsize(path)} bytes")
+
+        print(f"{buffered} log lines through one handle")
+        for label, options in BUFFERS.items():
+            elapsed = run(HANDLE % {"path": path, "lines": buffered, "options": options})
+            print(f"  {label:<22} {elapsed * 1000:9.1f} ms   {buffered / elapsed / 1e3:6.0f}k lines/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Benchmark : parcours d'une liste et d'une chaîne.
+
+Compare for_range + len + at (un dispatch "at" et un index par élément) à
+for_each qui itère directement sur la valeur, sur les moteurs tree, closure
+et vm. Le parcours des clés d'un dictionnaire (impossible sans for_each) est
+mesuré seul.
+
+Usage : python benchmarks/bench_for_each.py [taille] [répétitions]
+"""
+import io
+import os
+import sys
+import time
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jsonscript.compiler import JSSCompiler
+from jsonscript.factory import InstructionFactory
+from jsonscript.runner import JsonScript
+from jsonscript.vm import run_program
+
+
+SETUP = """
+var xs = range(%d)
+var text = to_json(xs)
+var d = {}
+for (x in xs) { put(d, "k" + x, x) }
+"""
+
+VARIANTS = {
+    "list (for_range + at)": """
+var result = 0
+for (i, 0, len(xs), 1) { result = result + at(xs, i) }
+""",
+    "list (for_each)": """
+var result = 0
+for (x in xs) { result = result + x }
+""",
+    "string (for_range + at)": """
+var result = 0
+for (i, 0, len(text), 1) { if (at(text, i) == ",") { result = result + 1 } }
+""",
+    "string (for_each)": """
+var result = 0
+for (c in text) { if (c == ",") { result = result + 1 } }
+""",
+    "dict (for_each k, v)": """
+var result = 0
+for (k, v in d) { result = result + v }
+""",
+}
+
+
+def run(source: str, engine: str, repeat: int):
+    raw_program = JSSCompiler().compile(source)
+    best = float("inf")
+    for _ in range(repeat):
+        with redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            if engine == "vm":
+                env = run_program(raw_program)
+            else:
+                env = JsonScript(InstructionFactory.build_block(raw_program)).run(engine=engine, scoping="lexical")
+        best = min(best, time.perf_counter() - start)
+    return best, env.get_variable("result")
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    # Temps de construction des données (commun à toutes les variantes), retiré des mesures
+    print(f"{size} items, best of {repeat} (setup time subtracted)")
+    for engine in ("tree", "closure", "vm"):
+        print(f"  engine={engine}")
+        setup_time, _ = run(SETUP % size + "var result = 0", engine, repeat)
+        timings = {}
+        for name, body in VARIANTS.items():
+            elapsed, result = run(SETUP % size + body, engine, repeat)
+            timings[name] = max(elapsed - setup_time, 1e-9)
+            print(f"    {name:<24} {timings[name] * 1000:9.2f} ms   result={result}")
+        print(f"    list x{timings['list (for_range + at)'] / timings['list (for_each)']:.1f}, "
+              f"string x{timings['string (for_range + at)'] / timings['string (for_each)']:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Benchmark : builtins d'ordre supérieur contre les boucles JSS équivalentes.
+
+Compare une boucle while + push (un appel de fonction complet par élément) à
+map / filter / reduce avec une fonction nommée ou une lambda, dont la frame
+est préparée une seule fois par appel du builtin, sur les moteurs tree et
+closure.
+
+Usage : python benchmarks/bench_higher_order.py [taille de la liste] [répétitions]
+"""
+import io
+import os
+import sys
+import time
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jsonscript.compiler import JSSCompiler
+from jsonscript.factory import InstructionFactory
+from jsonscript.runner import JsonScript
+
+
+SETUP = """
+func square(x) { return x * x }
+func is_even(x) { return x %% 2 == 0 }
+func add(a, b) { return a + b }
+var xs = range(%d)
+"""
+
+VARIANTS = {
+    # range(0) : nouvelle liste à chaque exécution (un littéral [] serait partagé entre les répétitions)
+    "map (loop)": """
+var out = range(0)
+var i = 0
+var size = len(xs)
+while (i < size) {
+    push(out, square(at(xs, i)))
+    i = i + 1
+}
+var result = len(out)
+""",
+    "map (name)": """
+var result = len(map("square", xs))
+""",
+    "map (lambda)": """
+var result = len(map(x => x * x, xs))
+""",
+    "filter (loop)": """
+var out = range(0)
+for (i, 0, len(xs), 1) {
+    var x = at(xs, i)
+    if (is_even(x)) { push(out, x) }
+}
+var result = len(out)
+""",
+    "filter (lambda)": """
+var result = len(filter(x => x % 2 == 0, xs))
+""",
+    "reduce (loop)": """
+var result = 0
+for (i, 0, len(xs), 1) { result = add(result, at(xs, i)) }
+""",
+    "reduce (name)": """
+var result = reduce("add", xs, 0)
+""",
+}
+
+
+def run(source: str, engine: str, repeat: int):
+    raw_program = JSSCompiler().compile(source)
+    best = float("inf")
+    for _ in range(repeat):
+        program = JsonScript(InstructionFactory.build_block(raw_program))
+        start = time.perf_counter()
+        with redirect_stdout(io.StringIO()):
+            env = program.run(engine=engine, scoping="lexical")
+        best = min(best, time.perf_counter() - start)
+    return best, env.get_variable("result")
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    print(f"list of {size} numbers, best of {repeat}")
+    for engine in ("tree", "closure"):
+        print(f"  engine={engine}")
+        timings = {}
+        for name, body in VARIANTS.items():
+            elapsed, result = run(SETUP % size + body, engine, repeat)
+            timings[name] = elapsed
+            print(f"    {name:<16} {elapsed * 1000:9.2f} ms   result={result}")
+        print(f"    map x{timings['map (loop)'] / timings['map (lambda)']:.1f}, "
+              f"filter x{timings['filter (loop)'] / timings['filter (lambda)']:.1f}, "
+              f"reduce x{timings['reduce (loop)'] / timings['reduce (name)']:.1f}")
+
+
+if __name__ == "__main__":
+    main()
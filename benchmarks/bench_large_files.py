@@ -0,0 +1,105 @@
+"""
+Benchmark : parcours d'un gros fichier de log (2 Go par défaut).
+
+Génère un log de N Mo puis lance `main.py` sur cinq programmes qui
+comptent les lignes et les lignes "ERROR" : read_file + split (tout le texte
+puis la liste des lignes en mémoire), read_lines (une ligne à la fois, dans
+une boucle du script ou avec filter), mmap_open + buf_count (fichier
+projeté, recherche native) et read_chunks + buf_count (blocs de 16 Mo,
+lignes seulement). Mesure la durée et le pic de
+mémoire (RSS) de chaque processus.
+
+read_file + split demande plusieurs fois la taille du fichier en mémoire :
+sur une machine modeste, lancer avec une taille réduite.
+
+Usage : python benchmarks/bench_large_files.py [taille en Mo]
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Les chaînes JSS n'ont pas de séquences d'échappement : le saut de ligne est écrit tel quel
+VARIANTS = {
+    "read_file + split": """
+var count = 0
+var errors = 0
+for (line in split(read_file("%(path)s"), "
+")) {
+    count = count + 1
+    if (contains(line, "ERROR")) { errors = errors + 1 }
+}
+print("lines=" + (count - 1) + " errors=" + errors)
+""",
+    "read_lines": """
+var count = 0
+var errors = 0
+for (line in read_lines("%(path)s")) {
+    count = count + 1
+    if (contains(line, "ERROR")) { errors = errors + 1 }
+}
+print("lines=" + count + " errors=" + errors)
+""",
+    "read_lines + filter": """
+var errors = len(filter(line => contains(line, "ERROR"), read_lines("%(path)s")))
+print("errors=" + errors)
+""",
+    "mmap_open + buf_count": """
+var log = mmap_open("%(path)s")
+print("lines=" + buf_count(log, "
+") + " errors=" + buf_count(log, "ERROR"))
+""",
+    "read_chunks + buf_count": """
+var count = 0
+for (chunk in read_chunks("%(path)s", 16777216)) {
+    count = count + buf_count(chunk, "
+")
+}
+print("lines=" + count)
+""",
+}
+
+
+def write_log(path: str, size_mb: int) -> None:
+    lines = []
+    for i in range(1000):
+        level = "ERROR" if i % 50 == 0 else "INFO "
+        lines.append(f"2026-10-17 12:{i // 60 % 60:02d}:{i % 60:02d} {level} GET /api/items/{i} "
+                     f"status={500 if level == 'ERROR' else 200} took={i % 97}ms\n")
+    block = "".join(lines).encode("utf-8")
+    with open(path, "wb") as f:
+        for _ in range(size_mb * (1 << 20) // len(block)):
+            f.write(block)
+
+
+def measure(program_path: str):
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, os.path.join(ROOT, "main.py"), program_path],
+                               stdout=subprocess.PIPE, text=True)
+    lines = [line.strip() for line in process.stdout]
+    # wait4 : ressources de ce processus seul (ru_maxrss en Ko sous Linux)
+    _, _, usage = os.wait4(process.pid, 0)
+    return time.perf_counter() - start, usage.ru_maxrss / 1024, lines[-1]
+
+
+def main():
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 2048
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "access.log")
+        write_log(path, size_mb)
+        print(f"{os.path.getsize(path) / 1e6:.0f} MB log")
+
+        for label, template in VARIANTS.items():
+            program_path = os.path.join(directory, "program.jss")
+            with open(program_path, "w", encoding="utf-8") as f:
+                f.write(template % {"path": path})
+            elapsed, peak_mb, last = measure(program_path)
+            print(f"  {label:<24} total {elapsed:7.2f}s   peak RSS {peak_mb:8.1f} MB   ({last})")
+
+
+if __name__ == "__main__":
+    main()
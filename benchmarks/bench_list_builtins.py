@@ -0,0 +1,92 @@
+"""
+Benchmark : builtins de listes natifs contre les boucles JSS équivalentes.
+
+Compare l'ancienne moyenne de stdlib/math.jss (while + at + "+", trois
+dispatchs par élément) à sum(list) / len(list), et la recherche du maximum
+par boucle à max(list), sur les moteurs tree et closure.
+
+Usage : python benchmarks/bench_list_builtins.py [taille de la liste] [répétitions]
+"""
+import io
+import os
+import sys
+import time
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jsonscript.compiler import JSSCompiler
+from jsonscript.factory import InstructionFactory
+from jsonscript.runner import JsonScript
+
+
+SETUP = """
+var xs = range(%d)
+"""
+
+VARIANTS = {
+    "average (loop)": """
+func average(list) {
+    var total = 0
+    var size = len(list)
+    if (size == 0) { return 0 }
+    var i = 0
+    while (i < size) {
+        var val = at(list, i)
+        var total = total + val
+        var i = i + 1
+    }
+    return total / size
+}
+var result = average(xs)
+""",
+    "average (sum)": """
+func average(list) {
+    var size = len(list)
+    if (size == 0) { return 0 }
+    return sum(list) / size
+}
+var result = average(xs)
+""",
+    "max (loop)": """
+var result = at(xs, 0)
+for (i, 1, len(xs), 1) {
+    if (at(xs, i) > result) { result = at(xs, i) }
+}
+""",
+    "max (native)": """
+var result = max(xs)
+""",
+}
+
+
+def run(source: str, engine: str, repeat: int):
+    raw_program = JSSCompiler().compile(source)
+    best = float("inf")
+    for _ in range(repeat):
+        program = JsonScript(InstructionFactory.build_block(raw_program))
+        start = time.perf_counter()
+        with redirect_stdout(io.StringIO()):
+            env = program.run(engine=engine, scoping="lexical")
+        best = min(best, time.perf_counter() - start)
+    return best, env.get_variable("result")
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    print(f"list of {size} numbers, best of {repeat}")
+    for engine in ("tree", "closure"):
+        print(f"  engine={engine}")
+        timings = {}
+        for name, body in VARIANTS.items():
+            elapsed, result = run(SETUP % size + body, engine, repeat)
+            timings[name] = elapsed
+            print(f"    {name:<16} {elapsed * 1000:9.2f} ms   result={result}")
+        print(f"    average x{timings['average (loop)'] / timings['average (sum)']:.0f}, "
+              f"max x{timings['max (loop)'] / timings['max (native)']:.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark : boucles lourdes (for_range / while).
+
+Compare l'exécution d'un corps de boucle compilé une seule fois (comportement
+actuel de la factory) avec l'ancien comportement qui reconstruisait chaque
+Instruction à chaque itération.
+
+Usage : python benchmarks/bench_loops.py [iterations]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jsonscript.environment import Environment
+from jsonscript.factory import InstructionFactory
+
+
+LOOP_BODY = [
+    ["set", "total", ["+", ["get", "total"], ["get", "i"]]],
+    ["if", ["==", ["%", ["get", "i"], 2], 0], [
+        ["set", "even", ["+", ["get", "even"], 1]]
+    ]]
+]
+
+
+def run_compiled(iterations: int) -> float:
+    env = Environment()
+    env.set_variable("total", 0)
+    env.set_variable("even", 0)
+    loop = InstructionFactory.build(["for_range", "i", 0, iterations, 1, LOOP_BODY])
+
+    start = time.perf_counter()
+    loop.execute(env)
+    return time.perf_counter() - start
+
+
+def run_rebuilt(iterations: int) -> float:
+    """Reproduit l'ancien chemin : InstructionFactory.build() par itération."""
+    env = Environment()
+    env.set_variable("total", 0)
+    env.set_variable("even", 0)
+
+    start = time.perf_counter()
+    for i in range(iterations):
+        env.set_variable("i", i)
+        for raw_instruction in LOOP_BODY:
+            InstructionFactory.build(raw_instruction).execute(env)
+    return time.perf_counter() - start
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+
+    rebuilt = run_rebuilt(iterations)
+    compiled = run_compiled(iterations)
+
+    print(f"for_range x {iterations}")
+    print(f"  rebuild per iteration : {rebuilt:.3f}s")
+    print(f"  compiled once         : {compiled:.3f}s")
+    print(f"  speedup               : x{rebuilt / compiled:.2f}")
+
+
+if __name__ == "__main__":
+    main()
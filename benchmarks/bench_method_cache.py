@@ -0,0 +1,50 @@
+"""
+Microbenchmark : dispatch de call_method sur une hiérarchie à 3 niveaux.
+
+La méthode est définie dans la classe de base et appelée sur une instance de
+la classe la plus dérivée : sans cache, chaque appel remonte les 3 classes.
+Compare l'expression brute (recherche à chaque appel) avec un site compilé
+CallMethodSite (cache en ligne par classe).
+
+Usage : python benchmarks/bench_method_cache.py [itérations]
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jsonscript.environment import Environment
+from jsonscript.evaluator import ExpressionEvaluator
+from jsonscript.factory import InstructionFactory
+from jsonscript.inline_cache import CallSiteCompiler
+
+
+PROGRAM = [
+    ["class", "Base", ["value"], {"get_value": [[], [["return", ["get_attr", ["get", "this"], "value"]]]]}],
+    ["class", "Middle", ["value"], {"describe": [[], [["return", "middle"]]]}, "Base"],
+    ["class", "Leaf", ["value"], {"leaf_only": [[], [["return", "leaf"]]]}, "Middle"],
+    ["set", "obj", ["new", "Leaf", 42]],
+]
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+
+    env = Environment()
+    for instruction in InstructionFactory.build_block(PROGRAM):
+        instruction.execute(env)
+
+    raw_call = ["call_method", ["get", "obj"], "get_value"]
+    site = CallSiteCompiler().compile(raw_call)
+
+    print(f"call_method on a 3-level hierarchy x {iterations}")
+    uncached = timeit.timeit(lambda: ExpressionEvaluator.evaluate(raw_call, env), number=iterations)
+    cached = timeit.timeit(lambda: ExpressionEvaluator.evaluate(site, env), number=iterations)
+    print(f"  lookup per call  : {uncached:.3f}s")
+    print(f"  inline cache     : {cached:.3f}s   x{uncached / cached:.2f}")
+    print(f"  cache entries    : {list(site.cache.entries)}")
+
+
+if __name__ == "__main__":
+    main()
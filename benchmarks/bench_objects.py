@@ -0,0 +1,57 @@
+"""
+Benchmark : mémoire et accès aux attributs des instances JsonScript.
+
+Crée N instances d'une classe à 3 paramètres puis lit un attribut sur chacune.
+La disposition historique (dict {"__class__", "__data__": {...}}) est
+construite à titre de comparaison pour la mémoire.
+
+Usage : python benchmarks/bench_objects.py [nombre d'instances]
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jsonscript.environment import Environment
+from jsonscript.evaluator import ExpressionEvaluator
+from jsonscript.factory import InstructionFactory
+
+
+def measure(build):
+    tracemalloc.start()
+    start = time.perf_counter()
+    objects = build()
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return objects, size, elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+
+    env = Environment()
+    InstructionFactory.build(["class", "Point", ["x", "y", "label"], {}]).execute(env)
+    cls = env.get_class("Point")
+
+    print(f"{count} instances of Point(x, y, label)")
+    legacy, legacy_size, _ = measure(
+        lambda: [{"__class__": "Point", "__data__": {"x": i, "y": i, "label": "p"}} for i in range(count)]
+    )
+    print(f"  dict layout      : {legacy_size / count:6.1f} bytes/instance")
+    del legacy
+
+    instances, size, elapsed = measure(lambda: [cls.instantiate([i, i, "p"]) for i in range(count)])
+    print(f"  slot layout      : {size / count:6.1f} bytes/instance  (created in {elapsed:.3f}s)")
+
+    get_attr = ExpressionEvaluator.lookup("get_attr")
+    start = time.perf_counter()
+    for instance in instances:
+        get_attr([instance, "y"], env, ExpressionEvaluator.evaluate)
+    print(f"  get_attr x {count} : {time.perf_counter() - start:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Stress test : profondeur de récursion des fonctions JsonScript.
+
+Compare une fonction récursive terminale (return count(...)) avec la même
+fonction dont l'appel n'est pas en position terminale. La première s'exécute
+en boucle (profondeur de pile constante), la seconde empile des appels Python
+et finit par dépasser la limite de récursion.
+
+Usage : python benchmarks/bench_recursion.py [profondeur max]
+"""
+import io
+import os
+import sys
+import time
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jsonscript.compiler import JSSCompiler
+from jsonscript.factory import InstructionFactory
+from jsonscript.runner import JsonScript
+
+
+VARIANTS = {
+    "tail": """
+func count(n, acc) {
+    if (n == 0) { return acc }
+    return count(n - 1, acc + n)
+}
+var result = count(%d, 0)
+""",
+    "non-tail": """
+func count(n, acc) {
+    if (n == 0) { return acc }
+    var r = count(n - 1, acc + n)
+    return r
+}
+var result = count(%d, 0)
+""",
+}
+
+
+def run(source: str, engine: str):
+    program = JsonScript(InstructionFactory.build_block(JSSCompiler().compile(source)))
+    output = io.StringIO()
+    start = time.perf_counter()
+    with redirect_stdout(output):
+        env = program.run(engine=engine, scoping="lexical")
+    elapsed = time.perf_counter() - start
+    try:
+        return f"{elapsed:.3f}s (result={env.get_variable('result')})"
+    except ValueError:
+        return f"failed: {output.getvalue().strip()[:60]}"
+
+
+def main():
+    max_depth = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    depth = 100
+    while depth <= max_depth:
+        print(f"depth {depth}")
+        for engine in ("tree", "closure"):
+            for name, source in VARIANTS.items():
+                print(f"  {engine:<8} {name:<9} : {run(source % depth, engine)}")
+        depth *= 10
+
+
+if __name__ == "__main__":
+    main()
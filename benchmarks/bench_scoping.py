@@ -0,0 +1,55 @@
+"""
+Benchmark : lecture de variables selon le mode de portée (dynamic / lexical).
+
+Le programme descend récursivement à une profondeur donnée puis fait une
+boucle qui lit ses variables locales et une globale. En mode dynamique la
+lecture de la globale remonte toute la pile de scopes ; en mode lexical les
+locales sont un accès indexé dans la frame et la globale un seul dict.
+
+Usage : python benchmarks/bench_scoping.py [profondeur] [itérations]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jsonscript.compiler import JSSCompiler
+from jsonscript.factory import InstructionFactory
+from jsonscript.runner import JsonScript
+from jsonscript.resolver import SCOPING_MODES
+
+
+SOURCE = """
+func work(n) {
+    var acc = 0
+    for (i, 0, n, 1) {
+        acc = acc + i %% modulo
+    }
+    return acc
+}
+func descend(depth, n) {
+    if (depth == 0) { return work(n) }
+    return descend(depth - 1, n)
+}
+var modulo = 7
+print "result=" + descend(%(depth)d, %(iterations)d)
+"""
+
+
+def main():
+    depth = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 100_000
+
+    raw_program = JSSCompiler().compile(SOURCE % {"depth": depth, "iterations": iterations})
+    print(f"Variable reads at call depth {depth}, {iterations} iterations")
+    for engine in ("tree", "closure"):
+        for scoping in SCOPING_MODES:
+            program = JsonScript(InstructionFactory.build_block(raw_program))
+            start = time.perf_counter()
+            program.run(engine=engine, scoping=scoping)
+            print(f"  {engine:<8} {scoping:<8} : {time.perf_counter() - start:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
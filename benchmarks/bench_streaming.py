@@ -0,0 +1,64 @@
+"""
+Benchmark : programme .json volumineux chargé d'un bloc ou exécuté en flux.
+
+Génère un programme de N instructions de premier niveau (quelques centaines
+d'octets chacune), puis lance `main.py` avec et sans --stream. Mesure le
+délai avant la première sortie, la durée totale et le pic de mémoire (RSS)
+du processus.
+
+Usage : python benchmarks/bench_streaming.py [nombre d'instructions]
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def write_program(path: str, statements: int) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('[["print", "start"], ["set", "total", 0],\n')
+        for i in range(statements):
+            payload = [i, i * 2, i * 3, "padding-" * 8]
+            f.write(json.dumps(["set", "payload", payload]))
+            f.write(",\n")
+            f.write(json.dumps(["set", "total", ["+", ["get", "total"], ["len", ["get", "payload"]]]]))
+            f.write(",\n")
+        f.write('["print", "total=", ["get", "total"]]]\n')
+
+
+def measure(path: str, stream: bool):
+    command = [sys.executable, os.path.join(ROOT, "main.py"), path] + (["--stream"] if stream else [])
+    start = time.perf_counter()
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    first_output = None
+    lines = []
+    for line in process.stdout:
+        if first_output is None and line.strip() == "start":
+            first_output = time.perf_counter() - start
+        lines.append(line.strip())
+    # wait4 : ressources de ce processus seul (ru_maxrss en Ko sous Linux)
+    _, _, usage = os.wait4(process.pid, 0)
+    elapsed = time.perf_counter() - start
+    return first_output, elapsed, usage.ru_maxrss / 1024, lines[-1]
+
+
+def main():
+    statements = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "big_program.json")
+        write_program(path, statements)
+        print(f"{statements * 2 + 3} top-level instructions, {os.path.getsize(path) / 1e6:.1f} MB")
+
+        for label, stream in (("json.load", False), ("--stream", True)):
+            first_output, elapsed, peak_mb, last = measure(path, stream)
+            print(f"  {label:<10} first output {first_output:6.2f}s   total {elapsed:6.2f}s   "
+                  f"peak RSS {peak_mb:7.1f} MB   ({last})")
+
+
+if __name__ == "__main__":
+    main()
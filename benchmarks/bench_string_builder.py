@@ -0,0 +1,88 @@
+"""
+Benchmark : construction d'un long texte par concaténation ou string builder.
+
+Construit un texte de N Mo morceau par morceau : avec ["+", acc, morceau]
+chaque ajout recopie tout l'accumulateur (coût quadratique), avec sb_append
+les morceaux sont gardés en liste et joints une seule fois par sb_build.
+Compare aussi la mise en forme d'une ligne par "+" et par format (template
+analysé une fois pour le site d'appel).
+
+Usage : python benchmarks/bench_string_builder.py [taille en Mo] [taille d'un morceau]
+"""
+import io
+import os
+import sys
+import time
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jsonscript.compiler import JSSCompiler
+from jsonscript.factory import InstructionFactory
+from jsonscript.runner import JsonScript
+
+
+BUILD_VARIANTS = {
+    "concat (+)": """
+var acc = ""
+for (i, 0, %(pieces)d, 1) { acc = acc + piece }
+var result = len(acc)
+""",
+    "string builder": """
+var sb = sb_new()
+for (i, 0, %(pieces)d, 1) { sb_append(sb, piece) }
+var result = len(sb_build(sb))
+""",
+}
+
+LINE_VARIANTS = {
+    "line with +": """
+var result = 0
+for (i, 0, %(lines)d, 1) {
+    var line = "item " + i + ": " + i * 3 + " units, total " + i * 7
+    result = result + len(line)
+}
+""",
+    "line with format": """
+var result = 0
+for (i, 0, %(lines)d, 1) {
+    var line = format("item {}: {} units, total {}", i, i * 3, i * 7)
+    result = result + len(line)
+}
+""",
+}
+
+
+def run(source: str, engine: str):
+    program = JsonScript(InstructionFactory.build_block(JSSCompiler().compile(source)))
+    start = time.perf_counter()
+    with redirect_stdout(io.StringIO()):
+        env = program.run(engine=engine)
+    return time.perf_counter() - start, env.get_variable("result")
+
+
+def main():
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    piece_size = int(sys.argv[2]) if len(sys.argv) > 2 else 4096
+    pieces = size_mb * (1 << 20) // piece_size
+    setup = 'var piece = "%s"\n' % ("x" * piece_size)
+
+    for engine in ("tree", "closure"):
+        print(f"engine={engine}")
+        print(f"  {size_mb} MB text from {pieces} pieces of {piece_size} chars")
+        timings = {}
+        for name, body in BUILD_VARIANTS.items():
+            elapsed, result = run(setup + body % {"pieces": pieces}, engine)
+            timings[name] = elapsed
+            print(f"    {name:<18} {elapsed * 1000:9.1f} ms   length={result}")
+        print(f"    x{timings['concat (+)'] / timings['string builder']:.0f}")
+
+        lines = 100_000
+        print(f"  {lines} formatted lines")
+        for name, body in LINE_VARIANTS.items():
+            elapsed, result = run(body % {"lines": lines}, engine)
+            print(f"    {name:<18} {elapsed * 1000:9.1f} ms   chars={result}")
+
+
+if __name__ == "__main__":
+    main()
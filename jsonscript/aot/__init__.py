@@ -0,0 +1,17 @@
+"""
+Ahead-of-time backend: JsonScript programs translated into plain Python modules.
+
+    python main.py script.jss --emit-python out.py   # écrit le module Python
+    python main.py script.jss --engine=python         # exécute le module (mis en cache)
+"""
+from jsonscript.aot.transpiler import PythonTranspiler, TRANSPILER_VERSION
+from jsonscript.aot.cache import emit_python, load_transpiled, run_file
+
+
+__all__ = [
+    "PythonTranspiler",
+    "TRANSPILER_VERSION",
+    "emit_python",
+    "load_transpiled",
+    "run_file",
+]
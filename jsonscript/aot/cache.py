@@ -0,0 +1,125 @@
+"""
+On-disk cache of transpiled modules, stored next to the source like __pycache__:
+
+    examples/__jsscache__/test_full.<hash>.py
+
+The key is a hash of the source content and of the transpiler and JSS compiler
+versions, so an unchanged .jss/.json file is never lexed, parsed nor transpiled
+twice. --no-cache and --cache-dir apply as for the AST cache: no file is read
+or written, or every module goes to the given directory (the stem then carries
+a hash of the source path, since homonymous sources share it).
+"""
+import hashlib
+import importlib.util
+import json
+import os
+from typing import Any, List, Optional, Tuple
+from jsonscript.aot.transpiler import PythonTranspiler, TRANSPILER_VERSION
+from jsonscript.ast_cache import current_cache
+from jsonscript.compiler import COMPILER_VERSION
+
+
+CACHE_DIR_NAME = "__jsscache__"
+
+
+def source_digest(source_text: str) -> str:
+    # Le code généré dépend aussi de l'AST produit par JSSCompiler (commandes natives...)
+    payload = f"jsonscript-aot-v{TRANSPILER_VERSION}-jss{COMPILER_VERSION}\n{source_text}".encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()[:16]
+
+
+def cache_stem(filename: str, cache_dir: Optional[str] = None) -> str:
+    """Part of the cache file name shared by every version of a source file."""
+    source_path = os.path.abspath(filename)
+    stem = os.path.splitext(os.path.basename(source_path))[0]
+    if cache_dir:
+        stem += "." + hashlib.blake2b(source_path.encode("utf-8"), digest_size=4).hexdigest()
+    return stem
+
+
+def cache_path(filename: str, digest: str, cache_dir: Optional[str] = None) -> str:
+    directory = cache_dir or os.path.join(os.path.dirname(os.path.abspath(filename)), CACHE_DIR_NAME)
+    return os.path.join(directory, f"{cache_stem(filename, cache_dir)}.{digest}.py")
+
+
+def program_name(digest: str) -> str:
+    return f"_program_j{digest}"
+
+
+def parse_source(filename: str, source_text: str) -> List[Any]:
+    if filename.endswith(".jss"):
+        from jsonscript.compiler import JSSCompiler
+        return JSSCompiler().compile(source_text)
+    return json.loads(source_text)
+
+
+def _write_cache(path: str, stem: str, python_source: str) -> None:
+    directory = os.path.dirname(path)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(directory, exist_ok=True)
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(python_source)
+        # Remplacement atomique : un lecteur concurrent voit l'ancien ou le nouveau module, jamais un module tronqué
+        os.replace(temp_path, path)
+    except OSError:
+        return # Dossier en lecture seule : on travaille sans cache
+
+    # Supprime les anciennes versions du même fichier source : "<stem>.<digest>.py" exactement
+    # (pas celles d'un homonyme plus long, "a.b.jss" pour "a.jss")
+    current = os.path.basename(path)
+    for entry in os.listdir(directory):
+        stale = entry.startswith(stem + ".") and entry.endswith(".py") and "." not in entry[len(stem) + 1:-3]
+        if stale and entry != current:
+            try:
+                os.remove(os.path.join(directory, entry))
+            except OSError:
+                pass # Déjà supprimée par un autre processus
+
+
+def load_transpiled(filename: str) -> Tuple[str, str, Optional[str]]:
+    """
+    Returns (python_source, program_function_name, cache_file_path),
+    transpiling only on cache miss. The path is None when the cache is disabled.
+    """
+    with open(filename, "r", encoding="utf-8") as f:
+        source_text = f.read()
+
+    digest = source_digest(source_text)
+    settings = current_cache()
+    path = cache_path(filename, digest, settings.cache_dir) if settings.enabled else None
+
+    if path is not None and os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read(), program_name(digest), path
+
+    raw_program = parse_source(filename, source_text)
+    python_source = PythonTranspiler(tag=f"j{digest}").transpile(raw_program, source_name=filename)
+    if path is not None:
+        _write_cache(path, cache_stem(filename, settings.cache_dir), python_source)
+    return python_source, program_name(digest), path
+
+
+def emit_python(filename: str, output_path: str) -> None:
+    python_source, _, _ = load_transpiled(filename)
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write(python_source)
+
+
+def run_file(filename: str) -> None:
+    """Runs the cached Python module of a script (CPython's own .pyc cache applies too)."""
+    from jsonscript.aot.runtime import run_main
+
+    python_source, name, path = load_transpiled(filename)
+
+    if path is not None and os.path.exists(path):
+        spec = importlib.util.spec_from_file_location(f"jss_{os.path.basename(path)[:-3].replace('.', '_')}", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        namespace = vars(module)
+    else:
+        namespace = {"__name__": "__jss__"}
+        exec(compile(python_source, filename, "exec"), namespace)
+
+    namespace["__jss_module__"] = filename
+    run_main(namespace[name])
@@ -0,0 +1,233 @@
+"""
+Runtime support imported by the Python modules generated by the AOT transpiler.
+Keeps the interpreter's semantics for the few operations Python does differently.
+"""
+import re
+import time
+from collections.abc import MutableMapping
+from typing import Any, Callable, Dict, List, Optional
+from jsonscript.classes import ScriptInstance, is_instance_dict
+from jsonscript.environment import Environment, UNBOUND
+from jsonscript.evaluator import ExpressionEvaluator
+from jsonscript.handlers.base import CommandFunc
+from jsonscript.instructions import loop_items as iterate # for_each : mêmes règles que l'interpréteur
+from jsonscript.memo import MemoCache
+
+
+_ENVIRONMENT: Optional[Environment] = None
+
+
+def environment() -> Environment:
+    """Environment shared by every generated module (handlers such as the GUI keep a reference to it)."""
+    global _ENVIRONMENT
+    if _ENVIRONMENT is None:
+        _ENVIRONMENT = Environment()
+    return _ENVIRONMENT
+
+
+def identity(value: Any, env: Environment) -> Any:
+    """Evaluator given to handlers: generated code passes already evaluated arguments."""
+    return value
+
+
+def native(command: str) -> CommandFunc:
+    func = ExpressionEvaluator.lookup(command)
+    if func is None:
+        raise ValueError(f"Unknown native command: {command}")
+    return func
+
+
+# Classes générées, par nom de classe JsonScript (méthodes des instances sous forme dict)
+_CLASSES: Dict[str, type] = {}
+
+
+class ScriptObject(ScriptInstance):
+    """
+    Base class of the classes generated from JsonScript 'class' definitions.
+
+    Attributes live in the instance's __dict__; as a ScriptInstance it goes
+    through the same handlers as the interpreter's objects (to_json, format,
+    key paths, dict builtins), and `type` gives "dict" like the other engines.
+    """
+    _class_name = "object"
+    _params: tuple = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _CLASSES[cls._class_name] = cls
+
+    def __init__(self, *args):
+        if len(args) != len(self._params):
+            raise ValueError(f"Constructor for '{self._class_name}' expects {len(self._params)} args.")
+        self.__dict__.update(zip(self._params, args))
+
+    def get_attr(self, name: str) -> Any:
+        return self.__dict__.get(name)
+
+    def set_attr(self, name: str, value: Any) -> None:
+        self.__dict__[name] = value
+
+    def attributes(self) -> Dict[str, Any]:
+        return dict(self.__dict__)
+
+    def class_name(self) -> str:
+        return self._class_name
+
+
+def global_value(namespace: Dict[str, Any], name: str) -> Any:
+    """Global read of a local variable not assigned yet (it shadows a global of the same name)."""
+    try:
+        return namespace[name]
+    except KeyError:
+        raise NameError(f"name {name!r} is not defined", name=name) from None
+
+
+def memoize(name: str, func: Callable, memo_size: Optional[int]) -> Callable:
+    """Wraps a function declared {"memo": true} in its MemoCache, registered for cache_stats."""
+    memo = MemoCache(memo_size)
+    key_of, lookup, store = memo.key, memo.lookup, memo.store
+
+    def memoized(*args):
+        key = key_of(args)
+        if key is not None:
+            found, cached = lookup(key)
+            if found:
+                return cached
+        result = func(*args)
+        if key is not None:
+            store(key, result)
+        return result
+
+    environment().register_native_function(name, memoized, memo)
+    return memoized
+
+
+# --- Opérateurs ---
+def add(val1: Any, val2: Any) -> Any:
+    # Si l'un des deux est une chaîne, on concatène (Style JavaScript)
+    if isinstance(val1, str) or isinstance(val2, str):
+        return str(val1) + str(val2)
+    return val1 + val2
+
+
+def div(numerator: Any, denom: Any) -> Any:
+    if denom == 0:
+        raise ValueError("Division by zero")
+    return numerator / denom
+
+
+# --- Instructions ---
+def push(target_list: Any, value: Any) -> None:
+    if not isinstance(target_list, list):
+        raise ValueError(f"Push error: Target is not a list. Got {type(target_list)}.")
+    target_list.append(value)
+
+
+def put(target_dict: Any, key: Any, value: Any) -> None:
+    if not isinstance(target_dict, MutableMapping):
+        raise ValueError(f"Put error: Target is not a dictionary. Got {type(target_dict)}.")
+    target_dict[key] = value
+
+
+def get_attr(instance: Any, attr_name: str) -> Any:
+    if isinstance(instance, ScriptObject):
+        return instance.__dict__.get(attr_name)
+    if is_instance_dict(instance):
+        return instance["__data__"].get(attr_name)
+    raise ValueError("Target is not a class instance.")
+
+
+def set_attr(instance: Any, attr_name: str, value: Any) -> Any:
+    if isinstance(instance, ScriptObject):
+        instance.__dict__[attr_name] = value
+    elif is_instance_dict(instance):
+        instance["__data__"][attr_name] = value
+    else:
+        raise ValueError("Target is not a class instance.")
+    return value
+
+
+def bind(instance: Any) -> ScriptObject:
+    """
+    Target of a method call. An instance in its dict layout is seen as an object
+    of its generated class whose attributes are its "__data__" dict (shared, not copied).
+    """
+    if isinstance(instance, ScriptObject):
+        return instance
+    if not is_instance_dict(instance):
+        raise ValueError("Target is not a valid object instance.")
+    cls = _CLASSES.get(instance["__class__"])
+    if cls is None:
+        raise ValueError(f"Class '{instance['__class__']}' is not defined.")
+    view = cls.__new__(cls)
+    view.__dict__ = instance["__data__"]
+    return view
+
+
+def input_value(prompt: str) -> Any:
+    user_input = input(prompt)
+    if user_input.isdigit():
+        return int(user_input)
+    try:
+        return float(user_input)
+    except ValueError:
+        return user_input
+
+
+def sleep(seconds: Any) -> None:
+    time.sleep(float(seconds))
+
+
+def import_module(filename: Any, namespace: Dict[str, Any]) -> None:
+    """Runs an imported .jss/.json file in the importer's namespace (shared globals), once."""
+    from jsonscript.aot.cache import load_transpiled
+
+    filename = str(filename)
+    try:
+        # __jss_module__ : fichier en cours d'exécution, base des imports relatifs
+        importer = namespace.get("__jss_module__")
+        path = environment().modules.resolve(filename, importer)
+        imported = namespace.setdefault("__jss_imported__", set())
+        if path in imported:
+            return
+        imported.add(path)
+        source, program_name, _ = load_transpiled(path)
+        exec(compile(source, filename, "exec"), namespace)
+        namespace["__jss_module__"] = path
+        try:
+            namespace[program_name]()
+        finally:
+            namespace["__jss_module__"] = importer
+    except FileNotFoundError:
+        print(f"Import Error: File '{filename}' not found.")
+    except Exception as e:
+        print(f"Import Error in '{filename}': {e}")
+
+
+def error_message(error: Exception) -> str:
+    """Message of an error as the interpreter would report it (names are un-mangled)."""
+    from jsonscript.aot.transpiler import CLASS_PREFIX, FUNC_PREFIX, VAR_PREFIX
+
+    if isinstance(error, UnboundLocalError) and not getattr(error, "name", None):
+        # Variable locale lue avant sa première assignation : le nom n'est que dans le message
+        match = re.search(r"local variable '(\w+)'", str(error))
+        if match:
+            error.name = match.group(1)
+    if isinstance(error, NameError) and getattr(error, "name", None):
+        name = error.name
+        if name.startswith(FUNC_PREFIX):
+            return f"Function '{name[len(FUNC_PREFIX):]}' is not defined."
+        if name.startswith(CLASS_PREFIX):
+            return f"Class '{name[len(CLASS_PREFIX):]}' is not defined."
+        if name.startswith(VAR_PREFIX):
+            return f"Variable '{name[len(VAR_PREFIX):]}' is not defined."
+    return str(error)
+
+
+def run_main(program: Callable[[], None]) -> None:
+    try:
+        program()
+    except Exception as e:
+        print(f"Runtime Error: {error_message(e)}")
+    finally:
+        environment().close_files()
@@ -0,0 +1,483 @@
+import re
+from typing import Any, Dict, List, Optional, Set
+from jsonscript.evaluator import ExpressionEvaluator
+
+
+# Incrémenté à chaque changement du code généré (invalide le cache)
+TRANSPILER_VERSION = 7
+
+# Préfixes des identifiants Python générés (évite les collisions avec les mots-clés / builtins)
+VAR_PREFIX = "v_"
+FUNC_PREFIX = "f_"
+CLASS_PREFIX = "C_"
+METHOD_PREFIX = "m_"
+NATIVE_PREFIX = "_n_"
+
+
+def mangle(prefix: str, name: str) -> str:
+    """Turns a JsonScript name into a valid, prefixed Python identifier."""
+    safe = re.sub(r'[^0-9a-zA-Z_]', lambda m: f"_x{ord(m.group()):X}_", str(name))
+    return prefix + safe
+
+
+class PythonTranspiler:
+    """
+    Ahead-of-time translation of a raw JSON AST into a plain Python module.
+
+    - functions become `def`s, classes become Python classes (runtime.ScriptObject),
+    - while / for_range / for_each / if / switch / try become native Python statements,
+    - native commands are bound once to their handler entry in the dispatch table.
+
+    Scoping follows Python: a function sees its parameters, its own variables
+    and the program's global variables (the interpreter's dynamic lookup into
+    the caller's locals is not reproduced). A local variable named like a global
+    one reads the global until it is first assigned, as in the interpreter.
+
+    A function returning a call to itself (outside loops and try bodies) is
+    wrapped in a `while True` loop: the tail call rebinds the parameters and
+    continues, so self tail recursion is not limited by Python's recursion depth.
+    """
+
+    _INLINE_BINARY = {
+        "-": "-",
+        "*": "*",
+        "%": "%",
+        "==": "==",
+        "!=": "!=",
+        "<": "<",
+        ">": ">",
+        "<=": "<=",
+        ">=": ">=",
+    }
+
+    def __init__(self, tag: str = "main"):
+        # Le tag rend uniques les noms globaux propres au module (programme, constantes)
+        self.tag = re.sub(r'\W', '_', tag)
+        self._lines: List[str] = []
+        self._indent = 0
+        self._constants: List[str] = []
+        self._natives: Set[str] = set()
+        self._switch_count = 0
+        self._in_function = False
+        self._program_vars: Set[str] = set()
+        self._shadowing: Set[str] = set()
+        # Instructions return de la fonction courante compilées en appel terminal (id -> paramètres)
+        self._tail_returns: Dict[int, List[str]] = {}
+
+    # --- Point d'entrée ---
+    def transpile(self, raw_program: List[Any], source_name: str = "<program>") -> str:
+        program_name = f"_program_{self.tag}"
+
+        self._emit(f"def {program_name}():")
+        self._indent += 1
+        program_globals = self._collect_globals(raw_program, top_level=True)
+        self._program_vars = {name for name in program_globals if name.startswith(VAR_PREFIX)}
+        self._emit_globals(program_globals)
+        self._emit_block(raw_program)
+        self._indent -= 1
+
+        header = [
+            f"# Generated by the JsonScript AOT transpiler (v{TRANSPILER_VERSION}) from {source_name!r}.",
+            "# Do not edit: re-generated whenever the source changes.",
+            "from jsonscript.aot import runtime as _rt",
+            "",
+            "_env = _rt.environment()",
+            "_UNBOUND = _rt.UNBOUND",
+        ]
+        for command in sorted(self._natives):
+            header.append(f"{mangle(NATIVE_PREFIX, command)} = _rt.native({command!r})")
+        header.extend(self._constants)
+        header.extend(["", ""])
+
+        footer = [
+            "",
+            "",
+            'if __name__ == "__main__":',
+            f"    _rt.run_main({program_name})",
+            "",
+        ]
+        return "\n".join(header + self._lines + footer)
+
+    # --- Helpers ---
+    def _emit(self, line: str) -> None:
+        self._lines.append("    " * self._indent + line if line else "")
+
+    def _emit_globals(self, names: Set[str]) -> None:
+        if names:
+            self._emit(f"global {', '.join(sorted(names))}")
+
+    def _collect_globals(self, block: List[Any], top_level: bool) -> Set[str]:
+        """
+        Names a Python scope must declare `global`: functions and classes are always
+        global in JsonScript; at top level every assigned variable is global too.
+        Nested function / method bodies are not visited.
+        """
+        names: Set[str] = set()
+        for raw in block:
+            if not isinstance(raw, list) or not raw:
+                continue
+            command = raw[0]
+            if command == "function":
+                names.add(mangle(FUNC_PREFIX, raw[1]))
+            elif command == "class":
+                names.add(mangle(CLASS_PREFIX, raw[1]))
+            elif top_level and command in ("set", "input"):
+                names.add(mangle(VAR_PREFIX, raw[1]))
+            elif top_level and command == "for_range":
+                names.add(mangle(VAR_PREFIX, raw[1]))
+            elif top_level and command == "for_each":
+                names |= {mangle(VAR_PREFIX, name) for name in self._loop_names(raw[1])}
+            elif top_level and command == "try":
+                names.add(mangle(VAR_PREFIX, raw[2]))
+
+            for sub_block in self._sub_blocks(raw):
+                names |= self._collect_globals(sub_block, top_level)
+        return names
+
+    @staticmethod
+    def _sub_blocks(raw: List[Any]) -> List[List[Any]]:
+        command = raw[0]
+        if command == "while":
+            return [raw[2]]
+        if command == "for_range":
+            return [raw[5]]
+        if command == "for_each":
+            return [raw[3]]
+        if command == "if":
+            return [raw[2]] + ([raw[3]] if len(raw) > 3 else [])
+        if command == "try":
+            return [raw[1], raw[3]]
+        if command == "switch":
+            return [case[1] for case in raw[2]] + ([raw[3]] if len(raw) > 3 else [])
+        return []
+
+    @staticmethod
+    def _loop_names(names: Any) -> List[str]:
+        """Variables of a for_each: "item" or ["key", "value"]."""
+        return names if isinstance(names, list) else [names]
+
+    def _constant(self, value: Any) -> str:
+        """Mutable literals are hoisted: the interpreter reuses the same object on every evaluation."""
+        name = f"_K_{self.tag}_{len(self._constants)}"
+        self._constants.append(f"{name} = {value!r}")
+        return name
+
+    # --- Statements ---
+    def _emit_block(self, block: List[Any]) -> None:
+        for raw in block:
+            self._emit_statement(raw)
+        # Un bloc vide (ou ne contenant que des commentaires) doit rester valide en Python
+        if all(raw[0] == "comment" for raw in block):
+            self._emit("pass")
+
+    def _emit_statement(self, raw: List[Any]) -> None:
+        command = raw[0]
+
+        if command == "comment":
+            text = str(raw[1]) if len(raw) > 1 else ""
+            self._emit(f"# {' '.join(text.splitlines())}".rstrip())
+            return
+
+        if command == "set":
+            if len(raw) < 3:
+                raise ValueError("Invalid parameters for 'set'.")
+            self._emit(f"{mangle(VAR_PREFIX, raw[1])} = {self._expr(raw[2])}")
+            return
+
+        if command == "print":
+            parts = " + ".join(f"str({self._expr(arg)})" for arg in raw[1:]) or '""'
+            self._emit(f"print({parts})")
+            return
+
+        if command == "function":
+            if len(raw) < 4:
+                raise ValueError("Invalid function definition.")
+            options = raw[4] if len(raw) > 4 else None
+            if options is not None and not isinstance(options, dict):
+                raise ValueError("Invalid function options: expected an object.")
+            py_name = mangle(FUNC_PREFIX, raw[1])
+            memo = bool(options and options.get("memo"))
+            # Fonction mémoïsée : ses appels récursifs passent par le cache, comme dans l'interpréteur
+            self._emit_function(py_name, [mangle(VAR_PREFIX, p) for p in raw[2]], raw[3],
+                                None if memo else raw[1])
+            if memo:
+                # Fonction remplacée par son enveloppe mémoïsée (les appels récursifs la trouvent aussi)
+                self._emit(f"{py_name} = _rt.memoize({raw[1]!r}, {py_name}, {options.get('memo_size')!r})")
+            else:
+                # Visible des handlers (callbacks GUI...) comme une fonction native
+                self._emit(f"_env.register_native_function({raw[1]!r}, {py_name})")
+            return
+
+        if command == "return":
+            tail_params = self._tail_returns.get(id(raw))
+            if tail_params is not None:
+                # Appel terminal à soi-même : nouveaux arguments, puis tour suivant de la boucle
+                if tail_params:
+                    call_args = ", ".join(self._expr(arg) for arg in raw[1][2:])
+                    self._emit(f"{', '.join(tail_params)} = {call_args}")
+                self._emit("continue")
+            elif self._in_function:
+                self._emit(f"return {self._expr(raw[1])}")
+            else:
+                self._emit(f"{self._expr(raw[1])}")
+                self._emit("print(\"Error: 'return' used outside of a function.\")")
+                self._emit("return")
+            return
+
+        if command == "break":
+            self._emit("break")
+            return
+
+        if command == "continue":
+            self._emit("continue")
+            return
+
+        if command == "while":
+            if len(raw) < 3: raise ValueError("Invalid while loop.")
+            self._emit(f"while {self._expr(raw[1])}:")
+            self._indented_block(raw[2])
+            return
+
+        if command == "for_range":
+            if len(raw) < 6: raise ValueError("Invalid for_range loop.")
+            start, end, step = (self._expr(e) for e in raw[2:5])
+            self._emit(f"for {mangle(VAR_PREFIX, raw[1])} in range(int({start}), int({end}), int({step})):")
+            self._indented_block(raw[5])
+            return
+
+        if command == "for_each":
+            if len(raw) < 4: raise ValueError("Invalid for_each loop.")
+            names = self._loop_names(raw[1])
+            targets = ", ".join(mangle(VAR_PREFIX, name) for name in names)
+            pairs = ", True" if len(names) == 2 else ""
+            self._emit(f"for {targets} in _rt.iterate({self._expr(raw[2])}{pairs}):")
+            self._indented_block(raw[3])
+            return
+
+        if command == "if":
+            if len(raw) < 3:
+                raise ValueError("Invalid 'if' instruction.")
+            self._emit(f"if {self._expr(raw[1])}:")
+            self._indented_block(raw[2])
+            if len(raw) > 3 and raw[3]:
+                self._emit("else:")
+                self._indented_block(raw[3])
+            return
+
+        if command == "push":
+            self._emit(f"_rt.push({self._expr(raw[1])}, {self._expr(raw[2])})")
+            return
+
+        if command == "put":
+            if len(raw) < 4:
+                raise ValueError("Invalid put.")
+            self._emit(f"_rt.put({self._expr(raw[1])}, {self._expr(raw[2])}, {self._expr(raw[3])})")
+            return
+
+        if command == "input":
+            if len(raw) < 3:
+                raise ValueError("Invalid input.")
+            self._emit(f"{mangle(VAR_PREFIX, raw[1])} = _rt.input_value({raw[2]!r})")
+            return
+
+        if command == "import":
+            if len(raw) > 2:
+                raise ValueError("Namespaced imports ('import ... as') are not supported by the python engine.")
+            self._emit(f"_rt.import_module({self._expr(raw[1])}, globals())")
+            return
+
+        if command == "try":
+            if len(raw) < 4:
+                raise ValueError("Invalid try-catch block.")
+            self._emit("try:")
+            self._indented_block(raw[1])
+            self._emit("except Exception as _error:")
+            self._indent += 1
+            self._emit(f"{mangle(VAR_PREFIX, raw[2])} = _rt.error_message(_error)")
+            self._emit_block(raw[3])
+            self._indent -= 1
+            return
+
+        if command == "sleep":
+            if len(raw) < 2:
+                raise ValueError("Invalid sleep instruction.")
+            self._emit(f"_rt.sleep({self._expr(raw[1])})")
+            return
+
+        if command == "class":
+            if len(raw) < 4:
+                raise ValueError("Invalid class instruction")
+            self._emit_class(raw[1], raw[2], raw[3], raw[4] if len(raw) > 4 else None)
+            return
+
+        if command == "throw":
+            self._emit(f"raise RuntimeError(str({self._expr(raw[1])}))")
+            return
+
+        if command == "assert":
+            if len(raw) < 3:
+                raise ValueError("Invalid assert.")
+            self._emit(f"if not {self._expr(raw[1])}:")
+            self._indent += 1
+            self._emit(f"raise AssertionError('Assertion Failed: ' + str({self._expr(raw[2])}))")
+            self._indent -= 1
+            return
+
+        if command == "switch":
+            if len(raw) < 3:
+                raise ValueError("Invalid switch.")
+            self._emit_switch(raw[1], raw[2], raw[3] if len(raw) > 3 else [])
+            return
+
+        if isinstance(command, str):
+            self._emit(self._expr(raw))
+            return
+
+        raise ValueError(f"Unknown command: {command}")
+
+    def _indented_block(self, block: List[Any]) -> None:
+        self._indent += 1
+        self._emit_block(block)
+        self._indent -= 1
+
+    def _emit_function(self, py_name: str, py_params: List[str], body: List[Any], name: Optional[str] = None) -> None:
+        """`name`: JsonScript name of a plain function, whose self tail calls become a loop."""
+        was_in_function, was_shadowing, was_tail_returns = self._in_function, self._shadowing, self._tail_returns
+        self._in_function = True
+        # Variables locales homonymes d'une globale : lues dans les globales tant qu'elles ne sont
+        # pas assignées (`var total = total + n`), comme le repli UNBOUND de l'interpréteur
+        assigned = self._collect_globals(body, top_level=True)
+        self._shadowing = (assigned & self._program_vars) - set(py_params)
+        self._tail_returns = {}
+        if name is not None:
+            self._tail_returns = {id(raw): py_params for raw in self._self_tail_calls(body, name, len(py_params))}
+
+        self._emit(f"def {py_name}({', '.join(py_params)}):")
+        self._indent += 1
+        self._emit_globals(self._collect_globals(body, top_level=False))
+        if self._tail_returns:
+            self._emit("while True:")
+            self._indent += 1
+        for shadowed in sorted(self._shadowing):
+            self._emit(f"{shadowed} = _UNBOUND")
+        self._emit_block(body)
+        if self._tail_returns:
+            if not (body and isinstance(body[-1], list) and body[-1][:1] == ["return"]):
+                # Fin du corps sans return : la fonction renvoie None au lieu de reboucler
+                self._emit("return None")
+            self._indent -= 1
+        self._indent -= 1
+
+        self._in_function, self._shadowing, self._tail_returns = was_in_function, was_shadowing, was_tail_returns
+
+    def _self_tail_calls(self, block: List[Any], name: str, argc: int) -> List[List[Any]]:
+        """`return name(...)` statements of a body, outside loops (a `continue` would hit them) and try bodies."""
+        found = []
+        for raw in block:
+            if not isinstance(raw, list) or not raw:
+                continue
+            command = raw[0]
+            if command == "return":
+                value = raw[1] if len(raw) > 1 else None
+                if (isinstance(value, list) and len(value) == argc + 2
+                        and value[0] == "call" and value[1] == name and self._is_command(value)):
+                    found.append(raw)
+            elif command not in ("while", "for_range", "for_each", "try"):
+                for sub_block in self._sub_blocks(raw):
+                    found.extend(self._self_tail_calls(sub_block, name, argc))
+        return found
+
+    def _emit_class(self, name: str, init_params: List[str], methods: Dict[str, Any], parent: Optional[str]) -> None:
+        base = mangle(CLASS_PREFIX, parent) if parent else "_rt.ScriptObject"
+        self._emit(f"class {mangle(CLASS_PREFIX, name)}({base}):")
+        self._indent += 1
+        self._emit(f"_class_name = {name!r}")
+        self._emit(f"_params = {tuple(init_params)!r}")
+        for method_name, (params, body) in methods.items():
+            self._emit("")
+            py_params = [mangle(VAR_PREFIX, "this")] + [mangle(VAR_PREFIX, p) for p in params]
+            self._emit_function(mangle(METHOD_PREFIX, method_name), py_params, body)
+        self._indent -= 1
+
+    def _emit_switch(self, test_expr: Any, cases: List[List[Any]], default_block: List[Any]) -> None:
+        self._switch_count += 1
+        test_var = f"_switch_{self._switch_count}"
+        self._emit(f"{test_var} = {self._expr(test_expr)}")
+
+        keyword = "if"
+        for case_val_expr, case_body in cases:
+            self._emit(f"{keyword} {test_var} == {self._expr(case_val_expr)}:")
+            self._indented_block(case_body)
+            keyword = "elif"
+
+        if default_block:
+            if cases:
+                self._emit("else:")
+                self._indented_block(default_block)
+            else:
+                self._emit_block(default_block)
+
+    # --- Expressions ---
+    @staticmethod
+    def _is_command(expression: Any) -> bool:
+        if not isinstance(expression, list) or not expression:
+            return False
+        command = expression[0]
+        return isinstance(command, str) and ExpressionEvaluator.lookup(command) is not None
+
+    def _expr(self, expression: Any) -> str:
+        if isinstance(expression, list) and len(expression) >= 2 and expression[0] == "lambda":
+            # Lambda d'un builtin d'ordre supérieur : lambda Python, appelée directement par le handler
+            params = ", ".join(mangle(VAR_PREFIX, param) for param in expression[1:-1])
+            return f"(lambda {params}: {self._expr(expression[-1])})"
+
+        if not self._is_command(expression):
+            if isinstance(expression, (list, dict)):
+                return self._constant(expression)
+            return repr(expression)
+
+        command = expression[0]
+        args = expression[1:]
+
+        if command == "get":
+            if not args: raise ValueError("Invalid 'get' expression.")
+            name = mangle(VAR_PREFIX, args[0])
+            if name in self._shadowing:
+                return f"({name} if {name} is not _UNBOUND else _rt.global_value(globals(), {name!r}))"
+            return name
+
+        if command == "+":
+            return f"_rt.add({self._expr(args[0])}, {self._expr(args[1])})"
+
+        if command == "/":
+            return f"_rt.div({self._expr(args[0])}, {self._expr(args[1])})"
+
+        if command in self._INLINE_BINARY:
+            return f"({self._expr(args[0])} {self._INLINE_BINARY[command]} {self._expr(args[1])})"
+
+        if command == "call":
+            call_args = ", ".join(self._expr(arg) for arg in args[1:])
+            return f"{mangle(FUNC_PREFIX, args[0])}({call_args})"
+
+        if command == "new":
+            call_args = ", ".join(self._expr(arg) for arg in args[1:])
+            return f"{mangle(CLASS_PREFIX, args[0])}({call_args})"
+
+        if command == "call_method":
+            call_args = ", ".join(self._expr(arg) for arg in args[2:])
+            target = self._expr(args[0])
+            if args[0] != ["get", "this"]:
+                # Instance éventuellement sous sa forme dict {"__class__", "__data__"}
+                target = f"_rt.bind({target})"
+            return f"{target}.{mangle(METHOD_PREFIX, args[1])}({call_args})"
+
+        if command == "get_attr":
+            return f"_rt.get_attr({self._expr(args[0])}, {args[1]!r})"
+
+        if command == "set_attr":
+            return f"_rt.set_attr({self._expr(args[0])}, {args[1]!r}, {self._expr(args[2])})"
+
+        # Commande native : appel direct de l'entrée de la table de dispatch
+        self._natives.add(command)
+        native_args = ", ".join(self._expr(arg) for arg in args)
+        return f"{mangle(NATIVE_PREFIX, command)}([{native_args}], _env, _rt.identity)"
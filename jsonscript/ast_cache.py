@@ -0,0 +1,140 @@
+"""
+On-disk cache of compiled .jss programs, stored like __pycache__:
+
+    examples/__jsscache__/test_full.<path hash>.<cache tag>.ast
+
+A cache file holds a fixed header (compiler version, source mtime, size and
+content hash) followed by the raw instruction list serialized with marshal.
+When the source's mtime and size match the header the AST is loaded without
+reading the source; otherwise the source is hashed and recompiled only if its
+content really changed.
+"""
+import hashlib
+import marshal
+import os
+import struct
+import sys
+from typing import Any, List, Optional
+from jsonscript.compiler import COMPILER_VERSION, JSSCompiler
+
+
+CACHE_DIR_NAME = "__jsscache__"
+
+# magic, version du compilateur, version marshal, mtime (ns), taille, hash du contenu
+_HEADER = struct.Struct("<4sHHqq16s")
+_MAGIC = b"JSSA"
+
+
+def _content_digest(source: bytes) -> bytes:
+    return hashlib.blake2b(source, digest_size=16).digest()
+
+
+class ASTCache:
+    """
+    Compiled-AST cache for .jss files.
+
+    `cache_dir=None` stores each cache file in a __jsscache__ directory next to
+    its source; otherwise every file goes to `cache_dir`. A disabled cache
+    compiles every time and never touches the disk.
+    """
+
+    def __init__(self, enabled: bool = True, cache_dir: Optional[str] = None):
+        self.enabled = enabled
+        self.cache_dir = cache_dir
+
+    def cache_path(self, filename: str) -> str:
+        source_path = os.path.abspath(filename)
+        directory = self.cache_dir or os.path.join(os.path.dirname(source_path), CACHE_DIR_NAME)
+        stem = os.path.splitext(os.path.basename(source_path))[0]
+        # Le hash du chemin évite les collisions entre sources homonymes dans un cache-dir commun
+        path_digest = hashlib.blake2b(source_path.encode("utf-8"), digest_size=4).hexdigest()
+        return os.path.join(directory, f"{stem}.{path_digest}.{sys.implementation.cache_tag}.ast")
+
+    def load(self, filename: str) -> List[Any]:
+        """Returns the raw instructions of a .jss file, compiling it only on cache miss."""
+        if not self.enabled:
+            with open(filename, "r", encoding="utf-8") as f:
+                return JSSCompiler().compile(f.read())
+
+        stat = os.stat(filename)
+        path = self.cache_path(filename)
+        header, payload = self._read(path)
+
+        if header is not None and header[3] == stat.st_mtime_ns and header[4] == stat.st_size:
+            program = self._unmarshal(payload)
+            if program is not None:
+                return program
+
+        with open(filename, "rb") as f:
+            source = f.read()
+        digest = _content_digest(source)
+
+        if header is not None and header[5] == digest:
+            # Fichier touché mais contenu identique : on rafraîchit seulement l'en-tête
+            program = self._unmarshal(payload)
+            if program is not None:
+                self._write(path, stat, digest, payload)
+                return program
+
+        program = JSSCompiler().compile(source.decode("utf-8"))
+        try:
+            payload = marshal.dumps(program)
+        except ValueError:
+            return program # Valeur non sérialisable par marshal : pas de cache pour ce fichier
+        self._write(path, stat, digest, payload)
+        return program
+
+    # --- Fichiers de cache ---
+    @staticmethod
+    def _read(path: str):
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None, None
+        if len(data) < _HEADER.size:
+            return None, None
+        header = _HEADER.unpack_from(data)
+        if header[0] != _MAGIC or header[1] != COMPILER_VERSION or header[2] != marshal.version:
+            return None, None
+        return header, data[_HEADER.size:]
+
+    @staticmethod
+    def _unmarshal(payload: bytes) -> Optional[List[Any]]:
+        try:
+            program = marshal.loads(payload)
+        except (EOFError, ValueError, TypeError):
+            return None # Fichier tronqué ou corrompu : on recompile
+        return program if isinstance(program, list) else None
+
+    @staticmethod
+    def _write(path: str, stat: os.stat_result, digest: bytes, payload: bytes) -> None:
+        header = _HEADER.pack(_MAGIC, COMPILER_VERSION, marshal.version, stat.st_mtime_ns, stat.st_size, digest)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(temp_path, "wb") as f:
+                f.write(header + payload)
+            # Remplacement atomique : un lecteur concurrent voit l'ancien ou le nouveau fichier
+            os.replace(temp_path, path)
+        except OSError:
+            pass # Dossier en lecture seule : on travaille sans cache
+
+
+# Cache utilisé par main.py, ImportInstruction et la VM (réglé par --no-cache / --cache-dir)
+_default_cache = ASTCache(cache_dir=os.environ.get("JSONSCRIPT_CACHE_DIR") or None)
+
+
+def configure_cache(enabled: bool = True, cache_dir: Optional[str] = None) -> None:
+    global _default_cache
+    _default_cache = ASTCache(enabled, cache_dir or os.environ.get("JSONSCRIPT_CACHE_DIR") or None)
+
+
+def current_cache() -> ASTCache:
+    """The cache configured by main.py (the AOT backend follows the same settings)."""
+    return _default_cache
+
+
+def load_jss(filename: str) -> List[Any]:
+    """Compiled raw instructions of a .jss file, through the configured cache."""
+    return _default_cache.load(filename)
@@ -0,0 +1,80 @@
+import re
+from typing import Any, Optional
+
+# count : le buffer (éventuellement un fichier projeté de plusieurs Go) est parcouru par fenêtres copiées
+_COUNT_WINDOW = 1 << 24
+
+
+class Buffer:
+    """
+    Binary value of JsonScript (file contents, network payloads...).
+
+    Wraps a read-only memoryview over bytes: slicing shares the underlying
+    memory instead of copying it, and hashlib / base64 / urllib consume the
+    view directly.
+    """
+    __slots__ = ("view",)
+
+    def __init__(self, data: Any):
+        view = data if isinstance(data, memoryview) else memoryview(data)
+        # Un bytearray reste modifiable par Python : la valeur JsonScript, elle, est immuable
+        self.view = view.toreadonly()
+
+    def __len__(self) -> int:
+        return len(self.view)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Buffer):
+            return self.view == other.view
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"<buffer {len(self.view)} bytes>"
+
+    def slice(self, start: int, end: Optional[int] = None) -> 'Buffer':
+        """Zero-copy slice (same rules as Python slicing, negative indices included)."""
+        return Buffer(self.view[start:end])
+
+    def decode(self, encoding: str = "utf-8") -> str:
+        return str(self.view, encoding)
+
+    def find(self, needle: bytes, start: int = 0) -> int:
+        """Index of the first occurrence of `needle` from `start`, or -1. Searches the view in place."""
+        if start < 0:
+            start = max(len(self.view) + start, 0)
+        # re accepte tout objet exposant le protocole buffer : pas de copie du contenu
+        match = re.compile(re.escape(needle)).search(self.view, start)
+        return match.start() if match else -1
+
+    def count(self, needle: bytes) -> int:
+        """Number of non-overlapping occurrences of `needle`, like bytes.count."""
+        view = self.view
+        size = len(needle)
+        if size == 0 or len(view) <= _COUNT_WINDOW:
+            return view.tobytes().count(needle)
+        if any(needle[:k] == needle[-k:] for k in range(1, size)):
+            # Motif qui peut se chevaucher ("aa") : recherche occurrence par occurrence
+            return sum(1 for _ in re.finditer(re.escape(needle), view))
+
+        total, position, end = 0, 0, len(view)
+        while position < end:
+            stop = min(position + _COUNT_WINDOW, end)
+            total += view[position:stop].tobytes().count(needle)
+            position = stop
+            if position < end:
+                # Occurrence à cheval sur deux fenêtres (au plus une : le motif ne se chevauche pas)
+                edge = position - size + 1
+                found = view[edge:position + size - 1].tobytes().find(needle)
+                if found != -1:
+                    total += 1
+                    position = edge + found + size
+        return total
+
+
+def as_bytes(value: Any) -> Any:
+    """Bytes-like form of a builtin argument: a buffer's view as is, anything else as UTF-8 text."""
+    if isinstance(value, Buffer):
+        return value.view
+    return str(value).encode("utf-8")
@@ -0,0 +1,204 @@
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator, List, Optional
+
+
+class ScriptInstance:
+    """
+    Base of the runtime classes generated by ScriptClass.
+
+    Constructor params live in fixed __slots__ of the generated subclass
+    (_s0, _s1...); attributes added later with set_attr go to a dict
+    created on first use.
+
+    For the dict builtins (at, len, put, ==) an instance still reads as the
+    former {"__class__": name, "__data__": {...}} dict, "__data__" being a live
+    view of its attributes.
+    """
+    __slots__ = ("_extra",)
+
+    # Renseignés sur chaque sous-classe générée
+    _script_class: 'ScriptClass'
+    _slot_of: Dict[str, str] = {}
+
+    def __init__(self, values: List[Any]):
+        self._extra = None
+        for slot, value in zip(self._script_class.slot_names, values):
+            setattr(self, slot, value)
+
+    def get_attr(self, name: str) -> Any:
+        slot = self._slot_of.get(name)
+        if slot is not None:
+            return getattr(self, slot)
+        extra = self._extra
+        return extra.get(name) if extra else None
+
+    def set_attr(self, name: str, value: Any) -> None:
+        slot = self._slot_of.get(name)
+        if slot is not None:
+            setattr(self, slot, value)
+        elif self._extra is None:
+            self._extra = {name: value}
+        else:
+            self._extra[name] = value
+
+    def attributes(self) -> Dict[str, Any]:
+        """Snapshot of the attributes, constructor params first."""
+        data = {name: getattr(self, slot) for name, slot in self._slot_of.items()}
+        if self._extra:
+            data.update(self._extra)
+        return data
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Former dict layout of instances: used by print and to_json."""
+        return {"__class__": self.class_name(), "__data__": self.attributes()}
+
+    def class_name(self) -> str:
+        return self._script_class.name
+
+    # --- Vue dictionnaire (ancienne représentation des instances) ---
+    def __getitem__(self, key: Any) -> Any:
+        if key == "__class__":
+            return self.class_name()
+        if key == "__data__":
+            return InstanceData(self)
+        raise KeyError(key)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        if key != "__data__" or not isinstance(value, MutableMapping):
+            raise ValueError(f"Cannot set '{key}' on an instance of '{self.class_name()}'.")
+        for name, attr in value.items():
+            self.set_attr(name, attr)
+
+    def __delitem__(self, key: Any) -> None:
+        raise ValueError(f"Cannot delete '{key}' from an instance of '{self.class_name()}'.")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(("__class__", "__data__"))
+
+    def __len__(self) -> int:
+        return 2
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, ScriptInstance):
+            other = other.to_dict()
+        elif not isinstance(other, MutableMapping):
+            return NotImplemented
+        return self.to_dict() == dict(other.items())
+
+    # Égalité par contenu, comme les dicts : une instance n'est pas hashable
+    __hash__ = None
+
+    def keys(self):
+        return self.to_dict().keys()
+
+    def items(self):
+        return {"__class__": self.class_name(), "__data__": InstanceData(self)}.items()
+
+    def values(self):
+        return [self.class_name(), InstanceData(self)]
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        return self[key] if key in ("__class__", "__data__") else default
+
+    def __contains__(self, key: Any) -> bool:
+        return key in ("__class__", "__data__")
+
+    def __repr__(self):
+        return repr(self.to_dict())
+
+
+# Les handlers testent MutableMapping : une instance y passe sans hériter de l'ABC (isinstance rapide)
+MutableMapping.register(ScriptInstance)
+
+
+class InstanceData(MutableMapping):
+    """Live "__data__" view of an instance: reads and writes go to its attributes."""
+    __slots__ = ("_instance",)
+
+    def __init__(self, instance: ScriptInstance):
+        self._instance = instance
+
+    def __getitem__(self, name: str) -> Any:
+        return self._instance.attributes()[name]
+
+    def __setitem__(self, name: str, value: Any) -> None:
+        self._instance.set_attr(name, value)
+
+    def __delitem__(self, name: str) -> None:
+        raise ValueError(f"Cannot delete attribute '{name}'.")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._instance.attributes())
+
+    def __len__(self) -> int:
+        return len(self._instance.attributes())
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, MutableMapping):
+            return NotImplemented
+        return self._instance.attributes() == dict(other.items())
+
+    def __repr__(self):
+        return repr(self._instance.attributes())
+
+
+def is_instance_dict(value: Any) -> bool:
+    """
+    True for an instance in its former dict layout, {"__class__": name, "__data__": {...}},
+    built by hand or read back from JSON: the object builtins still accept it.
+    """
+    return (type(value) is dict and isinstance(value.get("__class__"), str)
+            and isinstance(value.get("__data__"), dict))
+
+
+def instance_class_name(value: Any) -> Optional[str]:
+    """Class name of a script instance (either layout), None for any other value."""
+    if isinstance(value, ScriptInstance):
+        return value._script_class.name
+    if is_instance_dict(value):
+        return value["__class__"]
+    return None
+
+
+class ScriptClass:
+    """
+    Runtime form of a JsonScript class, built by Environment.define_class.
+
+    `method_table` holds the inherited methods flattened with the class's own
+    (the child wins), so a method lookup is a single dict access.
+    `instance_type` is the generated ScriptInstance subclass, named after the class.
+    """
+    __slots__ = ("name", "params", "methods", "parent", "method_table", "slot_names", "instance_type")
+
+    def __init__(self, name: str, params: List[str], methods: Dict[str, Any], parent: Optional['ScriptClass']):
+        self.name = name
+        self.params = params
+        self.methods = methods
+        self.parent = parent.name if parent is not None else None
+        self.method_table: Dict[str, Any] = {}
+        self.link(parent)
+
+        # Un slot par paramètre du constructeur (noms neutres : les params JSON ne sont pas forcément des identifiants)
+        self.slot_names = tuple(f"_s{i}" for i in range(len(params)))
+        self.instance_type = type(name, (ScriptInstance,), {
+            "__slots__": self.slot_names,
+            "_script_class": self,
+            "_slot_of": dict(zip(params, self.slot_names)),
+        })
+
+    def link(self, parent: Optional['ScriptClass']) -> None:
+        """(Re)computes the flattened method table from the parent's one."""
+        self.method_table = {**(parent.method_table if parent is not None else {}), **self.methods}
+
+    def instantiate(self, values: List[Any]) -> ScriptInstance:
+        """Creates an instance (the caller has checked the number of values)."""
+        return self.instance_type(values)
+
+
+def json_default(value: Any) -> Any:
+    """`default` hook for json.dumps: script instances serialize to their dict layout."""
+    if isinstance(value, ScriptInstance):
+        return value.to_dict()
+    if isinstance(value, InstanceData):
+        return dict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
@@ -1,6 +1,55 @@
 import re
 from typing import List, Any, Optional
 
+# Version du format produit par JSSCompiler : à incrémenter à chaque changement de la syntaxe
+# ou de l'AST généré (invalide les ASTs mis en cache dans __jsscache__)
+COMPILER_VERSION = 11
+
+# Commandes natives appelées comme des fonctions (name(...) -> [name, ...]) ; tout autre nom
+# est compilé en ["call", name, ...]
+NATIVE_COMMANDS = frozenset({
+    # Maths
+    "sqrt", "pow", "abs", "round", "floor", "ceil", "random", "randint", "PI", "to_int",
+    # Strings
+    "split", "replace", "upper", "lower", "concat", "parse_json", "to_json",
+    # Advanced Strings
+    "trim", "substring", "contains", "index_of", "starts_with", "ends_with",
+    # Construction de texte
+    "sb_new", "sb_append", "sb_len", "sb_build", "format",
+    # Collection / Core
+    "len", "at", "type", "push", "put", "cache_stats",
+    # Listes en bloc
+    "range", "sum", "min", "max", "sort", "reverse", "slice", "unique", "flatten", "zip",
+    # Ordre supérieur
+    "map", "filter", "reduce", "any", "all", "find", "group_by",
+    # Time
+    "now", "timestamp", "format_date",
+    # Sys / IO
+    "os_name", "cwd", "env", "exec", "args", "read_file", "write_file",
+    "read_lines", "read_chunks", "mmap_open",
+    # Fichiers ouverts
+    "file_open", "file_write", "file_write_line", "file_read_line", "file_flush", "file_close",
+    # Buffers binaires
+    "buf_read_file", "buf_slice", "buf_len", "buf_concat", "buf_to_str", "buf_from_str",
+    "buf_find", "buf_count",
+    # Web
+    "http_get", "http_post",
+    # Filesystem
+    "fs_exists", "fs_list", "fs_remove", "fs_mkdir", "fs_copy",
+    # Crypto
+    "hash_md5", "hash_sha256", "base64_encode", "base64_decode",
+    # Data
+    "read_csv", "write_csv", "csv_open", "csv_writer_open", "csv_write_row", "csv_writer_close",
+    # Colonnes
+    "read_csv_columns", "col_get", "col_sum", "col_mean", "col_min", "col_max", "col_filter",
+    "group_by_sum",
+    # TUI
+    "print_color", "clear_screen", "input_password",
+    # GUI
+    "gui_new", "gui_set", "gui_show", "gui_on", "gui_quit", "gui_title", "gui_size", "gui_get",
+    "gui_grid", "gui_place", "gui_alert", "gui_confirm", "gui_open_file", "gui_save_file"
+})
+
 # --- 1. DEFINITION DES TOKENS ---
 TOKEN_SPEC = [
     ('COMMENT', r'//.*'),
@@ -8,6 +57,7 @@ TOKEN_SPEC = [
     ('NUMBER',  r'\d+'),
     ('KEYWORD', r'\b(var|if|else|while|func|return|print|class|new|extends|import|break|input|switch|case|default|throw|assert|continue|for)\b'),
     ('ID',      r'[a-zA-Z_]\w*'),
+    ('ARROW',   r'=>'),
     ('OP_CMP',  r'(==|!=|<=|>=|<|>)'),
     ('OP_MATH', r'[+\-*/%]'),
     ('ASSIGN',  r'='),
@@ -61,6 +111,11 @@ class Parser:
     def __init__(self, tokens: List[Token]):
         self.tokens = tokens
         self.pos = 0
+        # Fonctions déclarées par le programme (func name) : elles masquent la commande native du même nom
+        self.declared_functions = {
+            tokens[i + 1].value for i in range(len(tokens) - 1)
+            if tokens[i].type == 'KEYWORD' and tokens[i].value == 'func' and tokens[i + 1].type == 'ID'
+        }
 
     def parse(self) -> List[Any]:
         instructions = []
@@ -126,6 +181,9 @@ class Parser:
             if token.value == "continue": return self.parse_continue()
             if token.value == "for": return self.parse_for_range()
         
+        if token.type == 'ID' and token.value == 'memo' and self.is_memo_prefix():
+            return self.parse_memo_func()
+
         if token.type == 'ID':
             next_tok = self.peek(1)
             if next_tok and next_tok.type == 'ASSIGN':
@@ -162,6 +220,11 @@ class Parser:
         self.consume() # import
         # On attend une chaîne de caractères (le nom du fichier)
         path = self.consume('STRING').value
+        # import "lib.jss" as m : "as" n'est pas un mot-clé réservé
+        alias = self.peek(1)
+        if self.peek() and self.peek().type == 'ID' and self.peek().value == 'as' and alias and alias.type == 'ID':
+            self.consume()
+            return ["import", path, self.consume('ID').value]
         return ["import", path]
 
     def parse_if(self):
@@ -194,6 +257,26 @@ class Parser:
         body = self.parse_block()
         return ["function", name, params, body]
 
+    def is_memo_prefix(self) -> bool:
+        # "memo" n'est pas un mot-clé réservé : seulement devant "func" (memo func f / memo(256) func f)
+        def is_func(tok):
+            return tok is not None and tok.type == 'KEYWORD' and tok.value == 'func'
+        if is_func(self.peek(1)):
+            return True
+        return (self.peek(1) is not None and self.peek(1).type == 'LPAREN'
+                and self.peek(2) is not None and self.peek(2).type == 'NUMBER'
+                and self.peek(3) is not None and self.peek(3).type == 'RPAREN'
+                and is_func(self.peek(4)))
+
+    def parse_memo_func(self):
+        self.consume('ID')
+        options = {"memo": True}
+        if self.match('LPAREN'):
+            options["memo_size"] = int(self.consume('NUMBER').value)
+            self.consume('RPAREN')
+        func = self.parse_func()
+        return [*func, options]
+
     def parse_class(self):
         self.consume()
         name = self.consume('ID').value
@@ -298,10 +381,17 @@ class Parser:
     
     def parse_for_range(self):
         # Syntaxe JSS: for (var, start, end, step) { body }
+        #              for (x in xs) { body } / for (k, v in dict) { body } -> for_each
         self.consume('KEYWORD') # for
         self.consume('LPAREN')
         
         var_name = self.consume('ID').value
+        if self.peek() and self.peek().type == 'ID' and self.peek().value == 'in':
+            return self.parse_for_each([var_name])
+        if self.peek(1) and self.peek(2) and self.peek(1).type == 'ID' and self.peek(2).type == 'ID' \
+                and self.peek(2).value == 'in':
+            self.consume('COMMA')
+            return self.parse_for_each([var_name, self.consume('ID').value])
         self.consume('COMMA')
         start = self.parse_expression()
         self.consume('COMMA')
@@ -314,6 +404,13 @@ class Parser:
         
         return ["for_range", var_name, start, end, step, body]
 
+    def parse_for_each(self, var_names: List[str]):
+        self.consume('ID') # in ('in' reste un identifiant valide ailleurs)
+        iterable = self.parse_expression()
+        self.consume('RPAREN')
+        body = self.parse_block()
+        return ["for_each", var_names[0] if len(var_names) == 1 else var_names, iterable, body]
+
     # --- Expressions ---
     def parse_expression(self):
         return self.parse_logic()
@@ -379,6 +476,9 @@ class Parser:
                 self.consume('RBRACE')
             return obj
         
+        if token.type == 'ID' and self.peek(1) and self.peek(1).type == 'ARROW':
+            return self.parse_lambda()
+
         if token.type == 'ID':
             name = self.consume().value
             
@@ -386,36 +486,7 @@ class Parser:
                 args = self.parse_args()
                 self.consume('RPAREN')
                 
-                # LISTE DES COMMANDES NATIVES
-                NATIVE_COMMANDS = [
-                    # Maths
-                    "sqrt", "pow", "abs", "round", "floor", "ceil", "random", "randint", "PI", "to_int",
-                    # Strings
-                    "split", "replace", "upper", "lower", "concat", "parse_json", "to_json",
-                    # Advanced Strings
-                    "trim", "substring", "contains", "index_of", "starts_with", "ends_with",
-                    # Collection / Core
-                    "len", "at", "type", "push", "put",
-                    # Time
-                    "now", "timestamp", "format_date",
-                    # Sys / IO
-                    "os_name", "cwd", "env", "exec", "args", "read_file", "write_file",
-                    # Web
-                    "http_get", "http_post",
-                    # Filesystem
-                    "fs_exists", "fs_list", "fs_remove", "fs_mkdir", "fs_copy",
-                    # Crypto
-                    "hash_md5", "hash_sha256", "base64_encode", "base64_decode",
-                    # Data
-                    "read_csv", "write_csv",
-                    # TUI
-                    "print_color", "clear_screen", "input_password",
-                    # GUI
-                    "gui_new", "gui_set", "gui_show", "gui_on", "gui_quit", "gui_title", "gui_size", "gui_get", 
-                    "gui_grid", "gui_place", "gui_alert", "gui_confirm", "gui_open_file", "gui_save_file"
-                ]
-                
-                if name in NATIVE_COMMANDS:
+                if name in NATIVE_COMMANDS and name not in self.declared_functions:
                     return [name, *args]
                 
                 return ["call", name, *args]
@@ -439,6 +510,9 @@ class Parser:
             self.consume('RPAREN')
             return ["new", class_name, *args]
 
+        if token.type == 'LPAREN' and self.is_lambda_prefix():
+            return self.parse_lambda()
+
         if self.match('LPAREN'):
             expr = self.parse_expression()
             self.consume('RPAREN')
@@ -446,6 +520,31 @@ class Parser:
 
         raise SyntaxError(f"Expression invalide : {token.value} ligne {token.line}")
 
+    def is_lambda_prefix(self) -> bool:
+        """True if the tokens from the current '(' read '(a, b) =>'."""
+        offset = 1
+        expect_id = True
+        while True:
+            token = self.peek(offset)
+            if token is None:
+                return False
+            if token.type == 'RPAREN':
+                following = self.peek(offset + 1)
+                return following is not None and following.type == 'ARROW' and (expect_id is False or offset == 1)
+            if token.type != ('ID' if expect_id else 'COMMA'):
+                return False
+            expect_id = not expect_id
+            offset += 1
+
+    def parse_lambda(self):
+        # x => expr  /  (a, b) => expr  ->  ["lambda", "a", "b", expr]
+        if self.peek().type == 'ID':
+            params = [self.consume('ID').value]
+        else:
+            params = self.parse_params_list()
+        self.consume('ARROW')
+        return ["lambda", *params, self.parse_expression()]
+
     def parse_args(self):
         args = []
         if not self.is_at_end() and self.peek().type != 'RPAREN':
@@ -1,11 +1,46 @@
+import itertools
+import weakref
 from typing import Dict, Any, List, Optional
+from jsonscript.classes import ScriptClass
+from jsonscript.modules import ModuleRegistry
+
+
+# Valeur d'un slot de frame pas encore assigné
+UNBOUND = object()
+
+# Compteur global : deux environnements n'ont jamais la même version de classes
+_class_versions = itertools.count(1)
 
 
 class Environment:
     def __init__(self):
         self._scopes: List[Dict[str, Any]] = [{}] 
+        # Frames à slots des fonctions résolues lexicalement (voir jsonscript/resolver.py)
+        self._frame: Optional[List[Any]] = None
+        self._saved_frames: List[Optional[List[Any]]] = []
+        # Valeur du dernier "return" (l'instruction retourne le statut RETURN)
+        self.return_value: Any = None
+        # Appel terminal en attente : (nom, définition, arguments évalués)
+        self.tail_call: Optional[tuple] = None
         self._functions: Dict[str, Any] = {}
-        self._classes: Dict[str, Any] = {}
+        self._classes: Dict[str, ScriptClass] = {}
+        # Change à chaque define_class : invalide les caches des sites call_method
+        self.class_version: int = 0
+        # Environnements partageant la table des classes (modules importés avec "as")
+        self._class_sharers: List['Environment'] = [self]
+        # Modules du programme (partagé) et chemins déjà exécutés dans cet environnement
+        self.modules = ModuleRegistry()
+        self.imported: set = set()
+        # Fichier dont le code de premier niveau s'exécute : base des imports relatifs
+        self.current_module: Optional[str] = None
+        # Compilateur d'expressions actif (ExpressionCompiler pour "closure", CallSiteCompiler pour "tree"),
+        # aussi appliqué aux modules importés
+        self.expression_compiler: Optional[Any] = None
+        # Resolver actif en mode lexical (appliqué aussi aux modules importés), None en mode dynamique
+        self.resolver: Optional[Any] = None
+        # Fichiers ouverts (id -> FileHandle, lecteurs...), partagés avec les modules importés. Références
+        # faibles : un itérateur abandonné est ramassé (et son fichier fermé) sans attendre la fin du run
+        self.open_files: 'weakref.WeakValueDictionary[int, Any]' = weakref.WeakValueDictionary()
 
     def enter_scope(self):
         self._scopes.append({})
@@ -16,6 +51,20 @@ class Environment:
         else:
             raise RuntimeError("Cannot exit global scope.")
 
+    def enter_globals(self) -> tuple:
+        """
+        Leaves only the global scope visible (body of a module imported from a
+        function, call of a lexically scoped vm function), returning what
+        exit_globals restores.
+        """
+        saved = (self._scopes, self._frame)
+        self._scopes = self._scopes[:1]
+        self._frame = None
+        return saved
+
+    def exit_globals(self, saved: tuple) -> None:
+        self._scopes, self._frame = saved
+
     def set_variable(self, name: str, value: Any) -> None:
         self._scopes[-1][name] = value
 
@@ -25,20 +74,47 @@ class Environment:
                 return scope[name]
         raise ValueError(f"Variable '{name}' is not defined.")
 
-    def define_function(self, name: str, params: List[str], body: List[Any]) -> None:
+    def push_frame(self, size: int) -> List[Any]:
+        """Opens an array-backed frame for a lexically resolved function call."""
+        self._saved_frames.append(self._frame)
+        self._frame = [UNBOUND] * size
+        return self._frame
+
+    def pop_frame(self) -> None:
+        self._frame = self._saved_frames.pop()
+
+    def get_local(self, slot: int, name: str) -> Any:
+        value = self._frame[slot]
+        if value is UNBOUND:
+            # Local lu avant sa première affectation : on retombe sur la recherche par nom (globales)
+            return self.get_variable(name)
+        return value
+
+    def set_local(self, slot: int, value: Any) -> None:
+        self._frame[slot] = value
+
+    def define_function(self, name: str, params: List[str], body: List[Any], frame_size: Optional[int] = None,
+                        memo: Optional[Any] = None) -> None:
+        # body est la liste d'Instructions déjà compilées (construite une seule fois par la factory)
+        # frame_size : nombre de slots si la fonction a été résolue lexicalement, None en mode dynamique
+        # memo : MemoCache si la fonction est mémoïsée
         self._functions[name] = {
             "type": "script", 
             "params": params, 
-            "body": body
+            "body": body,
+            "frame_size": frame_size,
+            "memo": memo
         }
 
-    def register_native_function(self, name: str, func_callable: Any) -> None:
+    def register_native_function(self, name: str, func_callable: Any, memo: Optional[Any] = None) -> None:
         """
         Registers a pure Python function to be callable from JsonScript.
+        `memo` is the MemoCache of a memoized compiled function (vm, python), read by cache_stats.
         """
         self._functions[name] = {
             "type": "native",
-            "ref": func_callable
+            "ref": func_callable,
+            "memo": memo
         }
 
     def get_function(self, name: str) -> Dict[str, Any]:
@@ -51,14 +127,47 @@ class Environment:
         if parent_name and parent_name not in self._classes:
             raise ValueError(f"Parent class '{parent_name}' does not exist.")
 
-        self._classes[name] = {
-            "params": init_params, # Pour le constructeur
-            "methods": methods,    # Dict de fonctions { "bark": {params, body} }
-            "parent": parent_name
-        }
+        # methods : dict de fonctions { "bark": {params, body compilé} }
+        parent = self._classes[parent_name] if parent_name else None
+        self._classes[name] = ScriptClass(name, init_params, methods, parent)
+        self._relink_subclasses(name, {name})
+        version = next(_class_versions)
+        for env in self._class_sharers:
+            env.class_version = version
+
+    def _relink_subclasses(self, name: str, seen: set) -> None:
+        """A redefined class changes the flattened method tables of its subclasses."""
+        for cls in self._classes.values():
+            if cls.parent == name and cls.name not in seen:
+                seen.add(cls.name)
+                cls.link(self._classes[name])
+                self._relink_subclasses(cls.name, seen)
 
-    def get_class(self, name: str) -> Dict[str, Any]:
+    def get_class(self, name: str) -> ScriptClass:
         cls = self._classes.get(name)
         if cls is None:
             raise ValueError(f"Class '{name}' is not defined.")
         return cls
+
+    def module_environment(self, path: str) -> 'Environment':
+        """
+        Fresh globals for a namespaced module. Classes, native functions, the
+        module registry and the engine settings are shared with this environment.
+        """
+        env = Environment()
+        env._classes = self._classes
+        env._class_sharers = self._class_sharers
+        self._class_sharers.append(env)
+        env.class_version = self.class_version
+        env._functions = {name: func for name, func in self._functions.items() if func.get("type") == "native"}
+        env.modules = self.modules
+        env.current_module = path
+        env.expression_compiler = self.expression_compiler
+        env.resolver = self.resolver
+        env.open_files = self.open_files
+        return env
+
+    def close_files(self) -> None:
+        """Flushes and closes the files the program left open and still reachable (end of a run)."""
+        for handle in list(self.open_files.values()):
+            handle.close()
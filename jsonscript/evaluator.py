@@ -1,66 +1,125 @@
-from typing import Any, List
+import importlib
+import time
+from typing import Any, Dict, List, Optional, Tuple
 from .environment import Environment
 
-# Import des Handlers
-from jsonscript.handlers.base import BaseHandler
-from jsonscript.handlers.core import CoreHandler
-from jsonscript.handlers.math import MathHandler
-from jsonscript.handlers.string import StringHandler
-from jsonscript.handlers.logic import LogicHandler
-from jsonscript.handlers.collection import CollectionHandler
-from jsonscript.handlers.io import IOHandler
-from jsonscript.handlers.sys import SysHandler
-from jsonscript.handlers.time import TimeHandler
-from jsonscript.handlers.http import HttpHandler
-from jsonscript.handlers.object import ObjectHandler
-from jsonscript.handlers.fs import FileSystemHandler
-from jsonscript.handlers.crypto import CryptoEncodingHandler
-from jsonscript.handlers.data import DataHandler
-from jsonscript.handlers.tui import TUIHandler
-from jsonscript.handlers.gui import GUIHandler
+from jsonscript.handlers.base import BaseHandler, CommandFunc
+# Noms des commandes intégrées : source unique partagée avec les handlers et le compilateur .jss
+from jsonscript.handlers.commands import BUILTIN_HANDLERS
+
 
 class ExpressionEvaluator:
-    # Enregistrement des Handlers
-    _handlers: List[BaseHandler] = [
-        CoreHandler(),
-        MathHandler(),
-        StringHandler(),
-        LogicHandler(),
-        CollectionHandler(),
-        IOHandler(),
-        SysHandler(),
-        TimeHandler(),
-        HttpHandler(),
-        ObjectHandler(),
-        FileSystemHandler(),
-        CryptoEncodingHandler(),
-        DataHandler(),
-        TUIHandler(),
-        GUIHandler()
-    ]
+    # Handlers chargés (intégrés déjà importés, puis ceux de register_handler)
+    _handlers: List[BaseHandler] = []
+
+    # Commandes des handlers intégrés pas encore importés : commande -> (module, classe)
+    _lazy_commands: Dict[str, Tuple[str, str]] = {}
+
+    # Durée d'import de chaque handler intégré chargé (main.py --startup-report)
+    load_times: Dict[str, float] = {}
+
+    # Table de dispatch : commande -> fonction liée à son handler (construite une seule fois)
+    _commands: Dict[str, CommandFunc] = {}
+
+    # Fonctions des handlers intégrés : les moteurs qui spécialisent une commande (opérateurs...)
+    # vérifient qu'elle n'a pas été remplacée par register_command / register_handler
+    _builtin_commands: Dict[str, CommandFunc] = {}
+
+    @staticmethod
+    def register_handler(handler: BaseHandler) -> BaseHandler:
+        """
+        Registers a handler and all its commands in the dispatch table.
+        Commands already registered by another handler are overridden.
+        """
+        ExpressionEvaluator._handlers.append(handler)
+        ExpressionEvaluator._commands.update(handler.command_table())
+        return handler
+
+    @staticmethod
+    def register_command(command: str, func: CommandFunc) -> None:
+        """
+        Registers a single command.
+        `func` is called as func(args, env, evaluator) with the raw arguments.
+        """
+        ExpressionEvaluator._commands[command] = func
+
+    @staticmethod
+    def lookup(command: Any) -> Optional[CommandFunc]:
+        """Returns the bound function registered for a command (importing its handler if needed), or None."""
+        try:
+            func = ExpressionEvaluator._commands.get(command)
+            if func is None and command in ExpressionEvaluator._lazy_commands:
+                ExpressionEvaluator._load_handler(*ExpressionEvaluator._lazy_commands[command])
+                func = ExpressionEvaluator._commands.get(command)
+            return func
+        except TypeError:
+            # Commande non hashable (ex: liste de listes de données)
+            return None
+
+    @staticmethod
+    def is_builtin(command: Any) -> bool:
+        """True if `command` still dispatches to the function of its built-in handler."""
+        func = ExpressionEvaluator.lookup(command)
+        return func is not None and func is ExpressionEvaluator._builtin_commands.get(command)
+
+    @staticmethod
+    def _load_handler(module_name: str, class_name: str) -> BaseHandler:
+        """Imports a built-in handler and registers the commands it owns."""
+        start = time.perf_counter()
+        handler = getattr(importlib.import_module(module_name), class_name)()
+        ExpressionEvaluator.load_times[class_name] = time.perf_counter() - start
+
+        lazy_commands = ExpressionEvaluator._lazy_commands
+        for command, func in handler.command_table().items():
+            # Commandes d'un handler prioritaire ou redéfinies par register_* : conservées
+            if lazy_commands.get(command) == (module_name, class_name):
+                del lazy_commands[command]
+                ExpressionEvaluator._builtin_commands[command] = func
+                ExpressionEvaluator._commands.setdefault(command, func)
+        ExpressionEvaluator._handlers.append(handler)
+        return handler
+
+    @staticmethod
+    def load_all_handlers() -> List[BaseHandler]:
+        """Imports every built-in handler not loaded yet (full handler list)."""
+        pending = set(ExpressionEvaluator._lazy_commands.values())
+        for module_name, class_name, _ in BUILTIN_HANDLERS:
+            if (module_name, class_name) in pending:
+                ExpressionEvaluator._load_handler(module_name, class_name)
+        return ExpressionEvaluator._handlers
+
+    @staticmethod
+    def find_handler(command: Any) -> Optional[BaseHandler]:
+        """Returns the handler responsible for a command, or None if no handler supports it."""
+        if ExpressionEvaluator.lookup(command) is None:
+            return None
+        for handler in ExpressionEvaluator._handlers:
+            if handler.can_handle(command):
+                return handler
+        return None
 
     @staticmethod
     def evaluate(expression: Any, environment: Environment) -> Any:
         # 1. Cas de base (Littéral)
         if not isinstance(expression, list):
+            # Expression déjà compilée en closure (moteur "closure")
+            if callable(expression):
+                return expression(environment)
             return expression
         
         if len(expression) == 0:
             return expression
 
-        command = expression[0]
-        arguments = expression[1:]
-
-        # 2. Délégation au bon Handler
-        for handler in ExpressionEvaluator._handlers:
-            if handler.can_handle(command):
-                return handler.handle(
-                    command, 
-                    arguments, 
-                    environment, 
-                    ExpressionEvaluator.evaluate # Callback récursif
-                )
+        # 2. Délégation au bon Handler (lookup O(1) dans la table de dispatch)
+        func = ExpressionEvaluator.lookup(expression[0])
+        if func is not None:
+            return func(expression[1:], environment, ExpressionEvaluator.evaluate) # Callback récursif
 
         # 3. Fallback (ex: une liste de données brutes [1, 2])
         return expression
-    
\ No newline at end of file
+
+
+# Table des commandes paresseuses (le premier handler de la liste garde la commande)
+for _module_name, _class_name, _names in BUILTIN_HANDLERS:
+    for _command in _names:
+        ExpressionEvaluator._lazy_commands.setdefault(_command, (_module_name, _class_name))
@@ -0,0 +1,149 @@
+import operator
+from typing import Any, Callable, Dict, List, Tuple
+from jsonscript.environment import Environment
+from jsonscript.evaluator import ExpressionEvaluator
+from jsonscript.inline_cache import CallMethodSite
+
+
+# Une expression compilée est une closure qui prend l'environnement et retourne la valeur
+CompiledExpression = Callable[[Environment], Any]
+
+
+class ExpressionCompiler:
+    """
+    Alternate expression engine ("closure").
+
+    Turns each raw JSON expression into a tree of Python closures once, choosing
+    the operator at compile time. ["+", ["get", "x"], 1] becomes a single callable
+    taking the environment, instead of being re-inspected by ExpressionEvaluator
+    on every evaluation. A command replaced with register_command or
+    register_handler is not specialised: it goes through its dispatch entry.
+    """
+
+    _COMPARISONS: Dict[str, Callable[[Any, Any], Any]] = {
+        "==": operator.eq,
+        "!=": operator.ne,
+        "<": operator.lt,
+        ">": operator.gt,
+        "<=": operator.le,
+        ">=": operator.ge,
+    }
+
+    _ARITHMETIC: Dict[str, Callable[[Any, Any], Any]] = {
+        "-": operator.sub,
+        "*": operator.mul,
+        "%": operator.mod,
+    }
+
+    def compile(self, expression: Any) -> CompiledExpression:
+        # Déjà compilée : on ne l'enveloppe pas une deuxième fois
+        if callable(expression):
+            return expression
+
+        if not self._is_command(expression):
+            # Littéral (ou liste de données brute) : retourné tel quel, comme le moteur "tree"
+            return lambda env: expression
+
+        command = expression[0]
+        args = expression[1:]
+
+        if not ExpressionEvaluator.is_builtin(command):
+            return self._compile_generic(command, args)
+        if command == "get":
+            return self._compile_get(args)
+        if command == "local":
+            return self._compile_local(args)
+        if command == "call_method" and len(args) >= 2:
+            return CallMethodSite(self.compile(args[0]), args[1], [self.compile(arg) for arg in args[2:]])
+        if command == "format" and args and isinstance(args[0], str):
+            return self._compile_format(args)
+        if command == "+":
+            return self._compile_add(self._operands(command, args))
+        if command == "/":
+            return self._compile_div(self._operands(command, args))
+        if command in self._ARITHMETIC:
+            return self._compile_binary(self._ARITHMETIC[command], self._operands(command, args))
+        if command in self._COMPARISONS:
+            return self._compile_binary(self._COMPARISONS[command], self._operands(command, args))
+
+        return self._compile_generic(command, args)
+
+    # --- Helpers ---
+    @staticmethod
+    def _is_command(expression: Any) -> bool:
+        if not isinstance(expression, list) or not expression:
+            return False
+        command = expression[0]
+        return isinstance(command, str) and ExpressionEvaluator.lookup(command) is not None
+
+    def _compile_arg(self, arg: Any) -> Any:
+        """
+        Compiles a handler argument only if it is an expression.
+        Literals (variable names, attribute names, dicts...) are kept raw because
+        handlers read some of their arguments without evaluating them.
+        """
+        if self._is_command(arg):
+            return self.compile(arg)
+        if isinstance(arg, list) and len(arg) >= 2 and arg[0] == "lambda":
+            # Lambda d'un builtin d'ordre supérieur : seul le corps est compilé
+            return ["lambda", *arg[1:-1], self.compile(arg[-1])]
+        return arg
+
+    def _operands(self, command: str, args: List[Any]) -> Tuple[CompiledExpression, CompiledExpression]:
+        # Opérateur binaire : deux opérandes au moins (les suivants sont ignorés, comme par les handlers)
+        if len(args) < 2:
+            raise ValueError(f"Invalid '{command}' expression: expects 2 operands, got {len(args)}.")
+        return self.compile(args[0]), self.compile(args[1])
+
+    # --- Specialised operators ---
+    def _compile_get(self, args: List[Any]) -> CompiledExpression:
+        if not args: raise ValueError("Invalid 'get' expression.")
+        name = args[0]
+        return lambda env: env.get_variable(name)
+
+    def _compile_local(self, args: List[Any]) -> CompiledExpression:
+        slot, name = args
+        return lambda env: env.get_local(slot, name)
+
+    def _compile_add(self, operands: Tuple[CompiledExpression, CompiledExpression]) -> CompiledExpression:
+        left, right = operands
+
+        def add(env: Environment) -> Any:
+            val1 = left(env)
+            val2 = right(env)
+            # Concaténation style JavaScript (même règle que MathHandler)
+            if isinstance(val1, str) or isinstance(val2, str):
+                return str(val1) + str(val2)
+            return val1 + val2
+
+        return add
+
+    def _compile_div(self, operands: Tuple[CompiledExpression, CompiledExpression]) -> CompiledExpression:
+        left, right = operands
+
+        def div(env: Environment) -> Any:
+            denom = right(env)
+            if denom == 0:
+                raise ValueError("Division by zero")
+            return left(env) / denom
+
+        return div
+
+    def _compile_format(self, args: List[Any]) -> CompiledExpression:
+        # Template littéral : analysé une fois pour ce site d'appel (TextHandler importé au premier format)
+        from jsonscript.handlers.text import parse_template
+        template = parse_template(args[0])
+        compiled_args = [self.compile(arg) for arg in args[1:]]
+        return lambda env: template.render([arg(env) for arg in compiled_args])
+
+    def _compile_binary(self, op: Callable[[Any, Any], Any],
+                        operands: Tuple[CompiledExpression, CompiledExpression]) -> CompiledExpression:
+        left, right = operands
+        return lambda env: op(left(env), right(env))
+
+    # --- Fallback : délégation à la commande résolue une seule fois ---
+    def _compile_generic(self, command: str, args: List[Any]) -> CompiledExpression:
+        func = ExpressionEvaluator.lookup(command)
+        compiled_args = [self._compile_arg(arg) for arg in args]
+        evaluate = ExpressionEvaluator.evaluate
+        return lambda env: func(compiled_args, env, evaluate)
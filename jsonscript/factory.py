@@ -4,6 +4,40 @@ from jsonscript.instructions import *
 
 # Factory class to instantiate the correct object based on the raw JSON list
 class InstructionFactory:
+    @staticmethod
+    def build_block(raw_block: List[Any]) -> List[Instruction]:
+        """Builds every raw instruction of a body once, at load time."""
+        return [InstructionFactory.build(raw) for raw in raw_block]
+
+    @staticmethod
+    def build_function_body(raw_block: List[Any]) -> List[Instruction]:
+        """Builds a function or method body, with its tail calls marked."""
+        body = InstructionFactory.build_block(raw_block)
+        InstructionFactory.mark_tail_calls(body)
+        return body
+
+    @staticmethod
+    def mark_tail_calls(block: List[Instruction]) -> None:
+        """
+        Replaces ["return", ["call", ...]] with a TailCallInstruction wherever the
+        return ends the function. A return inside a 'try' body is left alone: the
+        call must still run under its catch.
+        """
+        for index, instruction in enumerate(block):
+            if isinstance(instruction, ReturnInstruction):
+                value = instruction.value_expression
+                if isinstance(value, list) and len(value) >= 2 and value[0] == "call":
+                    block[index] = TailCallInstruction(value[1], value[2:])
+            elif isinstance(instruction, (IfInstruction, WhileInstruction, ForRangeInstruction, ForEachInstruction)):
+                for field in instruction.block_fields:
+                    InstructionFactory.mark_tail_calls(getattr(instruction, field))
+            elif isinstance(instruction, SwitchInstruction):
+                for case_entry in instruction.cases:
+                    InstructionFactory.mark_tail_calls(case_entry[1])
+                InstructionFactory.mark_tail_calls(instruction.default_block)
+            elif isinstance(instruction, TryCatchInstruction):
+                InstructionFactory.mark_tail_calls(instruction.catch_body)
+
     @staticmethod
     def build(raw_instruction: List[Any]) -> Instruction:
         command_type = raw_instruction[0]
@@ -26,10 +60,18 @@ class InstructionFactory:
             return PrintInstruction(args=raw_instruction[1:])
         
         elif command_type == "function":
-            # Syntax: ["function", "name", ["arg1", "arg2"], [body]]
+            # Syntax: ["function", "name", ["arg1", "arg2"], [body], {options}]
             if len(raw_instruction) < 4:
                 raise ValueError("Invalid function definition.")
-            return FunctionDefInstruction(name=raw_instruction[1], params=raw_instruction[2], body=raw_instruction[3])
+            options = raw_instruction[4] if len(raw_instruction) > 4 else None
+            if options is not None and not isinstance(options, dict):
+                raise ValueError("Invalid function options: expected an object.")
+            return FunctionDefInstruction(
+                name=raw_instruction[1],
+                params=raw_instruction[2],
+                body=InstructionFactory.build_function_body(raw_instruction[3]),
+                options=options
+            )
         
         elif command_type == "return":
             # Syntax: ["return", value]
@@ -51,7 +93,7 @@ class InstructionFactory:
         elif command_type == "while":
             # Syntax: ["while", [condition expression], [ [inst1], [inst2] ]]
             if len(raw_instruction) < 3: raise ValueError("Invalid while loop.")
-            return WhileInstruction(condition=raw_instruction[1], body=raw_instruction[2])
+            return WhileInstruction(condition=raw_instruction[1], body=InstructionFactory.build_block(raw_instruction[2]))
         
         elif command_type == "for_range":
             # Syntax: ["for_range", "var_name", start, end, step, [body]]
@@ -61,7 +103,19 @@ class InstructionFactory:
                 start=raw_instruction[2],
                 end=raw_instruction[3],
                 step=raw_instruction[4],
-                body=raw_instruction[5]
+                body=InstructionFactory.build_block(raw_instruction[5])
+            )
+        
+        elif command_type == "for_each":
+            # Syntax: ["for_each", "var_name", iterable, [body]] ou ["for_each", ["key", "value"], iterable, [body]]
+            if len(raw_instruction) < 4: raise ValueError("Invalid for_each loop.")
+            var_names = raw_instruction[1] if isinstance(raw_instruction[1], list) else [raw_instruction[1]]
+            if not 1 <= len(var_names) <= 2 or not all(isinstance(name, str) for name in var_names):
+                raise ValueError("Invalid for_each variables: expected a name or [key, value].")
+            return ForEachInstruction(
+                var_names=var_names,
+                iterable=raw_instruction[2],
+                body=InstructionFactory.build_block(raw_instruction[3])
             )
         
         elif command_type == "if":
@@ -70,10 +124,10 @@ class InstructionFactory:
                 raise ValueError("Invalid 'if' instruction.")
             
             condition = raw_instruction[1]
-            true_body = raw_instruction[2]
+            true_body = InstructionFactory.build_block(raw_instruction[2])
             
             # Check if there is an 'else' block (4th element)
-            false_body = raw_instruction[3] if len(raw_instruction) > 3 else None
+            false_body = InstructionFactory.build_block(raw_instruction[3]) if len(raw_instruction) > 3 else None
             
             return IfInstruction(condition, true_body, false_body)
         
@@ -94,17 +148,20 @@ class InstructionFactory:
             return InputInstruction(var_name=raw_instruction[1], prompt=raw_instruction[2])
         
         elif command_type == "import":
-            # Syntax: ["import", "lib/math.json"]
-            return ImportInstruction(path_expression=raw_instruction[1])
+            # Syntax: ["import", "lib/math.json"] ou ["import", "lib/math.jss", "alias"]
+            alias = raw_instruction[2] if len(raw_instruction) > 2 else None
+            if alias is not None and not isinstance(alias, str):
+                raise ValueError("Import alias must be a string.")
+            return ImportInstruction(path_expression=raw_instruction[1], alias=alias)
         
         elif command_type == "try":
             # Syntax: ["try", [body], "err_var", [catch_body]]
             if len(raw_instruction) < 4: 
                 raise ValueError("Invalid try-catch block.")
             return TryCatchInstruction(
-                try_body=raw_instruction[1], 
+                try_body=InstructionFactory.build_block(raw_instruction[1]), 
                 error_var_name=raw_instruction[2], 
-                catch_body=raw_instruction[3]
+                catch_body=InstructionFactory.build_block(raw_instruction[3])
             )
         
         elif command_type == "sleep":
@@ -120,7 +177,13 @@ class InstructionFactory:
             
             parent = raw_instruction[4] if len(raw_instruction) > 4 else None
 
-            return ClassDefInstruction(name=raw_instruction[1], init_params=raw_instruction[2], methods=raw_instruction[3], parent_name=parent)
+            # Les corps de méthodes sont compilés une seule fois ici
+            methods = {
+                method_name: [method_data[0], InstructionFactory.build_function_body(method_data[1])]
+                for method_name, method_data in raw_instruction[3].items()
+            }
+
+            return ClassDefInstruction(name=raw_instruction[1], init_params=raw_instruction[2], methods=methods, parent_name=parent)
         
         elif command_type == "call_method":
             # ["call_method", obj, method, args...]
@@ -145,8 +208,9 @@ class InstructionFactory:
             if len(raw_instruction) < 3: 
                 raise ValueError("Invalid switch.")
             
-            default_block = raw_instruction[3] if len(raw_instruction) > 3 else None
-            return SwitchInstruction(raw_instruction[1], raw_instruction[2], default_block)
+            cases = [[case_val, InstructionFactory.build_block(case_body)] for case_val, case_body in raw_instruction[2]]
+            default_block = InstructionFactory.build_block(raw_instruction[3]) if len(raw_instruction) > 3 else None
+            return SwitchInstruction(raw_instruction[1], cases, default_block)
 
         else:
             # Si la commande est une chaîne de caractères (ex: "fs_mkdir", "exec"),
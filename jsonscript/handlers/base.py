@@ -1,31 +1,53 @@
-from abc import ABC, abstractmethod
-from typing import List, Any, Callable
+from abc import ABC
+from functools import partial
+from typing import List, Any, Callable, Dict, FrozenSet
 from jsonscript.environment import Environment
 
 
 # Type alias for the evaluator function to avoid circular imports in type hinting
 EvaluatorFunc = Callable[[Any, Any], Any]
 
+# Entry of the dispatch table: callable(args, env, evaluator) bound to its handler
+CommandFunc = Callable[[List[Any], Environment, EvaluatorFunc], Any]
+
 
 class BaseHandler(ABC):
     """
     Abstract base class for all expression handlers.
     """
-    
-    @abstractmethod
+
+    # Commands supported by this handler (registered once in the dispatch table)
+    commands: FrozenSet[str] = frozenset()
+
+    def __init__(self):
+        # Table construite une seule fois : handle() y cherche la commande à chaque appel direct
+        self._operations = self.command_table()
+
     def can_handle(self, command: str) -> bool:
         """Returns True if this handler supports the given command."""
-        pass
+        return command in self.commands
+
+    def command_table(self) -> Dict[str, CommandFunc]:
+        """
+        Returns the entries this handler contributes to the dispatch table.
+
+        By default every command is bound to `handle`. Handlers with one method
+        per operator override this to skip the if-chain over `command`; the
+        default `handle` then dispatches through the same table.
+        """
+        return {command: partial(self.handle, command) for command in self.commands}
 
-    @abstractmethod
     def handle(self, command: str, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
         """
-        Executes the logic.
+        Executes the logic. Handlers without their own `command_table` override this.
         
         :param command: The operator/function name (e.g., "+", "split").
         :param args: The list of raw arguments (e.g., [["get", "x"], 5]).
         :param env: The current Environment.
         :param evaluator: A callback to the main ExpressionEvaluator.evaluate method.
         """
-        pass
-    
\ No newline at end of file
+        operation = self._operations.get(command)
+        if operation is None:
+            raise ValueError(f"{type(self).__name__} cannot handle: {command}")
+        return operation(args, env, evaluator)
+    
@@ -0,0 +1,82 @@
+from typing import Any, Dict, List
+from jsonscript.buffers import Buffer, as_bytes
+from jsonscript.environment import Environment
+from jsonscript.handlers.base import BaseHandler, CommandFunc, EvaluatorFunc
+from jsonscript.handlers.collection import _as_int
+from jsonscript.handlers.commands import BUFFER_COMMANDS
+
+
+def _as_buffer(value: Any, command: str) -> Buffer:
+    if not isinstance(value, Buffer):
+        raise ValueError(f"'{command}' expects a buffer, got {type(value).__name__}.")
+    return value
+
+
+class BufferHandler(BaseHandler):
+    """
+    Handles binary buffers: reading files as bytes, zero-copy slicing,
+    search and conversions from / to text.
+    """
+
+    commands = BUFFER_COMMANDS
+
+    def command_table(self) -> Dict[str, CommandFunc]:
+        return {
+            "buf_read_file": self.read_file,
+            "buf_slice": self.slice,
+            "buf_len": self.length,
+            "buf_concat": self.concat,
+            "buf_to_str": self.to_str,
+            "buf_from_str": self.from_str,
+            "buf_find": self.find,
+            "buf_count": self.count
+        }
+
+    def read_file(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        # ["buf_read_file", "path"] : contenu brut, sans décodage
+        path = str(evaluator(args[0], env))
+        with open(path, "rb") as f:
+            return Buffer(f.read())
+
+    def slice(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        # ["buf_slice", buf, start] / ["buf_slice", buf, start, end] : vue sur la même mémoire
+        buffer = _as_buffer(evaluator(args[0], env), "buf_slice")
+        start = _as_int(evaluator(args[1], env), "buf_slice")
+        end = _as_int(evaluator(args[2], env), "buf_slice") if len(args) > 2 else None
+        return buffer.slice(start, end)
+
+    def length(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        return len(_as_buffer(evaluator(args[0], env), "buf_len"))
+
+    def concat(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        # ["buf_concat", a, b, ...] : une seule copie, les textes sont encodés en UTF-8
+        return Buffer(b"".join(as_bytes(evaluator(arg, env)) for arg in args))
+
+    def to_str(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        # ["buf_to_str", buf] / ["buf_to_str", buf, "latin-1"]
+        buffer = _as_buffer(evaluator(args[0], env), "buf_to_str")
+        encoding = str(evaluator(args[1], env)) if len(args) > 1 else "utf-8"
+        try:
+            return buffer.decode(encoding)
+        except (LookupError, UnicodeDecodeError) as e:
+            raise ValueError(f"Cannot decode buffer: {e}")
+
+    def from_str(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        text = str(evaluator(args[0], env))
+        encoding = str(evaluator(args[1], env)) if len(args) > 1 else "utf-8"
+        try:
+            return Buffer(text.encode(encoding))
+        except (LookupError, UnicodeEncodeError) as e:
+            raise ValueError(f"Cannot encode text: {e}")
+
+    def find(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        # ["buf_find", buf, motif] / ["buf_find", buf, motif, start] : index ou -1 (motif texte ou buffer)
+        buffer = _as_buffer(evaluator(args[0], env), "buf_find")
+        needle = bytes(as_bytes(evaluator(args[1], env)))
+        start = _as_int(evaluator(args[2], env), "buf_find") if len(args) > 2 else 0
+        return buffer.find(needle, start)
+
+    def count(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        # ["buf_count", buf, motif] : occurrences sans chevauchement, ["buf_count", buf, "\n"] compte les lignes
+        buffer = _as_buffer(evaluator(args[0], env), "buf_count")
+        return buffer.count(bytes(as_bytes(evaluator(args[1], env))))
@@ -1,43 +1,192 @@
-from typing import List, Any
+from collections.abc import MutableMapping
+from typing import List, Any, Dict
 from jsonscript.environment import Environment
-from jsonscript.handlers.base import BaseHandler, EvaluatorFunc
+from jsonscript.classes import ScriptInstance
+from jsonscript.handlers.base import BaseHandler, CommandFunc, EvaluatorFunc
+from jsonscript.handlers.commands import COLLECTION_COMMANDS
+
+
+def _as_int(value: Any, command: str) -> int:
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or value != int(value):
+        raise ValueError(f"'{command}' expects integer arguments, got {value!r}.")
+    return int(value)
+
+
+def _as_list(value: Any, command: str) -> List[Any]:
+    if not isinstance(value, list):
+        raise ValueError(f"'{command}' expects a list, got {type(value).__name__}.")
+    return value
+
+
+def key_path_getter(path: Any):
+    """
+    Getter for a key path: "age", "address.city", "scores.0" (list index)
+    or a list of keys. Segments go through dicts, lists and instance attributes.
+    """
+    segments = path.split(".") if isinstance(path, str) else list(path)
+
+    def get(item: Any) -> Any:
+        for segment in segments:
+            try:
+                if isinstance(item, dict):
+                    item = item[segment]
+                elif isinstance(item, list):
+                    item = item[int(segment)]
+                elif isinstance(item, ScriptInstance):
+                    item = item.get_attr(segment)
+                else:
+                    raise KeyError(segment)
+            except (KeyError, IndexError, ValueError):
+                raise ValueError(f"Key path '{path}' not found in {item!r}.")
+        return item
+
+    return get
 
 
 class CollectionHandler(BaseHandler):
     """
-    Handles List and Dictionary reading operations.
+    Handles List and Dictionary reading operations, and bulk list builtins
+    running over whole lists in native code (range, sum, sort...).
     """
 
-    def can_handle(self, command: str) -> bool:
-        return command in {
-            "len", 
-            "at"
+    commands = COLLECTION_COMMANDS
+
+    def command_table(self) -> Dict[str, CommandFunc]:
+        return {
+            "len": self.length,
+            "at": self.at,
+            "range": self.range,
+            "sum": self.sum,
+            "min": self.min,
+            "max": self.max,
+            "sort": self.sort,
+            "reverse": self.reverse,
+            "slice": self.slice,
+            "unique": self.unique,
+            "flatten": self.flatten,
+            "zip": self.zip
         }
 
-    def handle(self, command: str, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
-        
+    # --- Lecture ---
+    def length(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
         target = evaluator(args[0], env)
+        if not hasattr(target, '__len__'):
+            raise ValueError("Object has no length.")
+        return len(target)
 
-        if command == "len":
-            if not hasattr(target, '__len__'):
-                raise ValueError("Object has no length.")
-            return len(target)
+    def at(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        # args[0] = target, args[1] = key/index
+        target = evaluator(args[0], env)
+        key_or_index = evaluator(args[1], env)
 
-        if command == "at":
-            # args[0] = target, args[1] = key/index
-            key_or_index = evaluator(args[1], env)
+        try:
+            if isinstance(target, list):
+                return target[int(key_or_index)]
+            elif isinstance(target, dict):
+                return target[key_or_index]
+            elif isinstance(target, str):
+                return target[int(key_or_index)]
+            elif isinstance(target, MutableMapping):
+                # Instance de classe : lue comme son ancien dict {"__class__", "__data__"}
+                return target[key_or_index]
+            else:
+                raise ValueError(f"Cannot use 'at' on type {type(target).__name__}")
+        except (IndexError, KeyError):
+            raise ValueError(f"Key/Index '{key_or_index}' not found in target.")
 
-            try:
-                if isinstance(target, list):
-                    return target[int(key_or_index)]
-                elif isinstance(target, dict):
-                    return target[key_or_index]
-                elif isinstance(target, str):
-                    return target[int(key_or_index)]
+    # --- Listes en bloc ---
+    def range(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        # ["range", end] / ["range", start, end] / ["range", start, end, step]
+        if not 1 <= len(args) <= 3:
+            raise ValueError("'range' expects 1 to 3 arguments.")
+        bounds = [_as_int(evaluator(arg, env), "range") for arg in args]
+        if len(bounds) == 3 and bounds[2] == 0:
+            raise ValueError("'range' step cannot be 0.")
+        return list(range(*bounds))
+
+    def sum(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        values = _as_list(evaluator(args[0], env), "sum")
+        try:
+            return sum(values)
+        except TypeError:
+            raise ValueError("'sum' expects a list of numbers.")
+
+    def _extremum(self, command: str, function, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        # ["max", list] ou ["max", a, b, ...]
+        if len(args) == 1:
+            values = _as_list(evaluator(args[0], env), command)
+        else:
+            values = [evaluator(arg, env) for arg in args]
+        if not values:
+            raise ValueError(f"'{command}' of an empty list.")
+        try:
+            return function(values)
+        except TypeError as e:
+            raise ValueError(f"Cannot compare values in '{command}': {e}")
+
+    def min(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        return self._extremum("min", min, args, env, evaluator)
+
+    def max(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        return self._extremum("max", max, args, env, evaluator)
+
+    def sort(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        # ["sort", list] ou ["sort", list, "key.path"] : renvoie une nouvelle liste triée (tri stable)
+        values = _as_list(evaluator(args[0], env), "sort")
+        key = key_path_getter(evaluator(args[1], env)) if len(args) > 1 else None
+        try:
+            return sorted(values, key=key)
+        except TypeError as e:
+            raise ValueError(f"Cannot sort: {e}")
+
+    def reverse(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        target = evaluator(args[0], env)
+        if not isinstance(target, (list, str)):
+            raise ValueError(f"'reverse' expects a list or a string, got {type(target).__name__}.")
+        return target[::-1]
+
+    def slice(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        # ["slice", list, start] / ["slice", list, start, end] : indices négatifs comptés depuis la fin
+        target = evaluator(args[0], env)
+        if not isinstance(target, (list, str)):
+            raise ValueError(f"'slice' expects a list or a string, got {type(target).__name__}.")
+        start = _as_int(evaluator(args[1], env), "slice")
+        end = _as_int(evaluator(args[2], env), "slice") if len(args) > 2 else None
+        return target[start:end]
+
+    def unique(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        # Ordre de première apparition conservé ; clés (type, valeur) : 1, 1.0 et true restent distincts
+        values = _as_list(evaluator(args[0], env), "unique")
+        try:
+            return [value for _, value in dict.fromkeys((type(value), value) for value in values)]
+        except TypeError:
+            # Éléments non hashables (listes, dicts) : comparaison par égalité
+            result = []
+            seen = []
+            for value in values:
+                key = (type(value), value)
+                if key not in seen:
+                    seen.append(key)
+                    result.append(value)
+            return result
+
+    def flatten(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        # ["flatten", list] aplatit un niveau, ["flatten", list, depth] plusieurs
+        values = list(_as_list(evaluator(args[0], env), "flatten"))
+        depth = _as_int(evaluator(args[1], env), "flatten") if len(args) > 1 else 1
+        for _ in range(depth):
+            if not any(isinstance(value, list) for value in values):
+                break
+            flat = []
+            for value in values:
+                if isinstance(value, list):
+                    flat.extend(value)
                 else:
-                    raise ValueError(f"Cannot use 'at' on type {type(target).__name__}")
-            except (IndexError, KeyError):
-                raise ValueError(f"Key/Index '{key_or_index}' not found in target.")
+                    flat.append(value)
+            values = flat
+        return values
 
-        raise ValueError(f"CollectionHandler cannot handle: {command}")
-    
\ No newline at end of file
+    def zip(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        # ["zip", a, b, ...] -> [[a0, b0], [a1, b1], ...] (longueur de la plus courte)
+        lists = [_as_list(evaluator(arg, env), "zip") for arg in args]
+        return [list(group) for group in zip(*lists)]
@@ -0,0 +1,293 @@
+import csv
+import gc
+import math
+import operator
+import re
+import sys
+from array import array
+from itertools import compress, islice
+from typing import Any, Dict, List, Optional
+from jsonscript.environment import Environment
+from jsonscript.handlers.base import BaseHandler, CommandFunc, EvaluatorFunc
+from jsonscript.handlers.commands import COLUMNS_COMMANDS
+
+
+# Inférence de type, vérifiée par une seule expression régulière sur un bloc de cellules jointes
+# par "\n" : entiers sans zéro de tête ("007" reste du texte) et tenant sur 64 bits, flottants avec
+# partie décimale ou exposant. Une cellule vide dans une colonne numérique devient NaN (valeur manquante).
+_INT_CELLS = re.compile(r"(?:(?:-?(?:0|[1-9]\d{0,17}))?\n)*\Z")
+_FLOAT_CELLS = re.compile(r"(?:(?:-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][-+]?\d+)?)?\n)*\Z")
+_CHUNK_ROWS = 4096
+
+INT, FLOAT, TEXT = "int", "float", "text"
+
+_COMPARISONS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    ">": operator.gt,
+    "<=": operator.le,
+    ">=": operator.ge,
+}
+
+
+def _chunks(reader, positions: List[int]):
+    """Yields (row count, one tuple of cells per selected column) for each block of CSV rows."""
+    width = max(positions) + 1 if positions else 0
+    while True:
+        rows = list(islice(reader, _CHUNK_ROWS))
+        if not rows:
+            return
+        if min(map(len, rows)) < width:
+            rows = [row if len(row) >= width else row + [""] * (width - len(row)) for row in rows]
+        cells = list(zip(*rows))
+        yield len(rows), [cells[position] for position in positions]
+
+
+def _kind_of(cells: tuple, kind: str) -> str:
+    """The narrowest kind (int < float < text) holding both `kind` and every cell of the block."""
+    if kind == TEXT:
+        return TEXT
+    text = "\n".join(cells) + "\n"
+    if text.count("\n") != len(cells):
+        return TEXT # cellule multiligne (entre guillemets) : jamais un nombre
+    if kind == INT and _INT_CELLS.match(text):
+        return FLOAT if "" in cells else INT # NaN pour les cellules vides
+    if _FLOAT_CELLS.match(text):
+        return FLOAT
+    return TEXT
+
+
+class ColumnTable:
+    """
+    Column store loaded by read_csv_columns: one compact array per column,
+    array('q') for integers, array('d') for floats (NaN for empty cells),
+    a list of interned strings otherwise.
+    """
+    __slots__ = ("columns", "kinds", "rows")
+
+    def __init__(self, columns: Dict[str, Any], kinds: Dict[str, str], rows: int):
+        self.columns = columns
+        self.kinds = kinds
+        self.rows = rows
+
+    def column(self, name: Any) -> Any:
+        if name not in self.columns:
+            raise ValueError(f"Column '{name}' not found (columns: {', '.join(self.columns)}).")
+        return self.columns[name]
+
+    def numeric(self, name: Any, command: str) -> Any:
+        """The column's values with missing (NaN) cells left out."""
+        values = self.column(name)
+        kind = self.kinds[name]
+        if kind == TEXT:
+            raise ValueError(f"'{command}' needs a numeric column, '{name}' holds text.")
+        if kind == FLOAT:
+            return [value for value in values if not math.isnan(value)]
+        return values
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def __repr__(self):
+        return f"<column_table {len(self.columns)} columns x {self.rows} rows>"
+
+
+def load_columns(path: str, columns: Optional[List[str]] = None, delimiter: str = ",",
+                 pause_gc: bool = False) -> ColumnTable:
+    """
+    Reads a CSV file into a ColumnTable in one pass over blocks of rows, so the
+    per-cell work (type check, conversion) stays in native code. A column starts
+    as integers and is widened to floats, then to text, as the blocks require.
+
+    `pause_gc` suspends Python's cyclic garbage collector during the load, for
+    the whole process: the loader creates no cycles, but each collection would
+    walk the millions of cells already loaded. Opt-in, since other threads (GUI,
+    HTTP callbacks) may rely on the collector meanwhile.
+    """
+    if not pause_gc:
+        return _load_columns(path, columns, delimiter)
+    collecting = gc.isenabled()
+    gc.disable()
+    try:
+        return _load_columns(path, columns, delimiter)
+    finally:
+        if collecting:
+            gc.enable()
+
+
+def _load_columns(path: str, columns: Optional[List[str]], delimiter: str) -> ColumnTable:
+    with open(path, mode='r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        header = next(reader, [])
+        names = header if columns is None else columns
+        missing = [name for name in names if name not in header]
+        if missing:
+            raise ValueError(f"Column(s) not found in '{path}': {', '.join(map(str, missing))}.")
+        # Une colonne est désignée par son nom : un nom répété (en-tête ou projection) serait ambigu
+        duplicates = sorted({name for name in names if header.count(name) > 1 or names.count(name) > 1})
+        if duplicates:
+            raise ValueError(f"Duplicate column name(s) in '{path}': {', '.join(map(str, duplicates))}.")
+        positions = [header.index(name) for name in names]
+
+        kinds = [INT] * len(names)
+        stores: List[Any] = [array('q') for _ in names]
+        has_value = [False] * len(names)
+        rescan: List[int] = []
+        rows = 0
+        for count, block in _chunks(reader, positions):
+            rows += count
+            for i, cells in enumerate(block):
+                kind = kinds[i]
+                if kind != TEXT and cells.count("") < count:
+                    has_value[i] = True
+                found = _kind_of(cells, kind)
+                if found != kind:
+                    kinds[i] = found
+                    if found == FLOAT:
+                        stores[i] = array('d', stores[i]) # int -> float : conversion exacte
+                    elif stores[i]:
+                        # Colonne numérique qui s'avère textuelle : le texte d'origine des blocs déjà
+                        # convertis ("1.50", "1e3") est relu dans le fichier à la fin
+                        stores[i] = []
+                        rescan.append(i)
+                    else:
+                        stores[i] = []
+                if found == INT:
+                    stores[i].extend(map(int, cells))
+                elif found == FLOAT:
+                    stores[i].extend(map(float, [cell or "nan" for cell in cells] if "" in cells else cells))
+                elif i not in rescan:
+                    # Valeurs catégorielles répétées : une seule chaîne en mémoire par valeur distincte
+                    stores[i].extend(map(sys.intern, cells))
+
+        for i in range(len(names)):
+            if kinds[i] != TEXT and not has_value[i]:
+                kinds[i], stores[i] = TEXT, [""] * rows
+
+        if rescan:
+            f.seek(0)
+            reader = csv.reader(f, delimiter=delimiter)
+            next(reader, None)
+            for _, block in _chunks(reader, [positions[i] for i in rescan]):
+                for i, cells in zip(rescan, block):
+                    stores[i].extend(map(sys.intern, cells))
+
+    return ColumnTable(dict(zip(names, stores)), dict(zip(names, kinds)), rows)
+
+
+def _as_table(value: Any, command: str) -> ColumnTable:
+    if not isinstance(value, ColumnTable):
+        raise ValueError(f"'{command}' expects a column table, got {type(value).__name__}.")
+    return value
+
+
+class ColumnHandler(BaseHandler):
+    """
+    Handles column tables: CSV files loaded column by column into typed
+    arrays, with aggregations running in native code over whole columns.
+    """
+
+    commands = COLUMNS_COMMANDS
+
+    OPTIONS = frozenset({"columns", "delimiter", "pause_gc"})
+
+    def command_table(self) -> Dict[str, CommandFunc]:
+        return {
+            "read_csv_columns": self.read_csv_columns,
+            "col_get": self.col_get,
+            "col_sum": self.col_sum,
+            "col_mean": self.col_mean,
+            "col_min": self.col_min,
+            "col_max": self.col_max,
+            "col_filter": self.col_filter,
+            "group_by_sum": self.group_by_sum
+        }
+
+    def _column_args(self, command: str, args: List[Any], env: Environment, evaluator: EvaluatorFunc):
+        if len(args) < 2:
+            raise ValueError(f"'{command}' expects a column table and a column name.")
+        return _as_table(evaluator(args[0], env), command), evaluator(args[1], env)
+
+    def read_csv_columns(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        # ["read_csv_columns", path] / ["read_csv_columns", path, {"columns": [...], "delimiter": ";", "pause_gc": true}]
+        path = str(evaluator(args[0], env))
+        options = evaluator(args[1], env) if len(args) > 1 else {}
+        if not isinstance(options, dict) or set(options) - self.OPTIONS:
+            raise ValueError("'read_csv_columns' options are an object with 'columns', 'delimiter' and 'pause_gc'.")
+        columns = options.get("columns")
+        if columns is not None and not isinstance(columns, list):
+            raise ValueError("Option 'columns' must be a list of names.")
+        return load_columns(path, columns, str(options.get("delimiter", ",")), bool(options.get("pause_gc", False)))
+
+    def col_get(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        # Colonne en liste JsonScript (cellules vides -> null)
+        table, name = self._column_args("col_get", args, env, evaluator)
+        values = table.column(name)
+        if table.kinds[name] == FLOAT:
+            return [None if math.isnan(value) else value for value in values]
+        return list(values)
+
+    def col_sum(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        table, name = self._column_args("col_sum", args, env, evaluator)
+        values = table.numeric(name, "col_sum")
+        return math.fsum(values) if table.kinds[name] == FLOAT else sum(values)
+
+    def col_mean(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        table, name = self._column_args("col_mean", args, env, evaluator)
+        values = table.numeric(name, "col_mean")
+        if not values:
+            raise ValueError(f"'col_mean' of an empty column '{name}'.")
+        return math.fsum(values) / len(values)
+
+    def _extremum(self, command: str, function, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        table, name = self._column_args(command, args, env, evaluator)
+        values = table.column(name) if table.kinds[name] == TEXT else table.numeric(name, command)
+        if not values:
+            raise ValueError(f"'{command}' of an empty column '{name}'.")
+        return function(values)
+
+    def col_min(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        return self._extremum("col_min", min, args, env, evaluator)
+
+    def col_max(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        return self._extremum("col_max", max, args, env, evaluator)
+
+    def col_filter(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        # ["col_filter", table, "colonne", ">=", valeur] -> nouvelle table avec les lignes retenues
+        if len(args) < 4:
+            raise ValueError("'col_filter' expects a table, a column, an operator and a value.")
+        table, name = self._column_args("col_filter", args, env, evaluator)
+        op = evaluator(args[2], env)
+        compare = _COMPARISONS.get(op)
+        if compare is None:
+            raise ValueError(f"'col_filter' operator must be one of {', '.join(_COMPARISONS)}, got {op!r}.")
+        value = evaluator(args[3], env)
+        try:
+            mask = [compare(cell, value) for cell in table.column(name)]
+        except TypeError:
+            raise ValueError(f"Cannot compare column '{name}' ({table.kinds[name]}) with {value!r}.")
+
+        columns = {}
+        for column_name, values in table.columns.items():
+            kept = compress(values, mask)
+            columns[column_name] = array(values.typecode, kept) if isinstance(values, array) else list(kept)
+        return ColumnTable(columns, dict(table.kinds), sum(mask))
+
+    def group_by_sum(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        # ["group_by_sum", table, "colonne clé", "colonne valeur"] -> {clé: somme}, clés dans l'ordre d'apparition
+        if len(args) < 3:
+            raise ValueError("'group_by_sum' expects a table, a key column and a value column.")
+        table, key_name = self._column_args("group_by_sum", args, env, evaluator)
+        value_name = evaluator(args[2], env)
+        keys = table.column(key_name)
+        values = table.column(value_name)
+        if table.kinds[value_name] == TEXT:
+            raise ValueError(f"'group_by_sum' needs a numeric value column, '{value_name}' holds text.")
+
+        totals: Dict[Any, Any] = {}
+        get = totals.get
+        for key, value in zip(keys, values):
+            if value == value: # NaN (cellule vide) ignoré
+                totals[key] = get(key, 0) + value
+        return totals
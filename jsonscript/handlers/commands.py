@@ -0,0 +1,231 @@
+"""
+Command names of the built-in handlers, kept in one place.
+
+Each handler takes its `commands` from here, the evaluator uses BUILTIN_HANDLERS
+to import a handler on the first use of one of its commands. The .jss compiler
+keeps its own explicit list of the names compiled as native calls. This module
+imports no handler.
+"""
+
+CORE_COMMANDS = frozenset({
+    "get",
+    "local",
+    "type",
+    "call",
+    "cache_stats"
+})
+
+MATH_COMMANDS = frozenset({
+    "+",
+    "-",
+    "*",
+    "/",
+    "%",
+    "random",
+    "randint",
+    "sqrt",
+    "pow",
+    "abs",
+    "round",
+    "floor",
+    "ceil",
+    "PI",
+    "to_int"
+})
+
+STRING_COMMANDS = frozenset({
+    "concat",
+    "split",
+    "replace",
+    "upper",
+    "lower",
+    "parse_json",
+    "to_json",
+    "trim",
+    "substring",
+    "contains",
+    "index_of",
+    "starts_with",
+    "ends_with"
+})
+
+TEXT_COMMANDS = frozenset({
+    "sb_new",
+    "sb_append",
+    "sb_len",
+    "sb_build",
+    "format"
+})
+
+LOGIC_COMMANDS = frozenset({
+    "==",
+    "!=",
+    "<",
+    ">",
+    "<=",
+    ">="
+})
+
+COLLECTION_COMMANDS = frozenset({
+    "len",
+    "at",
+    "range",
+    "sum",
+    "min",
+    "max",
+    "sort",
+    "reverse",
+    "slice",
+    "unique",
+    "flatten",
+    "zip"
+})
+
+FUNCTIONAL_COMMANDS = frozenset({
+    "map",
+    "filter",
+    "reduce",
+    "any",
+    "all",
+    "find",
+    "group_by"
+})
+
+IO_COMMANDS = frozenset({
+    "read_file",
+    "write_file",
+    "read_lines",
+    "read_chunks",
+    "mmap_open"
+})
+
+FILE_COMMANDS = frozenset({
+    "file_open",
+    "file_write",
+    "file_write_line",
+    "file_read_line",
+    "file_flush",
+    "file_close"
+})
+
+BUFFER_COMMANDS = frozenset({
+    "buf_read_file",
+    "buf_slice",
+    "buf_len",
+    "buf_concat",
+    "buf_to_str",
+    "buf_from_str",
+    "buf_find",
+    "buf_count"
+})
+
+SYS_COMMANDS = frozenset({
+    "exec",
+    "os_name",
+    "cwd",
+    "env",
+    "args"
+})
+
+TIME_COMMANDS = frozenset({
+    "now",
+    "timestamp",
+    "format_date"
+})
+
+HTTP_COMMANDS = frozenset({
+    "http_get",
+    "http_post"
+})
+
+OBJECT_COMMANDS = frozenset({
+    "new",
+    "call_method",
+    "get_attr",
+    "set_attr"
+})
+
+FS_COMMANDS = frozenset({
+    "fs_exists",
+    "fs_list",
+    "fs_remove",
+    "fs_mkdir",
+    "fs_copy"
+})
+
+CRYPTO_COMMANDS = frozenset({
+    "hash_md5",
+    "hash_sha256",
+    "base64_encode",
+    "base64_decode"
+})
+
+DATA_COMMANDS = frozenset({
+    "read_csv",
+    "write_csv",
+    "csv_open",
+    "csv_writer_open",
+    "csv_write_row",
+    "csv_writer_close"
+})
+
+COLUMNS_COMMANDS = frozenset({
+    "read_csv_columns",
+    "col_get",
+    "col_sum",
+    "col_mean",
+    "col_min",
+    "col_max",
+    "col_filter",
+    "group_by_sum"
+})
+
+TUI_COMMANDS = frozenset({
+    "print_color",
+    "clear_screen",
+    "input_password"
+})
+
+GUI_COMMANDS = frozenset({
+    "gui_new",
+    "gui_set",
+    "gui_show",
+    "gui_on",
+    "gui_quit",
+    "gui_title",
+    "gui_size",
+    "gui_get",
+    "gui_grid",
+    "gui_place",
+    "gui_alert",
+    "gui_confirm",
+    "gui_open_file",
+    "gui_save_file"
+})
+
+
+# Handlers intégrés, importés au premier usage d'une de leurs commandes : un script qui ne fait
+# qu'afficher ne charge ni tkinter, ni urllib, ni subprocess...
+# (module, classe, commandes). Ordre de priorité : en cas de doublon, le premier handler garde la commande.
+BUILTIN_HANDLERS = [
+    ("jsonscript.handlers.core", "CoreHandler", CORE_COMMANDS),
+    ("jsonscript.handlers.math", "MathHandler", MATH_COMMANDS),
+    ("jsonscript.handlers.string", "StringHandler", STRING_COMMANDS),
+    ("jsonscript.handlers.text", "TextHandler", TEXT_COMMANDS),
+    ("jsonscript.handlers.logic", "LogicHandler", LOGIC_COMMANDS),
+    ("jsonscript.handlers.collection", "CollectionHandler", COLLECTION_COMMANDS),
+    ("jsonscript.handlers.functional", "FunctionalHandler", FUNCTIONAL_COMMANDS),
+    ("jsonscript.handlers.io", "IOHandler", IO_COMMANDS),
+    ("jsonscript.handlers.file", "FileHandler", FILE_COMMANDS),
+    ("jsonscript.handlers.buffer", "BufferHandler", BUFFER_COMMANDS),
+    ("jsonscript.handlers.sys", "SysHandler", SYS_COMMANDS),
+    ("jsonscript.handlers.time", "TimeHandler", TIME_COMMANDS),
+    ("jsonscript.handlers.http", "HttpHandler", HTTP_COMMANDS),
+    ("jsonscript.handlers.object", "ObjectHandler", OBJECT_COMMANDS),
+    ("jsonscript.handlers.fs", "FileSystemHandler", FS_COMMANDS),
+    ("jsonscript.handlers.crypto", "CryptoEncodingHandler", CRYPTO_COMMANDS),
+    ("jsonscript.handlers.data", "DataHandler", DATA_COMMANDS),
+    ("jsonscript.handlers.columns", "ColumnHandler", COLUMNS_COMMANDS),
+    ("jsonscript.handlers.tui", "TUIHandler", TUI_COMMANDS),
+    ("jsonscript.handlers.gui", "GUIHandler", GUI_COMMANDS),
+]
@@ -1,44 +1,53 @@
-from typing import List, Any
+from collections.abc import MutableMapping
+from typing import List, Any, Dict
 from jsonscript.environment import Environment
-from jsonscript.handlers.base import BaseHandler, EvaluatorFunc
-from jsonscript.exceptions import ReturnValue
+from jsonscript.handlers.base import BaseHandler, CommandFunc, EvaluatorFunc
+from jsonscript.signals import RETURN, TAIL_CALL, outside_loop_error
+from jsonscript.handlers.commands import CORE_COMMANDS
 
 
-class CoreHandler(BaseHandler):
+def run_tail_call_in_scope(env: Environment) -> int:
     """
-    Handles variable access, introspection, and function calls.
+    Runs the pending tail call of a dynamically scoped body before its scope
+    closes (the callee may read the caller's variables), as a plain nested call.
     """
+    func_name, func_def, resolved_args = env.tail_call
+    env.tail_call = None
+    env.return_value = call_function(env, func_name, func_def, resolved_args)
+    return RETURN
+
+
+def call_function(env: Environment, func_name: str, func_def: Dict[str, Any], resolved_args: List[Any]) -> Any:
+    """Calls a function with already evaluated arguments (see call_command)."""
+    return call_command([func_name, *resolved_args], env, _evaluated, func_def)
+
+
+def _evaluated(value: Any, env: Environment) -> Any:
+    return value
 
-    def can_handle(self, command: str) -> bool:
-        return command in {
-            "get", 
-            "type", 
-            "call"
-        }
 
-    def handle(self, command: str, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
-        if command == "get":
-            # args[0] is the variable name (string literal)
-            if not args: raise ValueError("Invalid 'get' expression.")
-            return env.get_variable(args[0])
-
-        if command == "type":
-            target = evaluator(args[0], env)
-            return type(target).__name__
-
-        if command == "call":
-            # Local import
-            from jsonscript.factory import InstructionFactory
-
-            func_name = args[0]
-            call_args = args[1:]
-            
-            # 1. Retrieve definition
-            func_def = env.get_function(func_name)
-            
-            # 2. Resolve arguments (Evaluate them first)
-            resolved_args = [evaluator(arg, env) for arg in call_args]
+def call_command(args: List[Any], env: Environment, evaluator: EvaluatorFunc, func_def: Dict[str, Any] = None) -> Any:
+    """
+    ["call", name, args...]: entry of the dispatch table, also behind call_function.
 
+    The body of a script function runs in this frame, so a script call costs a
+    single Python frame. A call in tail position (TailCallInstruction) ends its
+    function with the TAIL_CALL status and the loop below runs the next callee:
+    tail recursion keeps a constant Python stack. A lexically resolved body
+    closes its frame first. Under dynamic scoping the callee may read the
+    caller's variables, so it runs in the finished caller's scope: its
+    parameters and locals overwrite the caller's ones there, and a chain of
+    tail calls keeps a single scope whatever its length.
+    A memoized function returns its cached result when the same arguments come back.
+    """
+    func_name = args[0]
+    if func_def is None:
+        func_def = env.get_function(func_name)
+    resolved_args = [evaluator(arg, env) for arg in args[1:]]
+    # Portée dynamique de la chaîne d'appels terminaux, réutilisée par chaque appelé
+    scope_open = False
+    try:
+        while True:
             # --- CAS 1 : FONCTION NATIVE PYTHON ---
             if func_def.get("type") == "native":
                 python_func = func_def["ref"]
@@ -50,30 +59,108 @@ class CoreHandler(BaseHandler):
 
             # --- CAS 2 : FONCTION JSONSCRIPT (Legacy) ---
             # (Note : On adapte l'ancien code pour gérer le dictionnaire structurel)
-            elif func_def.get("type") == "script" or "params" in func_def: 
+            elif func_def.get("type") == "script" or "params" in func_def:
                 # "params" in func_def c'est pour la rétrocompatibilité si tu as une vieille version de l'env
-                
+
                 param_names = func_def["params"]
-                body = func_def["body"]
+                body = func_def["body"] # Instructions déjà compilées par la factory
 
                 if len(resolved_args) != len(param_names):
                     raise ValueError(f"Function '{func_name}' expects {len(param_names)} args, got {len(resolved_args)}.")
 
-                env.enter_scope()
-                for name, val in zip(param_names, resolved_args):
-                    env.set_variable(name, val)
+                memo = func_def.get("memo")
+                if memo is not None:
+                    memo_key = memo.key(resolved_args)
+                    if memo_key is not None:
+                        found, cached = memo.lookup(memo_key)
+                        if found:
+                            return cached
+
+                frame_size = func_def.get("frame_size")
+                if frame_size is None:
+                    if not scope_open:
+                        env.enter_scope()
+                        scope_open = True
+                    for name, val in zip(param_names, resolved_args):
+                        env.set_variable(name, val)
+                else:
+                    # Les paramètres occupent les premiers slots de la frame
+                    env.push_frame(frame_size)[:len(resolved_args)] = resolved_args
 
-                return_val = None
+                status = None
                 try:
-                    for raw_inst in body:
-                        InstructionFactory.build(raw_inst).execute(env)
-                except ReturnValue as ret:
-                    return_val = ret.value
+                    for instruction in body:
+                        status = instruction.execute(env)
+                        if status is not None:
+                            break
                 finally:
-                    env.exit_scope()
-                
+                    if frame_size is not None:
+                        env.pop_frame()
+
+                if status is None:
+                    return_val = None
+                elif status == RETURN:
+                    return_val = env.return_value
+                    env.return_value = None
+                elif status == TAIL_CALL:
+                    func_name, func_def, resolved_args = env.tail_call
+                    env.tail_call = None
+                    if memo is None:
+                        # Appel terminal : on boucle au lieu d'empiler un appel Python
+                        continue
+                    # Fonction mémoïsée : son résultat est celui de l'appel terminal, qu'il faut attendre
+                    return_val = call_function(env, func_name, func_def, resolved_args)
+                else:
+                    raise outside_loop_error(status)
+
+                if memo is not None and memo_key is not None:
+                    memo.store(memo_key, return_val)
                 return return_val
-            
+
             else:
                 raise ValueError(f"Unknown function type for '{func_name}'")
-    
\ No newline at end of file
+    finally:
+        if scope_open:
+            env.exit_scope()
+
+
+class CoreHandler(BaseHandler):
+    """
+    Handles variable access, introspection, and function calls.
+    """
+
+    commands = CORE_COMMANDS
+
+    def command_table(self) -> Dict[str, CommandFunc]:
+        # Une méthode par commande : get/local (chemin le plus fréquent) ne passent pas par handle()
+        return {
+            "get": self.get_variable,
+            "local": self.get_local,
+            "type": self.type_name,
+            "call": call_command,
+            "cache_stats": self.cache_stats,
+        }
+
+    def get_variable(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        # args[0] is the variable name (string literal)
+        if not args: raise ValueError("Invalid 'get' expression.")
+        return env.get_variable(args[0])
+
+    def get_local(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        # ["local", slot, name] : référence résolue à la compilation (mode lexical)
+        return env.get_local(args[0], args[1])
+
+    def type_name(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        target = evaluator(args[0], env)
+        # Les instances de classe (et leur "__data__") restent des dicts pour les scripts
+        if isinstance(target, MutableMapping):
+            return "dict"
+        return type(target).__name__
+
+    def cache_stats(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        # ["cache_stats", "func_name"] -> {hits, misses, evictions, bypassed, size, max_size}
+        func_name = evaluator(args[0], env)
+        memo = env.get_function(func_name).get("memo")
+        if memo is None:
+            raise ValueError(f"Function '{func_name}' is not memoized.")
+        return memo.stats()
@@ -1,40 +1,36 @@
 import hashlib
 import base64
 from typing import List, Any
+from jsonscript.buffers import Buffer, as_bytes
 from jsonscript.handlers.base import BaseHandler, EvaluatorFunc
+from jsonscript.handlers.commands import CRYPTO_COMMANDS
 
 
 class CryptoEncodingHandler(BaseHandler):
     """
     Handles Cryptography (Hash) and Encoding (Base64).
+    Inputs are text (hashed / encoded as UTF-8) or buffers, read in place.
     """
 
-    def can_handle(self, command: str) -> bool:
-        return command in {
-            "hash_md5", 
-            "hash_sha256", 
-            "base64_encode", 
-            "base64_decode"
-        }
+    commands = CRYPTO_COMMANDS
     
     def handle(self, command: str, args: List[Any], env: Any, evaluator: EvaluatorFunc) -> Any:
         
-        def eval_str(i): return str(evaluator(args[i], env))
+        def eval_bytes(i): return as_bytes(evaluator(args[i], env))
 
         if command == "hash_md5":
-            data = eval_str(0).encode('utf-8')
-            return hashlib.md5(data).hexdigest()
+            return hashlib.md5(eval_bytes(0)).hexdigest()
 
         if command == "hash_sha256":
-            data = eval_str(0).encode('utf-8')
-            return hashlib.sha256(data).hexdigest()
+            return hashlib.sha256(eval_bytes(0)).hexdigest()
 
         if command == "base64_encode":
-            data = eval_str(0).encode('utf-8')
-            return base64.b64encode(data).decode('utf-8')
+            return base64.b64encode(eval_bytes(0)).decode('ascii')
 
         if command == "base64_decode":
-            data = eval_str(0).encode('utf-8')
-            return base64.b64decode(data).decode('utf-8')
+            # Buffer en entrée -> buffer en sortie (données binaires), texte -> texte
+            source = evaluator(args[0], env)
+            data = base64.b64decode(as_bytes(source))
+            return Buffer(data) if isinstance(source, Buffer) else data.decode('utf-8')
 
         raise ValueError(f"CryptoEncodingHandler cannot handle: {command}")
\ No newline at end of file
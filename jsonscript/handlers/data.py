@@ -1,16 +1,165 @@
 import csv
-from typing import List, Any
-from jsonscript.handlers.base import BaseHandler, EvaluatorFunc
+import itertools
+import os
+from typing import Any, Dict, List, MutableMapping, Optional
+from jsonscript.handlers.base import BaseHandler, CommandFunc, EvaluatorFunc
 from jsonscript.environment import Environment
+from jsonscript.handlers.commands import DATA_COMMANDS
+
+
+def _options(value: Any, command: str, allowed: frozenset) -> Dict[str, Any]:
+    if value is None:
+        return {}
+    if not isinstance(value, dict):
+        raise ValueError(f"'{command}' options must be an object.")
+    unknown = set(value) - allowed
+    if unknown:
+        raise ValueError(f"Unknown '{command}' option(s): {', '.join(sorted(unknown))}.")
+    return value
+
+
+def _count(options: Dict[str, Any], name: str) -> Optional[int]:
+    value = options.get(name)
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0 or value != int(value):
+        raise ValueError(f"CSV option '{name}' must be a positive integer, got {value!r}.")
+    return int(value)
+
+
+class CsvRows:
+    """
+    Lazy iterator over the rows of a CSV file (dicts keyed by the header).
+
+    Only the current row is in memory. The file is opened by csv_open (so a
+    missing file or column fails there) and closed when the rows run out, or
+    when the iterator is collected if the loop stops early (break).
+    """
+
+    def __init__(self, path: str, table: MutableMapping[int, Any], columns: Optional[List[str]] = None,
+                 skip: Optional[int] = None, limit: Optional[int] = None, delimiter: str = ","):
+        self.path = path
+        self._file = open(path, mode='r', encoding='utf-8', newline='')
+        try:
+            reader = csv.reader(self._file, delimiter=delimiter)
+            header = next(reader, [])
+            if columns is None:
+                rows = (dict(zip(header, values)) for values in reader)
+            else:
+                # Projection : seules les colonnes demandées sont extraites de chaque ligne
+                missing = [name for name in columns if name not in header]
+                if missing:
+                    raise ValueError(f"Column(s) not found in '{path}': {', '.join(missing)}.")
+                positions = [(name, header.index(name)) for name in columns]
+                rows = ({name: values[i] if i < len(values) else None for name, i in positions}
+                        for values in reader)
+        except Exception:
+            self._file.close()
+            raise
+        stop = None if limit is None else (skip or 0) + limit
+        self._rows = itertools.islice(rows, skip or 0, stop)
+        self._table = table
+        table[id(self)] = self
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> Dict[str, Any]:
+        try:
+            return next(self._rows)
+        except StopIteration:
+            self.close()
+            raise
+        except csv.Error as e:
+            self.close()
+            raise RuntimeError(f"CSV Read Error: {e}")
+
+    def close(self) -> None:
+        self._table.pop(id(self), None)
+        self._file.close()
+
+    def __repr__(self):
+        return f"<csv_rows '{self.path}'>"
+
+
+class CsvWriter:
+    """
+    Streaming CSV output: each row is written through the file buffer as it
+    comes, so memory stays flat whatever the number of rows. A writer left
+    open is flushed and closed when collected, or at the end of the run.
+    """
+
+    def __init__(self, path: str, table: MutableMapping[int, Any], columns: Optional[List[str]] = None,
+                 append: bool = False, delimiter: str = ","):
+        self.path = path
+        # En ajout, l'en-tête n'est écrit que si le fichier est vide (ou nouveau)
+        self._write_header = not (append and os.path.exists(path) and os.path.getsize(path) > 0)
+        self._file = open(path, mode='a' if append else 'w', encoding='utf-8', newline='')
+        self._writer = csv.writer(self._file, delimiter=delimiter)
+        self._table = table
+        table[id(self)] = self
+        self.columns = None
+        if columns is not None:
+            self._set_columns(list(columns))
+
+    def _set_columns(self, columns: List[str]) -> None:
+        self.columns = columns
+        if self._write_header:
+            self._writer.writerow(columns)
+
+    def write_row(self, row: Any) -> None:
+        if self._file.closed:
+            raise ValueError(f"CSV writer for '{self.path}' is closed.")
+        if isinstance(row, dict):
+            if self.columns is None:
+                # Colonnes prises de la première ligne, comme write_csv
+                self._set_columns(list(row.keys()))
+            extra = [key for key in row if key not in self.columns]
+            if extra:
+                raise ValueError(f"Unknown CSV column(s): {', '.join(map(str, extra))}.")
+            self._writer.writerow([row.get(name, "") for name in self.columns])
+        elif isinstance(row, list):
+            if self.columns is not None and len(row) != len(self.columns):
+                raise ValueError(f"CSV row has {len(row)} values, expected {len(self.columns)}.")
+            self._writer.writerow(row)
+        else:
+            raise ValueError(f"CSV row must be an object or a list, got {type(row).__name__}.")
+
+    def close(self) -> None:
+        self._table.pop(id(self), None)
+        self._file.close()
+
+    def __repr__(self):
+        state = "closed" if self._file.closed else "open"
+        return f"<csv_writer '{self.path}' {state}>"
+
+
+def _as_writer(value: Any, command: str) -> CsvWriter:
+    if not isinstance(value, CsvWriter):
+        raise ValueError(f"'{command}' expects a CSV writer, got {type(value).__name__}.")
+    return value
 
 
 class DataHandler(BaseHandler):
-    def can_handle(self, command: str) -> bool:
-        return command in {
-            "read_csv",
-            "write_csv"
-        }
-    
+    """
+    Handles CSV files: whole-file read_csv / write_csv, and streaming
+    readers (csv_open) and writers (csv_writer_*) for files that do not fit
+    in memory.
+    """
+
+    commands = DATA_COMMANDS
+
+    READ_OPTIONS = frozenset({"columns", "skip", "limit", "delimiter"})
+    WRITE_OPTIONS = frozenset({"columns", "append", "delimiter"})
+
+    def command_table(self) -> Dict[str, CommandFunc]:
+        table = super().command_table()
+        table["csv_open"] = self.csv_open
+        table["csv_writer_open"] = self.csv_writer_open
+        table["csv_write_row"] = self.csv_write_row
+        table["csv_writer_close"] = self.csv_writer_close
+        return table
+
     def handle(self, command: str, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
         path = str(evaluator(args[0], env))
 
@@ -26,7 +175,7 @@ class DataHandler(BaseHandler):
             data = evaluator(args[1], env)
             if not isinstance(data, list) or not data:
                 return False
-            
+
             try:
                 with open(path, mode='w', encoding='utf-8', newline='') as f:
                     writer = csv.DictWriter(f, fieldnames=data[0].keys())
@@ -34,4 +183,42 @@ class DataHandler(BaseHandler):
                     writer.writerows(data)
                 return True
             except Exception as e:
-                raise RuntimeError(f"CSV Write Error: {e}")
\ No newline at end of file
+                raise RuntimeError(f"CSV Write Error: {e}")
+
+        raise ValueError(f"DataHandler cannot handle: {command}")
+
+    # --- Flux ---
+    def csv_open(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        # ["csv_open", path] / ["csv_open", path, {"columns": [...], "skip": n, "limit": n, "delimiter": ";"}]
+        path = str(evaluator(args[0], env))
+        options = _options(evaluator(args[1], env) if len(args) > 1 else None, "csv_open", self.READ_OPTIONS)
+        columns = options.get("columns")
+        if columns is not None and not isinstance(columns, list):
+            raise ValueError("CSV option 'columns' must be a list of names.")
+        return CsvRows(path, env.open_files, columns=columns, skip=_count(options, "skip"), limit=_count(options, "limit"),
+                       delimiter=str(options.get("delimiter", ",")))
+
+    def csv_writer_open(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        # ["csv_writer_open", path] / ["csv_writer_open", path, {"columns": [...], "append": true}]
+        path = str(evaluator(args[0], env))
+        options = _options(evaluator(args[1], env) if len(args) > 1 else None, "csv_writer_open", self.WRITE_OPTIONS)
+        columns = options.get("columns")
+        if columns is not None and not isinstance(columns, list):
+            raise ValueError("CSV option 'columns' must be a list of names.")
+        return CsvWriter(path, env.open_files, columns=columns, append=bool(options.get("append", False)),
+                         delimiter=str(options.get("delimiter", ",")))
+
+    def csv_write_row(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        # ["csv_write_row", writer, {ligne}] / ["csv_write_row", writer, [valeurs]] / ["csv_write_row", writer, v1, v2...]
+        writer = _as_writer(evaluator(args[0], env), "csv_write_row")
+        if len(args) > 2:
+            writer.write_row([evaluator(arg, env) for arg in args[1:]])
+        else:
+            row = evaluator(args[1], env)
+            # Une seule valeur simple : ligne d'une colonne, comme v1, v2... avec une valeur
+            writer.write_row(row if isinstance(row, (dict, list)) else [row])
+        return True
+
+    def csv_writer_close(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        _as_writer(evaluator(args[0], env), "csv_writer_close").close()
+        return True
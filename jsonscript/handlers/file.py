@@ -0,0 +1,164 @@
+import io
+from typing import Any, Dict, List, MutableMapping
+from jsonscript.buffers import Buffer, as_bytes
+from jsonscript.environment import Environment
+from jsonscript.handlers.base import BaseHandler, CommandFunc, EvaluatorFunc
+from jsonscript.handlers.commands import FILE_COMMANDS
+
+
+MODES = frozenset({"r", "w", "a", "rb", "wb", "ab"})
+DEFAULT_BUFFER_SIZE = 1 << 16
+
+
+class FileHandle:
+    """
+    File kept open across commands (file_open): writes accumulate in a buffer
+    of `buffer_size` bytes and reach the disk when it fills, on file_flush or
+    on file_close. Registered (weakly) in the environment's open files: a
+    handle the program drops is closed when collected, and whatever it still
+    holds is closed at the end of the run.
+    """
+    __slots__ = ("path", "mode", "binary", "_file", "_table", "__weakref__")
+
+    def __init__(self, path: str, mode: str, table: MutableMapping[int, Any], buffer_size: int = DEFAULT_BUFFER_SIZE,
+                 line_buffered: bool = False):
+        self.path = path
+        self.mode = mode
+        self.binary = "b" in mode
+        if self.binary:
+            self._file = open(path, mode, buffering=buffer_size)
+        else:
+            if line_buffered:
+                # buffering=1 : le texte est écrit à chaque fin de ligne (journal lu en direct)
+                self._file = open(path, mode, buffering=1, encoding="utf-8")
+            else:
+                # write_through : la couche texte transmet chaque écriture au tampon de `buffer_size` octets
+                # au lieu de garder son propre tampon (8 Ko)
+                self._file = io.TextIOWrapper(open(path, mode + "b", buffering=buffer_size), encoding="utf-8",
+                                              write_through=True)
+        self._table = table
+        table[id(self)] = self
+
+    def _check(self, command: str) -> None:
+        if self._file.closed:
+            raise ValueError(f"'{command}': file '{self.path}' is closed.")
+
+    def write(self, value: Any) -> None:
+        self._check("file_write")
+        try:
+            if self.binary:
+                self._file.write(as_bytes(value))
+            elif isinstance(value, Buffer):
+                raise ValueError(f"Cannot write a buffer to '{self.path}' opened in text mode (use \"{self.mode}b\").")
+            else:
+                self._file.write(str(value))
+        except io.UnsupportedOperation:
+            raise ValueError(f"File '{self.path}' is not open for writing (mode \"{self.mode}\").")
+
+    def read_line(self) -> Any:
+        """The next line without its line ending, or None at the end of the file."""
+        self._check("file_read_line")
+        try:
+            line = self._file.readline()
+        except io.UnsupportedOperation:
+            raise ValueError(f"File '{self.path}' is not open for reading (mode \"{self.mode}\").")
+        if not line:
+            return None
+        if self.binary:
+            return Buffer(line[:-1] if line.endswith(b"\n") else line)
+        return line[:-1] if line.endswith("\n") else line
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> Any:
+        # for_each sur un fichier ouvert : les lignes restantes
+        line = self.read_line()
+        if line is None:
+            raise StopIteration
+        return line
+
+    def flush(self) -> None:
+        self._check("file_flush")
+        self._file.flush()
+
+    def close(self) -> None:
+        self._table.pop(id(self), None)
+        self._file.close()
+
+    def __repr__(self):
+        state = "closed" if self._file.closed else "open"
+        return f"<file '{self.path}' \"{self.mode}\" {state}>"
+
+
+def _as_handle(value: Any, command: str) -> FileHandle:
+    if not isinstance(value, FileHandle):
+        raise ValueError(f"'{command}' expects a file handle, got {type(value).__name__}.")
+    return value
+
+
+class FileHandler(BaseHandler):
+    """
+    Handles files kept open by the program: file_open returns a handle used
+    by file_write / file_read_line until file_close (or the end of the run).
+    """
+
+    commands = FILE_COMMANDS
+
+    OPTIONS = frozenset({"buffer_size", "line_buffered"})
+
+    def command_table(self) -> Dict[str, CommandFunc]:
+        return {
+            "file_open": self.file_open,
+            "file_write": self.file_write,
+            "file_write_line": self.file_write_line,
+            "file_read_line": self.file_read_line,
+            "file_flush": self.file_flush,
+            "file_close": self.file_close
+        }
+
+    def file_open(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        # ["file_open", path] / ["file_open", path, "a"] / ["file_open", path, "w", {"buffer_size": 1048576}]
+        path = str(evaluator(args[0], env))
+        mode = evaluator(args[1], env) if len(args) > 1 else "r"
+        if mode not in MODES:
+            raise ValueError(f"'file_open' mode must be one of {', '.join(sorted(MODES))}, got {mode!r}.")
+        options = evaluator(args[2], env) if len(args) > 2 else {}
+        if not isinstance(options, dict) or set(options) - self.OPTIONS:
+            raise ValueError("'file_open' options are an object with 'buffer_size' and 'line_buffered'.")
+
+        buffer_size = options.get("buffer_size", DEFAULT_BUFFER_SIZE)
+        if isinstance(buffer_size, bool) or not isinstance(buffer_size, int) or buffer_size < 2:
+            raise ValueError(f"'file_open' buffer_size must be an integer of at least 2 bytes, got {buffer_size!r}.")
+        line_buffered = bool(options.get("line_buffered", False))
+        if line_buffered and "b" in mode:
+            raise ValueError("'file_open' line_buffered applies to text modes only.")
+        return FileHandle(path, mode, env.open_files, buffer_size, line_buffered)
+
+    def file_write(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        # ["file_write", f, valeur...] : textes (ou buffers en mode binaire) écrits à la suite
+        handle = _as_handle(evaluator(args[0], env), "file_write")
+        for arg in args[1:]:
+            handle.write(evaluator(arg, env))
+        return True
+
+    def file_write_line(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        # ["file_write_line", f, valeur...] : comme file_write, suivi d'un saut de ligne
+        handle = _as_handle(evaluator(args[0], env), "file_write_line")
+        for arg in args[1:]:
+            handle.write(evaluator(arg, env))
+        handle.write("\n") # encodé en b"\n" en mode binaire
+        return True
+
+    def file_read_line(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        # Ligne suivante sans son saut de ligne, null à la fin du fichier
+        return _as_handle(evaluator(args[0], env), "file_read_line").read_line()
+
+    def file_flush(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        _as_handle(evaluator(args[0], env), "file_flush").flush()
+        return True
+
+    def file_close(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        # Fermer deux fois n'est pas une erreur
+        _as_handle(evaluator(args[0], env), "file_close").close()
+        return True
@@ -2,6 +2,7 @@ import os
 import shutil
 from typing import List, Any
 from jsonscript.handlers.base import BaseHandler, EvaluatorFunc
+from jsonscript.handlers.commands import FS_COMMANDS
 
 
 class FileSystemHandler(BaseHandler):
@@ -9,14 +10,7 @@ class FileSystemHandler(BaseHandler):
     Handles Advanced Filesystem operations.
     """
 
-    def can_handle(self, command: str) -> bool:
-        return command in {
-            "fs_exists", 
-            "fs_list", 
-            "fs_remove", 
-            "fs_mkdir", 
-            "fs_copy"
-        }
+    commands = FS_COMMANDS
     
     def handle(self, command: str, args: List[Any], env: Any, evaluator: EvaluatorFunc) -> Any:
         
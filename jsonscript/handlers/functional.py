@@ -0,0 +1,249 @@
+from typing import Any, Callable, Dict, List
+from jsonscript.environment import Environment, UNBOUND
+from jsonscript.evaluator import ExpressionEvaluator
+from jsonscript.handlers.base import BaseHandler, CommandFunc, EvaluatorFunc
+from jsonscript.handlers.core import call_function
+from jsonscript.signals import RETURN, TAIL_CALL, outside_loop_error
+from jsonscript.handlers.commands import FUNCTIONAL_COMMANDS
+
+
+def is_lambda(expression: Any) -> bool:
+    """["lambda", param..., body]: inline function, only valid as argument of a higher-order builtin."""
+    return isinstance(expression, list) and len(expression) >= 2 and expression[0] == "lambda"
+
+
+class Callee:
+    """
+    Function argument of a higher-order builtin, set up once per builtin call.
+
+    Used as a context manager around the loop over the elements: the frame or
+    scope of the callee is opened on entry and reused by every call, which then
+    only rebinds the parameters and runs the body. Accepts a script function
+    name, an inline lambda or a Python callable (natives, AOT-generated code).
+    """
+
+    def __init__(self, command: str, fn_arg: Any, argc: int, env: Environment, evaluator: EvaluatorFunc):
+        self.env = env
+        self.argc = argc
+        self._exit: Callable[[], None] = lambda: None
+
+        if is_lambda(fn_arg):
+            params = fn_arg[1:-1]
+            self._check_argc("Lambda", len(params))
+            self._body = fn_arg[-1]
+            self._params = params
+            # Paramètres résolus en slots (lambda dans une fonction, mode lexical) : frame de la fonction englobante
+            self._enter = self._enter_lambda_slots if params and isinstance(params[0], int) else self._enter_lambda_scope
+            return
+
+        target = evaluator(fn_arg, env)
+        if callable(target):
+            self._func = target
+            self._enter = self._enter_python
+            return
+        if not isinstance(target, str):
+            raise ValueError(f"'{command}' expects a function name or a lambda, got {type(target).__name__}.")
+
+        self.name = target
+        self.func_def = env.get_function(target)
+        if self.func_def.get("type") == "native":
+            self._func = self.func_def["ref"]
+            self._enter = self._enter_python
+            return
+        self._check_argc(f"Function '{target}'", len(self.func_def["params"]))
+        if self.func_def.get("memo") is not None:
+            # Le cache de la fonction mémoïsée doit voir chaque appel : chemin d'appel complet
+            self._enter = self._enter_full_call
+        elif self.func_def.get("frame_size") is None:
+            self._enter = self._enter_script_scope
+        else:
+            self._enter = self._enter_script_frame
+
+    def _check_argc(self, label: str, expected: int) -> None:
+        if expected != self.argc:
+            raise ValueError(f"{label} expects {expected} args, got {self.argc}.")
+
+    def __enter__(self) -> Callable[..., Any]:
+        return self._enter()
+
+    def __exit__(self, *exc_info) -> None:
+        self._exit()
+
+    # --- Lambdas ---
+    def _enter_lambda_slots(self):
+        frame = self.env._frame
+        slots = self._params
+        body = self._body
+        evaluate = ExpressionEvaluator.evaluate
+        env = self.env
+
+        def call(*values):
+            for slot, value in zip(slots, values):
+                frame[slot] = value
+            return evaluate(body, env)
+        return call
+
+    def _enter_lambda_scope(self):
+        env = self.env
+        env.enter_scope()
+        self._exit = env.exit_scope
+        scope = env._scopes[-1]
+        params = self._params
+        body = self._body
+        evaluate = ExpressionEvaluator.evaluate
+
+        def call(*values):
+            for name, value in zip(params, values):
+                scope[name] = value
+            return evaluate(body, env)
+        return call
+
+    # --- Fonctions natives / Python ---
+    def _enter_python(self):
+        return self._func
+
+    # --- Fonctions de script ---
+    def _enter_full_call(self):
+        env, name, func_def = self.env, self.name, self.func_def
+        return lambda *values: call_function(env, name, func_def, list(values))
+
+    def _enter_script_frame(self):
+        env = self.env
+        frame_size = self.func_def["frame_size"]
+        frame = env.push_frame(frame_size)
+        self._exit = env.pop_frame
+        blank = [UNBOUND] * frame_size
+        argc = self.argc
+
+        def bind(values):
+            # Même liste réutilisée : on remet les slots à UNBOUND comme pour une nouvelle frame
+            frame[:] = blank
+            frame[:argc] = values
+        return self._runner(bind)
+
+    def _enter_script_scope(self):
+        env = self.env
+        env.enter_scope()
+        self._exit = env.exit_scope
+        scope = env._scopes[-1]
+        params = self.func_def["params"]
+
+        def bind(values):
+            scope.clear()
+            scope.update(zip(params, values))
+        return self._runner(bind)
+
+    def _runner(self, bind: Callable[[Any], None]):
+        env = self.env
+        body = self.func_def["body"]
+
+        def call(*values):
+            bind(values)
+            status = None
+            for instruction in body:
+                status = instruction.execute(env)
+                if status is not None:
+                    break
+            if status is None:
+                return None
+            if status == RETURN:
+                return_val = env.return_value
+                env.return_value = None
+                return return_val
+            if status == TAIL_CALL:
+                func_name, func_def, resolved_args = env.tail_call
+                env.tail_call = None
+                return call_function(env, func_name, func_def, resolved_args)
+            raise outside_loop_error(status)
+        return call
+
+
+def _iterable(command: str, value: Any) -> Any:
+    if isinstance(value, (str, dict)) or not hasattr(value, "__iter__"):
+        raise ValueError(f"'{command}' expects a list, got {type(value).__name__}.")
+    return value
+
+
+class FunctionalHandler(BaseHandler):
+    """
+    Higher-order list builtins: ["map", fn, list] where fn is a function name
+    or an inline ["lambda", "x", body]. The callee is set up once per builtin
+    call (see Callee) instead of going through a full call per element.
+    """
+
+    commands = FUNCTIONAL_COMMANDS
+
+    def command_table(self) -> Dict[str, CommandFunc]:
+        return {
+            "map": self.map,
+            "filter": self.filter,
+            "reduce": self.reduce,
+            "any": self.any,
+            "all": self.all,
+            "find": self.find,
+            "group_by": self.group_by
+        }
+
+    @staticmethod
+    def _prepare(command: str, args: List[Any], argc: int, env: Environment, evaluator: EvaluatorFunc):
+        if len(args) < 2:
+            raise ValueError(f"'{command}' expects a function and a list.")
+        values = _iterable(command, evaluator(args[1], env))
+        return Callee(command, args[0], argc, env, evaluator), values
+
+    def map(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        callee, values = self._prepare("map", args, 1, env, evaluator)
+        with callee as call:
+            return [call(value) for value in values]
+
+    def filter(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        callee, values = self._prepare("filter", args, 1, env, evaluator)
+        with callee as call:
+            return [value for value in values if call(value)]
+
+    def reduce(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        # ["reduce", fn, list] ou ["reduce", fn, list, initial] ; fn(accumulateur, élément)
+        callee, values = self._prepare("reduce", args, 2, env, evaluator)
+        iterator = iter(values)
+        if len(args) > 2:
+            accumulator = evaluator(args[2], env)
+        else:
+            accumulator = next(iterator, UNBOUND)
+            if accumulator is UNBOUND:
+                raise ValueError("'reduce' of an empty list with no initial value.")
+        with callee as call:
+            for value in iterator:
+                accumulator = call(accumulator, value)
+        return accumulator
+
+    def any(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        callee, values = self._prepare("any", args, 1, env, evaluator)
+        with callee as call:
+            return any(call(value) for value in values)
+
+    def all(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        callee, values = self._prepare("all", args, 1, env, evaluator)
+        with callee as call:
+            return all(call(value) for value in values)
+
+    def find(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        # Premier élément pour lequel fn est vrai, null sinon
+        callee, values = self._prepare("find", args, 1, env, evaluator)
+        with callee as call:
+            for value in values:
+                if call(value):
+                    return value
+        return None
+
+    def group_by(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        # {clé: [éléments]} dans l'ordre de première apparition des clés
+        callee, values = self._prepare("group_by", args, 1, env, evaluator)
+        groups: Dict[Any, List[Any]] = {}
+        with callee as call:
+            for value in values:
+                key = call(value)
+                try:
+                    groups.setdefault(key, []).append(value)
+                except TypeError:
+                    raise ValueError(f"'group_by' key must be a string or a number, got {type(key).__name__}.")
+        return groups
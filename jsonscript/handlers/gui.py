@@ -4,9 +4,9 @@ import tkinter as tk
 from tkinter import messagebox
 from tkinter import filedialog
 from typing import List, Any, Dict, Optional
-from jsonscript.exceptions import ReturnValue
 from jsonscript.handlers.base import BaseHandler, EvaluatorFunc
 from jsonscript.environment import Environment
+from jsonscript.handlers.commands import GUI_COMMANDS
 
 
 # Global queue to handle communication from the synchronous JsonScript thread 
@@ -37,23 +37,7 @@ class GUIHandler(BaseHandler):
             GUIHandler._root_window.title("JsonScript Application")
         return GUIHandler._root_window
 
-    def can_handle(self, command: str) -> bool:
-        return command in {
-            "gui_new", 
-            "gui_set", 
-            "gui_show", 
-            "gui_on", 
-            "gui_quit",
-            "gui_title",
-            "gui_size",
-            "gui_get",
-            "gui_grid",
-            "gui_place",
-            "gui_alert",
-            "gui_confirm",
-            "gui_open_file",
-            "gui_save_file"
-        }
+    commands = GUI_COMMANDS
     
     def handle(self, command: str, args: List[Any], env: Any, evaluator: EvaluatorFunc) -> Any:
         # Stockage de l'environnement et de l'évaluateur pour le thread Tkinter
@@ -282,7 +266,10 @@ def create_js_callback(js_func_name: str, instance_name: str = None, event_type:
 
     def python_callback(event=None):
         env = GUIHandler._environment
-        evaluator = GUIHandler._evaluator_func
+        # Appel via l'évaluateur principal (et non le callback reçu par handle) :
+        # la VM passe aux handlers des arguments déjà évalués.
+        from jsonscript.evaluator import ExpressionEvaluator
+        evaluator = ExpressionEvaluator.evaluate
         
         if not env or not evaluator:
             print("Erreur critique: Environnement non chargé pour le callback GUI.")
@@ -301,9 +288,8 @@ def create_js_callback(js_func_name: str, instance_name: str = None, event_type:
             
         try:
             # Exécution de l'instruction (déclenchant la logique JS)
+            # (la valeur de retour est ignorée dans les callbacks)
             evaluator(raw_call, env)
-        except ReturnValue:
-            pass # Les retours sont ignorés dans les callbacks
         except Exception as e:
             print(f"Erreur d'exécution JS dans le callback '{js_func_name}': {e}")
             messagebox.showerror("Erreur Script JS", f"Erreur dans le code: {e}")
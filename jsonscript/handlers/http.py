@@ -2,18 +2,17 @@ import json
 import urllib.request
 import urllib.error
 from typing import List, Any
+from jsonscript.buffers import Buffer
+from jsonscript.classes import json_default
 from jsonscript.handlers.base import BaseHandler, EvaluatorFunc
+from jsonscript.handlers.commands import HTTP_COMMANDS
 
 
 class HttpHandler(BaseHandler):
     """
     Handles HTTP Requests (GET, POST) using Python's standard library.
     """
-    def can_handle(self, command: str) -> bool:
-        return command in {
-            "http_get", 
-            "http_post"
-        }
+    commands = HTTP_COMMANDS
 
     def handle(self, command: str, args: List[Any], env: Any, evaluator: EvaluatorFunc) -> Any:
         
@@ -33,17 +32,22 @@ class HttpHandler(BaseHandler):
 
         # --- HTTP POST ---
         if command == "http_post":
-            # Syntax: ["http_post", "url", {data_dict}]
+            # Syntax: ["http_post", "url", {data_dict}] ou ["http_post", "url", buffer] (corps binaire)
             if len(args) < 2: raise ValueError("http_post requires a URL and a Data Dictionary.")
             
             data_payload = evaluator(args[1], env)
             
-            # Convert the dictionary to JSON bytes
-            json_bytes = json.dumps(data_payload).encode('utf-8')
+            if isinstance(data_payload, Buffer):
+                # Envoyé tel quel : urllib lit directement la vue mémoire
+                body, content_type = data_payload.view, 'application/octet-stream'
+            else:
+                # Convert the dictionary to JSON bytes
+                body = json.dumps(data_payload, default=json_default).encode('utf-8')
+                content_type = 'application/json'
             
             # Build request with headers
-            req = urllib.request.Request(url, data=json_bytes)
-            req.add_header('Content-Type', 'application/json')
+            req = urllib.request.Request(url, data=body)
+            req.add_header('Content-Type', content_type)
             req.add_header('User-Agent', 'JsonScript/1.0')
 
             try:
@@ -1,6 +1,92 @@
-from typing import List, Any
+import mmap
+from typing import Any, List, MutableMapping
+from jsonscript.buffers import Buffer
 from jsonscript.environment import Environment
 from jsonscript.handlers.base import BaseHandler, EvaluatorFunc
+from jsonscript.handlers.collection import _as_int
+from jsonscript.handlers.commands import IO_COMMANDS
+
+
+class LineReader:
+    """
+    Lazy iterator over the lines of a text file, without their line ending.
+
+    Only the current line is in memory. The file is opened by read_lines (so a
+    missing file fails there) and closed when the lines run out, when the
+    iterator is collected (loop left with break), or at the end of the run.
+    """
+
+    def __init__(self, path: str, table: MutableMapping[int, Any]):
+        self.path = path
+        self._file = open(path, "r", encoding="utf-8")
+        self._lines = iter(self._file)
+        self._table = table
+        table[id(self)] = self
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> str:
+        try:
+            line = next(self._lines)
+        except StopIteration:
+            self.close()
+            raise
+        return line[:-1] if line[-1] == "\n" else line
+
+    def close(self) -> None:
+        self._table.pop(id(self), None)
+        self._file.close()
+
+    def __repr__(self):
+        return f"<lines '{self.path}'>"
+
+
+class ChunkReader:
+    """
+    Lazy iterator over a file as buffers of `size` bytes (the last one may be
+    shorter). A chunk boundary can fall anywhere, even inside a line or a
+    UTF-8 character. Closed like LineReader.
+    """
+
+    def __init__(self, path: str, size: int, table: MutableMapping[int, Any]):
+        self.path = path
+        self.size = size
+        self._file = open(path, "rb")
+        self._table = table
+        table[id(self)] = self
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> Buffer:
+        data = self._file.read(self.size)
+        if not data:
+            self.close()
+            raise StopIteration
+        return Buffer(data)
+
+    def close(self) -> None:
+        self._table.pop(id(self), None)
+        self._file.close()
+
+    def __repr__(self):
+        return f"<chunks '{self.path}' {self.size} bytes>"
+
+
+def map_file(path: str) -> Buffer:
+    """
+    Read-only memory mapping of a whole file as a buffer: pages are loaded by
+    the OS on access, slices stay views on the mapping.
+    """
+    with open(path, "rb") as f:
+        try:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Fichier vide : rien à projeter
+            return Buffer(b"")
+    # La projection reste valide après la fermeture du fichier, et vit tant qu'une vue l'utilise
+    return Buffer(mapping)
 
 
 class IOHandler(BaseHandler):
@@ -8,11 +94,7 @@ class IOHandler(BaseHandler):
     Handles Input/Output operations that return values (like reading a file).
     """
 
-    def can_handle(self, command: str) -> bool:
-        return command in {
-            "read_file",
-            "write_file"
-        }
+    commands = IO_COMMANDS
 
     def handle(self, command: str, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
         
@@ -23,13 +105,33 @@ class IOHandler(BaseHandler):
             with open(path, "r", encoding="utf-8") as f:
                 return f.read()
             
-        # ["write_file", "path", "content"]
+        # ["write_file", "path", "content"] (un buffer est écrit tel quel, en binaire)
         if command == "write_file":
             path = str(evaluator(args[0], env))
-            content = str(evaluator(args[1], env))
+            content = evaluator(args[1], env)
+            if isinstance(content, Buffer):
+                with open(path, "wb") as f:
+                    f.write(content.view)
+                return True
             with open(path, "w", encoding="utf-8") as f:
-                f.write(content)
+                f.write(str(content))
             return True # Retourne succès
 
+        # ["read_lines", "path"] : lignes une à une (for_each, map, filter...) au lieu de read_file + split
+        if command == "read_lines":
+            return LineReader(str(evaluator(args[0], env)), env.open_files)
+
+        # ["read_chunks", "path", taille] : buffers de `taille` octets
+        if command == "read_chunks":
+            path = str(evaluator(args[0], env))
+            size = _as_int(evaluator(args[1], env), "read_chunks")
+            if size <= 0:
+                raise ValueError(f"'read_chunks' size must be positive, got {size}.")
+            return ChunkReader(path, size, env.open_files)
+
+        # ["mmap_open", "path"] : buffer projeté en mémoire (buf_find, buf_count, buf_slice...)
+        if command == "mmap_open":
+            return map_file(str(evaluator(args[0], env)))
+
         raise ValueError(f"IOHandler cannot handle: {command}")
-    
\ No newline at end of file
+
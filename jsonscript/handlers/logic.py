@@ -1,6 +1,7 @@
-from typing import List, Any
+from typing import List, Any, Dict
 from jsonscript.environment import Environment
-from jsonscript.handlers.base import BaseHandler, EvaluatorFunc
+from jsonscript.handlers.base import BaseHandler, CommandFunc, EvaluatorFunc
+from jsonscript.handlers.commands import LOGIC_COMMANDS
 
 
 class LogicHandler(BaseHandler):
@@ -8,38 +9,33 @@ class LogicHandler(BaseHandler):
     Handles boolean logic and comparisons.
     """
 
-    def can_handle(self, command: str) -> bool:
-        return command in {
-            "==", 
-            "!=", 
-            "<", 
-            ">", 
-            "<=", 
-            ">="
+    commands = LOGIC_COMMANDS
+
+    def command_table(self) -> Dict[str, CommandFunc]:
+        # Une entrée par opérateur : plus de chaîne de if sur `command`
+        return {
+            "==": self.equal,
+            "!=": self.not_equal,
+            "<": self.less,
+            ">": self.greater,
+            "<=": self.less_equal,
+            ">=": self.greater_equal
         }
 
-    def handle(self, command: str, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
-        # Helper pour évaluer les arguments gauche (0) et droite (1)
-        left = evaluator(args[0], env)
-        right = evaluator(args[1], env)
-
-        if command == "==": 
-            return left == right
-        
-        if command == "!=": 
-            return left != right
-        
-        if command == "<":  
-            return left < right
-        
-        if command == ">":  
-            return left > right
-        
-        if command == "<=": 
-            return left <= right
-        
-        if command == ">=": 
-            return left >= right
-
-        raise ValueError(f"LogicHandler cannot handle: {command}")
-    
\ No newline at end of file
+    def equal(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        return evaluator(args[0], env) == evaluator(args[1], env)
+
+    def not_equal(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        return evaluator(args[0], env) != evaluator(args[1], env)
+
+    def less(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        return evaluator(args[0], env) < evaluator(args[1], env)
+
+    def greater(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        return evaluator(args[0], env) > evaluator(args[1], env)
+
+    def less_equal(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        return evaluator(args[0], env) <= evaluator(args[1], env)
+
+    def greater_equal(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        return evaluator(args[0], env) >= evaluator(args[1], env)
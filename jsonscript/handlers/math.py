@@ -1,8 +1,9 @@
 import math
 import random
-from typing import List, Any
+from typing import List, Any, Dict
 from jsonscript.environment import Environment
-from jsonscript.handlers.base import BaseHandler, EvaluatorFunc
+from jsonscript.handlers.base import BaseHandler, CommandFunc, EvaluatorFunc
+from jsonscript.handlers.commands import MATH_COMMANDS
 
 
 class MathHandler(BaseHandler):
@@ -10,93 +11,88 @@ class MathHandler(BaseHandler):
     Handles basic arithmetic (+, -, *, /) and advanced math functions (sqrt, random).
     """
 
-    def can_handle(self, command: str) -> bool:
-        return command in {
-            "+", 
-            "-", 
-            "*", 
-            "/", 
-            "%", 
-            "random", 
-            "randint", 
-            "sqrt", 
-            "pow", 
-            "abs", 
-            "round", 
-            "floor", 
-            "ceil", 
-            "PI",
-            "to_int"
+    commands = MATH_COMMANDS
+
+    def command_table(self) -> Dict[str, CommandFunc]:
+        # Une entrée par opérateur : plus de chaîne de if sur `command`
+        return {
+            "+": self.add,
+            "-": self.subtract,
+            "*": self.multiply,
+            "/": self.divide,
+            "%": self.modulo,
+            "random": self.random,
+            "randint": self.randint,
+            "sqrt": self.sqrt,
+            "pow": self.pow,
+            "abs": self.abs,
+            "round": self.round,
+            "floor": self.floor,
+            "ceil": self.ceil,
+            "PI": self.pi,
+            "to_int": self.to_int
         }
 
-    def handle(self, command: str, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
-        # Helper to evaluate arguments recursively
-        def eval_arg(index):
-            return evaluator(args[index], env)
-
-        # --- Basic Arithmetic ---
-        if command == "+": 
-            val1 = eval_arg(0)
-            val2 = eval_arg(1)
-            
-            # Si l'un des deux est une chaîne, on concatène (Style JavaScript)
-            if isinstance(val1, str) or isinstance(val2, str):
-                return str(val1) + str(val2)
-            
-            # Sinon, c'est une addition mathématique classique
-            return val1 + val2
-        
-        if command == "-": 
-            return eval_arg(0) - eval_arg(1)
+    # --- Basic Arithmetic ---
+    def add(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        val1 = evaluator(args[0], env)
+        val2 = evaluator(args[1], env)
         
-        if command == "*": 
-            return eval_arg(0) * eval_arg(1)
+        # Si l'un des deux est une chaîne, on concatène (Style JavaScript)
+        if isinstance(val1, str) or isinstance(val2, str):
+            return str(val1) + str(val2)
         
-        if command == "/":
-            denom = eval_arg(1)
-            if denom == 0: 
-                raise ValueError("Division by zero")
-            return eval_arg(0) / denom
-        
-        if command == "%": 
-            return eval_arg(0) % eval_arg(1)
+        # Sinon, c'est une addition mathématique classique
+        return val1 + val2
 
-        # --- Native Library ---
-        if command == "random": 
-            return random.random()
-        
-        if command == "randint": 
-            return random.randint(int(eval_arg(0)), int(eval_arg(1)))
-        
-        if command == "sqrt": 
-            return math.sqrt(eval_arg(0))
-        
-        if command == "pow": 
-            return math.pow(eval_arg(0), eval_arg(1))
-        
-        if command == "abs": 
-            return abs(eval_arg(0))
-        
-        if command == "floor": 
-            return math.floor(eval_arg(0))
-        
-        if command == "ceil": 
-            return math.ceil(eval_arg(0))
-        
-        if command == "PI": 
-            return math.pi
-        
-        if command == "round":
-            val = eval_arg(0)
-            digits = int(eval_arg(1)) if len(args) > 1 else 0
-            return round(val, digits)
-        
-        if command == "to_int":
-            val = eval_arg(0)
-            try:
-                return int(val)
-            except ValueError:
-                return 0
-
-        raise ValueError(f"MathHandler cannot handle: {command}")
-    
\ No newline at end of file
+    def subtract(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        return evaluator(args[0], env) - evaluator(args[1], env)
+
+    def multiply(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        return evaluator(args[0], env) * evaluator(args[1], env)
+
+    def divide(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        denom = evaluator(args[1], env)
+        if denom == 0: 
+            raise ValueError("Division by zero")
+        return evaluator(args[0], env) / denom
+
+    def modulo(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        return evaluator(args[0], env) % evaluator(args[1], env)
+
+    # --- Native Library ---
+    def random(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        return random.random()
+
+    def randint(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        return random.randint(int(evaluator(args[0], env)), int(evaluator(args[1], env)))
+
+    def sqrt(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        return math.sqrt(evaluator(args[0], env))
+
+    def pow(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        return math.pow(evaluator(args[0], env), evaluator(args[1], env))
+
+    def abs(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        return abs(evaluator(args[0], env))
+
+    def floor(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        return math.floor(evaluator(args[0], env))
+
+    def ceil(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        return math.ceil(evaluator(args[0], env))
+
+    def pi(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        return math.pi
+
+    def round(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        val = evaluator(args[0], env)
+        digits = int(evaluator(args[1], env)) if len(args) > 1 else 0
+        return round(val, digits)
+
+    def to_int(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        val = evaluator(args[0], env)
+        try:
+            return int(val)
+        except ValueError:
+            return 0
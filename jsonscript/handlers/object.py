@@ -1,20 +1,74 @@
-from typing import List, Any
+from typing import Any, Dict, List
 from jsonscript.handlers.base import BaseHandler, EvaluatorFunc
 from jsonscript.environment import Environment
-from jsonscript.exceptions import ReturnValue
+from jsonscript.classes import ScriptInstance, instance_class_name, is_instance_dict
+from jsonscript.modules import ModuleNamespace
+from jsonscript.handlers.core import call_function, run_tail_call_in_scope
+from jsonscript.signals import RETURN, TAIL_CALL, outside_loop_error
+from jsonscript.handlers.commands import OBJECT_COMMANDS
+
+
+def find_method(env: Environment, class_name: str, method_name: str) -> Dict[str, Any]:
+    """Looks `method_name` up in the flattened method table (own and inherited methods)."""
+    method_def = env.get_class(class_name).method_table.get(method_name)
+    if method_def is None:
+        raise ValueError(f"Method '{method_name}' not found in class '{class_name}' or its parents.")
+    return method_def
+
+
+def check_method_args(method_name: str, method_def: Dict[str, Any], argc: int) -> None:
+    param_names = method_def["params"]
+    if argc != len(param_names):
+        raise ValueError(f"Method '{method_name}' expects {len(param_names)} args.")
+
+
+def invoke_method(env: Environment, instance: Any, method_def: Dict[str, Any], resolved_args: List[Any]) -> Any:
+    """Runs a method body with `this` bound to `instance` (arguments already evaluated and checked)."""
+    frame_size = method_def.get("frame_size")
+    if frame_size is None:
+        env.enter_scope()
+        env.set_variable("this", instance)
+        for name, val in zip(method_def["params"], resolved_args):
+            env.set_variable(name, val)
+    else:
+        # Slot 0 : this, puis les paramètres
+        frame = env.push_frame(frame_size)
+        frame[0] = instance
+        frame[1:len(resolved_args) + 1] = resolved_args
+
+    status = None
+    try:
+        for instruction in method_def["body"]:
+            status = instruction.execute(env)
+            if status is not None:
+                break
+        if status == TAIL_CALL and frame_size is None:
+            status = run_tail_call_in_scope(env)
+    finally:
+        if frame_size is None:
+            env.exit_scope()
+        else:
+            env.pop_frame()
+
+    if status is None:
+        return None
+    if status == RETURN:
+        return_val = env.return_value
+        env.return_value = None
+        return return_val
+    if status == TAIL_CALL:
+        # La méthode est terminée : l'appel terminal s'exécute à sa place
+        func_name, func_def, resolved_args = env.tail_call
+        env.tail_call = None
+        return call_function(env, func_name, func_def, resolved_args)
+    raise outside_loop_error(status)
 
 
 class ObjectHandler(BaseHandler):
     """
     Handles Object Oriented Programming: Instantiation, Method calls, Attributes.
     """
-    def can_handle(self, command: str) -> bool:
-        return command in {
-            "new", 
-            "call_method", 
-            "get_attr", 
-            "set_attr"
-        }
+    commands = OBJECT_COMMANDS
     
     def handle(self, command: str, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
         
@@ -24,38 +78,30 @@ class ObjectHandler(BaseHandler):
             constructor_args = args[1:]
             
             # 1. Récupérer la classe
-            cls_def = env.get_class(class_name)
-            
-            # 2. Créer l'instance (C'est un dict avec un marqueur de type)
-            instance = {
-                "__class__": class_name,
-                "__data__": {} # Les attributs seront stockés ici
-            }
+            cls = env.get_class(class_name)
             
-            # 3. Initialiser les attributs via le constructeur
-            param_names = cls_def["params"]
-            
-            # Vérif arguments constructeur
-            if len(constructor_args) != len(param_names):
-                raise ValueError(f"Constructor for '{class_name}' expects {len(param_names)} args.")
+            # 2. Vérif arguments constructeur
+            if len(constructor_args) != len(cls.params):
+                raise ValueError(f"Constructor for '{class_name}' expects {len(cls.params)} args.")
 
             resolved_args = [evaluator(arg, env) for arg in constructor_args]
             
-            # On remplit les données initiales
-            for name, val in zip(param_names, resolved_args):
-                instance["__data__"][name] = val
-                
-            return instance
+            # 3. Instance de la classe générée : les params du constructeur remplissent ses slots
+            return cls.instantiate(resolved_args)
 
         # ["get_attr", instance, "attr_name"]
         if command == "get_attr":
             instance = evaluator(args[0], env)
             attr_name = args[1] # String literal
             
-            if not isinstance(instance, dict) or "__data__" not in instance:
-                raise ValueError("Target is not a class instance.")
-                
-            return instance["__data__"].get(attr_name)
+            if isinstance(instance, ModuleNamespace):
+                # m.name : variable globale d'un module importé avec "as"
+                return instance.get_member(attr_name)
+            if isinstance(instance, ScriptInstance):
+                return instance.get_attr(attr_name)
+            if is_instance_dict(instance):
+                return instance["__data__"].get(attr_name)
+            raise ValueError("Target is not a class instance.")
 
         # ["set_attr", instance, "attr_name", value]
         # Note: Ceci devrait idéalement être une Instruction, mais pour la simplicité on le met ici
@@ -65,65 +111,32 @@ class ObjectHandler(BaseHandler):
             attr_name = args[1]
             value = evaluator(args[2], env)
             
-            if not isinstance(instance, dict) or "__data__" not in instance:
+            if isinstance(instance, ScriptInstance):
+                instance.set_attr(attr_name, value)
+            elif is_instance_dict(instance):
+                instance["__data__"][attr_name] = value
+            else:
                 raise ValueError("Target is not a class instance.")
-            
-            instance["__data__"][attr_name] = value
             return value # On retourne la valeur assignée
 
         # ["call_method", instance, "method_name", arg1...]
         if command == "call_method":
-            from jsonscript.factory import InstructionFactory
-
             instance = evaluator(args[0], env)
             method_name = args[1]
             method_args = args[2:]
             
-            if not isinstance(instance, dict) or "__class__" not in instance:
+            if isinstance(instance, ModuleNamespace):
+                # m.f(...) : fonction d'un module importé avec "as"
+                return instance.call(method_name, [evaluator(arg, env) for arg in method_args])
+            class_name = instance_class_name(instance)
+            if class_name is None:
                 raise ValueError("Target is not a valid object instance.")
             
-            class_name = instance["__class__"]
-            
-            # --- LOGIQUE DE RECHERCHE D'HÉRITAGE ---
-            method_def = None
-            current_class_name = class_name
-            
-            # On boucle tant qu'on n'a pas trouvé la méthode ou qu'il n'y a plus de parent
-            while current_class_name:
-                cls_def = env.get_class(current_class_name)
-                
-                if method_name in cls_def["methods"]:
-                    method_def = cls_def["methods"][method_name]
-                    break # Trouvé !
-                
-                # Pas trouvé, on remonte au parent
-                current_class_name = cls_def["parent"] # Sera None si pas de parent
-            
-            if not method_def:
-                raise ValueError(f"Method '{method_name}' not found in class '{class_name}' or its parents.")
-            # ---------------------------------------
-
-            # ... (Le reste : scope, params, execute est IDENTIQUE à avant) ...
-            param_names = method_def["params"]
-            if len(method_args) != len(param_names):
-                raise ValueError(f"Method '{method_name}' expects {len(param_names)} args.")
+            method_def = find_method(env, class_name, method_name)
+            check_method_args(method_name, method_def, len(method_args))
 
             resolved_args = [evaluator(arg, env) for arg in method_args]
-            env.enter_scope()
-            env.set_variable("this", instance)
-            for name, val in zip(param_names, resolved_args):
-                env.set_variable(name, val)
-
-            return_val = None
-            try:
-                for raw_inst in method_def["body"]:
-                    InstructionFactory.build(raw_inst).execute(env)
-            except ReturnValue as ret:
-                return_val = ret.value
-            finally:
-                env.exit_scope()
-            
-            return return_val
+            return invoke_method(env, instance, method_def, resolved_args)
 
         raise ValueError(f"ObjectHandler cannot handle: {command}")
     
\ No newline at end of file
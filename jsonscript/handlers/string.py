@@ -1,7 +1,9 @@
 import json
 from typing import List, Any
+from jsonscript.classes import json_default
 from jsonscript.environment import Environment
 from jsonscript.handlers.base import BaseHandler, EvaluatorFunc
+from jsonscript.handlers.commands import STRING_COMMANDS
 
 
 class StringHandler(BaseHandler):
@@ -9,22 +11,7 @@ class StringHandler(BaseHandler):
     Handles string manipulations.
     """
 
-    def can_handle(self, command: str) -> bool:
-        return command in {
-            "concat", 
-            "split", 
-            "replace", 
-            "upper", 
-            "lower",
-            "parse_json",
-            "to_json",
-            "trim",
-            "substring",
-            "contains",
-            "index_of",
-            "starts_with",
-            "ends_with"
-        }
+    commands = STRING_COMMANDS
 
     def handle(self, command: str, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
         
@@ -61,7 +48,7 @@ class StringHandler(BaseHandler):
             target = evaluator(args[0], env)
             try:
                 # separators=(',', ':') compacte le JSON (enlève les espaces inutiles)
-                return json.dumps(target, separators=(',', ':'))
+                return json.dumps(target, separators=(',', ':'), default=json_default)
             except TypeError as e:
                 raise ValueError(f"Cannot serialize to JSON: {e}")
 
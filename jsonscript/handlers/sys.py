@@ -4,6 +4,7 @@ import platform
 import subprocess
 from typing import List, Any
 from jsonscript.handlers.base import BaseHandler, EvaluatorFunc
+from jsonscript.handlers.commands import SYS_COMMANDS
 
 
 class SysHandler(BaseHandler):
@@ -11,14 +12,7 @@ class SysHandler(BaseHandler):
     Handles System interactions and Shell commands.
     """
 
-    def can_handle(self, command: str) -> bool:
-        return command in {
-            "exec", 
-            "os_name", 
-            "cwd", 
-            "env",
-            "args"
-        }
+    commands = SYS_COMMANDS
 
     def handle(self, command: str, args: List[Any], env: Any, evaluator: EvaluatorFunc) -> Any:
         # ["exec", "echo hello"] -> Retourne la sortie standard (stdout)
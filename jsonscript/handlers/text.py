@@ -0,0 +1,188 @@
+from functools import lru_cache
+from string import Formatter
+from typing import Any, Dict, List, Tuple
+from jsonscript.classes import ScriptInstance
+from jsonscript.environment import Environment
+from jsonscript.evaluator import ExpressionEvaluator
+from jsonscript.handlers.base import BaseHandler, CommandFunc, EvaluatorFunc
+from jsonscript.handlers.commands import TEXT_COMMANDS
+
+
+class StringBuilder:
+    """
+    Mutable string value: appended pieces are kept as a list of chunks and
+    joined once by sb_build, so building an N-piece text stays linear.
+    """
+    __slots__ = ("chunks", "length")
+
+    def __init__(self):
+        self.chunks: List[str] = []
+        self.length = 0
+
+    def append(self, text: str) -> None:
+        self.chunks.append(text)
+        self.length += len(text)
+
+    def build(self) -> str:
+        text = "".join(self.chunks)
+        # Un seul morceau ensuite : un nouveau sb_build ne refait pas la jointure
+        self.chunks = [text] if text else []
+        return text
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __repr__(self):
+        return f"<string_builder {self.length} chars>"
+
+
+# --- Templates de format ---
+class Template:
+    """
+    A parsed format template. Rendered with a single str.format call on a
+    normalized pattern ("{0:spec}{1}..." with one positional field per
+    template field), after the fields' values have been picked.
+    """
+    __slots__ = ("pattern", "fields")
+
+    def __init__(self, pattern: str, fields: Tuple[Any, ...]):
+        self.pattern = pattern
+        self.fields = fields # index d'argument (int) ou nom de clé du premier argument (str)
+
+    def render(self, values: List[Any]) -> str:
+        picked = []
+        for field in self.fields:
+            if isinstance(field, int):
+                if field >= len(values):
+                    raise ValueError(f"Format field {{{field}}} has no argument ({len(values)} given).")
+                picked.append(values[field])
+            else:
+                picked.append(_named(values, field))
+        try:
+            # Spécification vide : format(valeur, "") == str(valeur), le texte de print et "+"
+            return self.pattern.format(*picked)
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Cannot format {picked!r}: {e}")
+
+
+@lru_cache(maxsize=256)
+def parse_template(template: str) -> Template:
+    """
+    Parses "{} {0} {name:>8.2f}": `{}` / `{n}` take positional arguments,
+    `{name}` a key of the first argument (dict or object), `{{` `}}` are braces.
+    Attribute / index access (`{0.x}`, `{0[1]}`) and conversions are rejected.
+    """
+    pattern: List[str] = []
+    fields: List[Any] = []
+    next_index = 0
+    numbering = None # "auto" ({}) ou "manual" ({0}) : pas de mélange des deux, comme str.format
+    try:
+        parsed = list(Formatter().parse(template))
+    except ValueError as e:
+        raise ValueError(f"Invalid format template {template!r}: {e}")
+
+    for literal, field_name, spec, conversion in parsed:
+        pattern.append(literal.replace("{", "{{").replace("}", "}}"))
+        if field_name is None:
+            continue
+        if conversion is not None or "." in field_name or "[" in field_name:
+            raise ValueError(f"Invalid format field '{{{field_name}}}' in {template!r}.")
+        if "{" in spec:
+            raise ValueError(f"Nested format fields are not supported in {template!r}.")
+
+        if field_name == "" or field_name.isdigit():
+            mode = "auto" if field_name == "" else "manual"
+            if numbering is not None and numbering != mode:
+                raise ValueError(f"Cannot mix '{{}}' and '{{n}}' fields in {template!r}.")
+            numbering = mode
+            if field_name == "":
+                field, next_index = next_index, next_index + 1
+            else:
+                field = int(field_name)
+        else:
+            field = field_name
+        pattern.append(f"{{{len(fields)}:{spec}}}" if spec else f"{{{len(fields)}}}")
+        fields.append(field)
+    return Template("".join(pattern), tuple(fields))
+
+
+def _named(values: List[Any], name: str) -> Any:
+    source = values[0] if values else None
+    if isinstance(source, dict):
+        if name not in source:
+            raise ValueError(f"Key '{name}' not found for format.")
+        return source[name]
+    if isinstance(source, ScriptInstance):
+        return source.get_attr(name)
+    raise ValueError(f"Format field '{{{name}}}' needs a dictionary or an object as first argument.")
+
+
+class FormatSite:
+    """
+    A compiled ["format", "literal template", args...] expression: the template
+    is parsed once for the call site. Callable with the environment, like the
+    closures of the "closure" engine and CallMethodSite.
+    """
+    __slots__ = ("template", "arg_exprs")
+
+    def __init__(self, template: str, arg_exprs: List[Any]):
+        self.template = parse_template(template)
+        self.arg_exprs = arg_exprs
+
+    def __call__(self, env: Environment) -> Any:
+        evaluate = ExpressionEvaluator.evaluate
+        return self.template.render([evaluate(arg, env) for arg in self.arg_exprs])
+
+
+def _as_builder(value: Any, command: str) -> StringBuilder:
+    if not isinstance(value, StringBuilder):
+        raise ValueError(f"'{command}' expects a string builder, got {type(value).__name__}.")
+    return value
+
+
+class TextHandler(BaseHandler):
+    """
+    Handles text building: string builders (sb_*) and format templates.
+    """
+
+    commands = TEXT_COMMANDS
+
+    def command_table(self) -> Dict[str, CommandFunc]:
+        return {
+            "sb_new": self.sb_new,
+            "sb_append": self.sb_append,
+            "sb_len": self.sb_len,
+            "sb_build": self.sb_build,
+            "format": self.format
+        }
+
+    # --- String builder ---
+    def sb_new(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        # ["sb_new"] ou ["sb_new", texte initial...]
+        builder = StringBuilder()
+        for arg in args:
+            builder.append(str(evaluator(arg, env)))
+        return builder
+
+    def sb_append(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        # ["sb_append", sb, valeur...] : renvoie le builder (appels chaînables)
+        builder = _as_builder(evaluator(args[0], env), "sb_append")
+        for arg in args[1:]:
+            builder.append(str(evaluator(arg, env)))
+        return builder
+
+    def sb_len(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        return _as_builder(evaluator(args[0], env), "sb_len").length
+
+    def sb_build(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        return _as_builder(evaluator(args[0], env), "sb_build").build()
+
+    # --- Format ---
+    def format(self, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
+        # Chemin sans site compilé (template calculé, vm, python) : analyse mise en cache par template
+        if not args:
+            raise ValueError("'format' expects a template.")
+        template = evaluator(args[0], env)
+        if not isinstance(template, str):
+            raise ValueError(f"'format' template must be a string, got {type(template).__name__}.")
+        return parse_template(template).render([evaluator(arg, env) for arg in args[1:]])
@@ -2,6 +2,7 @@ import time
 from datetime import datetime
 from typing import List, Any
 from jsonscript.handlers.base import BaseHandler, EvaluatorFunc
+from jsonscript.handlers.commands import TIME_COMMANDS
 
 
 class TimeHandler(BaseHandler):
@@ -9,12 +10,7 @@ class TimeHandler(BaseHandler):
     Handles Time, Date and Sleep.
     """
 
-    def can_handle(self, command: str) -> bool:
-        return command in {
-            "now", 
-            "timestamp",
-            "format_date"
-        }
+    commands = TIME_COMMANDS
 
     def handle(self, command: str, args: List[Any], env: Any, evaluator: EvaluatorFunc) -> Any:
         # ["now"] -> "2023-10-27 10:00:00" (ISO format string)
@@ -3,6 +3,7 @@ import getpass
 from typing import List, Any
 from jsonscript.handlers.base import BaseHandler, EvaluatorFunc
 from jsonscript.environment import Environment
+from jsonscript.handlers.commands import TUI_COMMANDS
 
 
 class TUIHandler(BaseHandler):
@@ -15,12 +16,7 @@ class TUIHandler(BaseHandler):
         "reset": "\033[0m"
     }
 
-    def can_handle(self, command):
-        return command in {
-            "print_color",
-            "clear_screen",
-            "input_password"
-        }
+    commands = TUI_COMMANDS
     
     def handle(self, command: str, args: List[Any], env: Environment, evaluator: EvaluatorFunc) -> Any:
         if command == "print_color":
@@ -0,0 +1,106 @@
+from typing import Any, Dict, List
+from jsonscript.classes import ScriptInstance, instance_class_name
+from jsonscript.environment import Environment
+from jsonscript.evaluator import ExpressionEvaluator
+from jsonscript.modules import ModuleNamespace
+
+# Les handlers object / text ne sont importés qu'au premier site call_method / format rencontré :
+# importer ce module (runner.py) ne doit pas charger de handler (voir ExpressionEvaluator.lookup)
+
+
+class MethodCache:
+    """
+    Inline cache of one call_method site: class name -> method definition.
+
+    Monomorphic while a single class goes through the site, polymorphic up to
+    MAX_ENTRIES classes; beyond that (megamorphic) misses are not cached.
+    Every entry is dropped as soon as Environment.class_version changes
+    (any define_class), since a redefinition can change inherited methods too.
+    """
+    __slots__ = ("method_name", "argc", "version", "entries")
+
+    MAX_ENTRIES = 4
+
+    def __init__(self, method_name: str, argc: int):
+        self.method_name = method_name
+        self.argc = argc
+        self.version = -1
+        self.entries: Dict[str, Dict[str, Any]] = {}
+
+    def lookup(self, env: Environment, class_name: str) -> Dict[str, Any]:
+        if self.version != env.class_version:
+            self.entries = {}
+            self.version = env.class_version
+
+        method_def = self.entries.get(class_name)
+        if method_def is None:
+            from jsonscript.handlers.object import check_method_args, find_method
+            method_def = find_method(env, class_name, self.method_name)
+            # Le nombre d'arguments d'un site est fixe : vérifié une fois par classe
+            check_method_args(self.method_name, method_def, self.argc)
+            if len(self.entries) < self.MAX_ENTRIES:
+                self.entries[class_name] = method_def
+        return method_def
+
+
+class CallMethodSite:
+    """
+    A compiled ["call_method", instance, "name", args...] expression.
+    Callable with the environment, like the closures of the "closure" engine,
+    so ExpressionEvaluator runs it directly.
+    """
+    __slots__ = ("instance_expr", "method_name", "arg_exprs", "cache", "invoke")
+
+    def __init__(self, instance_expr: Any, method_name: str, arg_exprs: List[Any]):
+        from jsonscript.handlers.object import invoke_method
+        self.instance_expr = instance_expr
+        self.method_name = method_name
+        self.arg_exprs = arg_exprs
+        self.cache = MethodCache(method_name, len(arg_exprs))
+        self.invoke = invoke_method
+
+    def __call__(self, env: Environment) -> Any:
+        evaluate = ExpressionEvaluator.evaluate
+        instance = evaluate(self.instance_expr, env)
+        if isinstance(instance, ScriptInstance):
+            class_name = instance._script_class.name
+        elif isinstance(instance, ModuleNamespace):
+            return instance.call(self.method_name, [evaluate(arg, env) for arg in self.arg_exprs])
+        else:
+            class_name = instance_class_name(instance)
+            if class_name is None:
+                raise ValueError("Target is not a valid object instance.")
+
+        method_def = self.cache.lookup(env, class_name)
+        resolved_args = [evaluate(arg, env) for arg in self.arg_exprs]
+        return self.invoke(env, instance, method_def, resolved_args)
+
+
+class CallSiteCompiler:
+    """
+    Expression "compiler" of the tree engine: expressions stay raw JSON except
+    call_method sites, replaced (at any depth) by a CallMethodSite, and format
+    calls with a literal template, replaced by a FormatSite.
+    """
+
+    def compile(self, expression: Any) -> Any:
+        if not isinstance(expression, list) or not expression:
+            return expression
+
+        command = expression[0]
+        if command == "lambda" and len(expression) >= 2:
+            return ["lambda", *expression[1:-1], self.compile(expression[-1])]
+        if not isinstance(command, str) or ExpressionEvaluator.lookup(command) is None:
+            # Liste de données brute : jamais évaluée, laissée intacte
+            return expression
+
+        args = [self.compile(arg) for arg in expression[1:]]
+        if not ExpressionEvaluator.is_builtin(command):
+            # Commande remplacée par register_command / register_handler : dispatch normal
+            return [command, *args]
+        if command == "call_method" and len(args) >= 2:
+            return CallMethodSite(args[0], args[1], args[2:])
+        if command == "format" and args and isinstance(args[0], str):
+            from jsonscript.handlers.text import FormatSite
+            return FormatSite(args[0], args[1:])
+        return [command, *args]
@@ -1,20 +1,39 @@
-import json
 import time
+from collections.abc import MutableMapping
 from abc import ABC, abstractmethod
 from jsonscript.environment import Environment
 from jsonscript.evaluator import ExpressionEvaluator
-from jsonscript.exceptions import BreakLoop, ContinueLoop, ReturnValue
+from jsonscript.memo import MemoCache
+from jsonscript.modules import ModuleNamespace
+from jsonscript.signals import BREAK, CONTINUE, RETURN, TAIL_CALL
 from typing import Any, List, Dict
 
 
 # Abstract Base Class for all instructions
 # This enforces that every instruction must have an 'execute' method
 class Instruction(ABC):
+    # Noms des attributs contenant une expression brute / un bloc d'instructions.
+    # Utilisés par les moteurs alternatifs pour précompiler les expressions.
+    expression_fields: tuple = ()
+    block_fields: tuple = ()
+
     @abstractmethod
     def execute(self, environement: Environment):
-        """Executes the logic associated with the instruction."""
+        """
+        Executes the logic associated with the instruction.
+        Returns None, or a status from jsonscript.signals (BREAK, CONTINUE, RETURN)
+        that the enclosing block must propagate.
+        """
         pass
 
+    def compile_expressions(self, compiler) -> None:
+        """Replaces raw expressions (recursively, nested blocks included) with compiled ones."""
+        for field in self.expression_fields:
+            setattr(self, field, compiler.compile(getattr(self, field)))
+        for field in self.block_fields:
+            for instruction in getattr(self, field):
+                instruction.compile_expressions(compiler)
+
 
 class CommentInstruction(Instruction):
     def __init__(self, text: str):
@@ -26,6 +45,9 @@ class CommentInstruction(Instruction):
 
 
 class SetInstruction(Instruction):
+    expression_fields = ('value_expression',)
+    slot = None # Index dans la frame si la variable a été résolue comme locale
+
     def __init__(self, name: str, value_expression: Any):
         self.name = name
         self.value_expression = value_expression
@@ -33,7 +55,10 @@ class SetInstruction(Instruction):
     def execute(self, environment: Environment):
         # We evaluate the expression at runtime to get the actual value
         resolved_value = ExpressionEvaluator.evaluate(self.value_expression, environment)
-        environment.set_variable(self.name, resolved_value)
+        if self.slot is None:
+            environment.set_variable(self.name, resolved_value)
+        else:
+            environment.set_local(self.slot, resolved_value)
 
 
 class PrintInstruction(Instruction):
@@ -50,29 +75,63 @@ class PrintInstruction(Instruction):
         # Join all parts and print
         print("".join(resolved_values))
 
+    def compile_expressions(self, compiler) -> None:
+        self.args = [compiler.compile(arg) for arg in self.args]
+
 
 class FunctionDefInstruction(Instruction):
-    def __init__(self, name: str, params: List[str], body: List[Any]):
+    block_fields = ('body',)
+    frame_size = None # Renseigné par le Resolver (mode lexical)
+
+    def __init__(self, name: str, params: List[str], body: List[Instruction], options: Dict[str, Any] = None):
         self.name = name
         self.params = params
         self.body = body
+        # Options : {"memo": true, "memo_size": 256}
+        self.options = options if options is not None else {}
 
     def execute(self, environment: Environment):
-        environment.define_function(self.name, self.params, self.body)
+        # Chaque définition repart d'un cache vide
+        memo = MemoCache(self.options.get("memo_size")) if self.options.get("memo") else None
+        environment.define_function(self.name, self.params, self.body, self.frame_size, memo)
 
 
 class ReturnInstruction(Instruction):
+    expression_fields = ('value_expression',)
+
     def __init__(self, value_expression: Any):
         self.value_expression = value_expression
 
     def execute(self, environment: Environment):
-        # Evaluer la valeur à retourner
-        val = ExpressionEvaluator.evaluate(self.value_expression, environment)
-        # Lancer l'exception pour remonter la pile
-        raise ReturnValue(val)
+        # Evaluer la valeur à retourner, l'appel la récupère quand il voit RETURN
+        environment.return_value = ExpressionEvaluator.evaluate(self.value_expression, environment)
+        return RETURN
+
+
+class TailCallInstruction(Instruction):
+    """
+    ["return", ["call", name, args...]] in tail position of a function body.
+    Evaluates the arguments and hands the call over to the caller's loop
+    (call_function) instead of nesting one more Python call.
+    """
+
+    def __init__(self, func_name: str, args: List[Any]):
+        self.func_name = func_name
+        self.args = args
+
+    def execute(self, environment: Environment):
+        func_def = environment.get_function(self.func_name)
+        resolved_args = [ExpressionEvaluator.evaluate(arg, environment) for arg in self.args]
+        environment.tail_call = (self.func_name, func_def, resolved_args)
+        return TAIL_CALL
+
+    def compile_expressions(self, compiler) -> None:
+        self.args = [compiler.compile(arg) for arg in self.args]
 
 
 class CallInstruction(Instruction):
+    expression_fields = ('raw_expression',)
+
     def __init__(self, raw_expression: List[Any]):
         self.raw_expression = raw_expression # ["call", "name", arg1...]
 
@@ -86,37 +145,46 @@ class BreakInstruction(Instruction):
         pass
 
     def execute(self, environment: Environment):
-        # On lève l'exception pour signaler l'arrêt immédiat
-        raise BreakLoop()
+        # On signale l'arrêt immédiat à la boucle englobante
+        return BREAK
     
 
 class ContinueInstruction(Instruction):
     def __init__(self):
         pass
     def execute(self, environment: Environment):
-        raise ContinueLoop()
+        return CONTINUE
 
 
 class WhileInstruction(Instruction):
-    def __init__(self, condition: Any, body: List[Any]):
+    expression_fields = ('condition',)
+    block_fields = ('body',)
+
+    def __init__(self, condition: Any, body: List[Instruction]):
         self.condition = condition
         self.body = body
 
     def execute(self, environment: Environment):
-        from jsonscript.factory import InstructionFactory 
-        try: # Try/Except extérieur pour le BREAK
-            while ExpressionEvaluator.evaluate(self.condition, environment):
-                try: # Try/Except intérieur pour le CONTINUE
-                    for raw_instruction in self.body:
-                        InstructionFactory.build(raw_instruction).execute(environment)
-                except ContinueLoop:
-                    continue # Saute à la prochaine vérification 'while'
-        except BreakLoop:
-            pass # Sort de la boucle
+        while ExpressionEvaluator.evaluate(self.condition, environment):
+            for instruction in self.body:
+                status = instruction.execute(environment)
+                if status is not None:
+                    break
+            else:
+                continue
+            if status == BREAK:
+                break # Sort de la boucle
+            if status != CONTINUE:
+                return status # RETURN ou TAIL_CALL : remonte à la fonction
+            # CONTINUE : saute à la prochaine vérification 'while'
 
 
 class ForRangeInstruction(Instruction):
-    def __init__(self, var_name: str, start: Any, end: Any, step: Any, body: List[Any]):
+    expression_fields = ('start_expr', 'end_expr', 'step_expr')
+    block_fields = ('body',)
+    slot = None
+
+    def __init__(self, var_name: str, start: Any, end: Any, step: Any, body: List[Instruction]):
         self.var_name = var_name
         self.start_expr = start
         self.end_expr = end
@@ -124,46 +192,113 @@ class ForRangeInstruction(Instruction):
         self.body = body
 
     def execute(self, environment: Environment):
-        from jsonscript.factory import InstructionFactory 
-        
         start_val = int(ExpressionEvaluator.evaluate(self.start_expr, environment))
         end_val = int(ExpressionEvaluator.evaluate(self.end_expr, environment))
         step_val = int(ExpressionEvaluator.evaluate(self.step_expr, environment))
 
-        try: # Try/Except extérieur pour le BREAK
-            for i in range(start_val, end_val, step_val):
+        for i in range(start_val, end_val, step_val):
+            if self.slot is None:
                 environment.set_variable(self.var_name, i)
-                try: # Try/Except intérieur pour le CONTINUE
-                    for raw_instruction in self.body:
-                        InstructionFactory.build(raw_instruction).execute(environment)
-                except ContinueLoop:
-                    continue # Saute à la prochaine itération 'for i'
-        except BreakLoop:
-            pass # Sort de la boucle
+            else:
+                environment.set_local(self.slot, i)
+            for instruction in self.body:
+                status = instruction.execute(environment)
+                if status is not None:
+                    break
+            else:
+                continue
+            if status == BREAK:
+                break # Sort de la boucle
+            if status != CONTINUE:
+                return status # RETURN ou TAIL_CALL : remonte à la fonction
+            # CONTINUE : saute à la prochaine itération 'for i'
+
+
+def loop_items(iterable: Any, pairs: bool = False) -> Any:
+    """
+    What a for_each iterates over: the iterable itself (dict keys, list items,
+    string characters, handler iterators), or with `pairs` the (key, value)
+    items of a dict and (index, element) of anything else.
+    """
+    # Itération directe sur l'objet : ni liste d'indices ni copie
+    if isinstance(iterable, dict):
+        return iterable.items() if pairs else iterable
+    if hasattr(iterable, "__iter__"):
+        return enumerate(iterable) if pairs else iterable
+    raise ValueError(f"Cannot iterate over {type(iterable).__name__} in 'for_each'.")
+
+
+class ForEachInstruction(Instruction):
+    """
+    ["for_each", "item", iterable, body] or ["for_each", ["key", "value"], iterable, body],
+    over the items given by loop_items.
+    """
+    expression_fields = ('iterable_expr',)
+    block_fields = ('body',)
+    slots = None # Index dans la frame de chaque variable si elles ont été résolues comme locales
+
+    def __init__(self, var_names: List[str], iterable: Any, body: List[Instruction]):
+        self.var_names = var_names
+        self.iterable_expr = iterable
+        self.body = body
+
+    def execute(self, environment: Environment):
+        pair = len(self.var_names) == 2
+        items = loop_items(ExpressionEvaluator.evaluate(self.iterable_expr, environment), pair)
+
+        slots = self.slots
+        for item in items:
+            if pair:
+                if slots is None:
+                    environment.set_variable(self.var_names[0], item[0])
+                    environment.set_variable(self.var_names[1], item[1])
+                else:
+                    environment.set_local(slots[0], item[0])
+                    environment.set_local(slots[1], item[1])
+            elif slots is None:
+                environment.set_variable(self.var_names[0], item)
+            else:
+                environment.set_local(slots[0], item)
+
+            for instruction in self.body:
+                status = instruction.execute(environment)
+                if status is not None:
+                    break
+            else:
+                continue
+            if status == BREAK:
+                break # Sort de la boucle
+            if status != CONTINUE:
+                return status # RETURN ou TAIL_CALL : remonte à la fonction
 
 
 class IfInstruction(Instruction):
-    def __init__(self, condition: Any, true_body: List[Any], false_body: List[Any] = None):
+    expression_fields = ('condition',)
+    block_fields = ('true_body', 'false_body')
+
+    def __init__(self, condition: Any, true_body: List[Instruction], false_body: List[Instruction] = None):
         self.condition = condition
         self.true_body = true_body
         self.false_body = false_body if false_body is not None else []
 
     def execute(self, environment: Environment):
-        from jsonscript.factory import InstructionFactory
-
         # Evaluate the condition (expecting a boolean result)
         if ExpressionEvaluator.evaluate(self.condition, environment):
             # Execute the 'true' block
-            for raw_instruction in self.true_body:
-                InstructionFactory.build(raw_instruction).execute(environment)
+            body = self.true_body
         else:
             # Execute the 'else' block if it exists
-            if self.false_body:
-                for raw_instruction in self.false_body:
-                    InstructionFactory.build(raw_instruction).execute(environment)
+            body = self.false_body
+
+        for instruction in body:
+            status = instruction.execute(environment)
+            if status is not None:
+                return status
 
 
 class PushInstruction(Instruction):
+    expression_fields = ('target_expression', 'value_expression')
+
     def __init__(self, target_expression: Any, value_expression: Any):
         self.target_expression = target_expression
         self.value_expression = value_expression
@@ -176,6 +311,8 @@ class PushInstruction(Instruction):
 
 
 class PutInstruction(Instruction):
+    expression_fields = ('target_expression', 'key_expression', 'value_expression')
+
     def __init__(self, target_expression: Any, key_expression: Any, value_expression: Any):
         self.target_expression = target_expression
         self.key_expression = key_expression
@@ -184,7 +321,7 @@ class PutInstruction(Instruction):
     def execute(self, environment: Environment):
         # 1. Get the dict object
         target_dict = ExpressionEvaluator.evaluate(self.target_expression, environment)
-        if not isinstance(target_dict, dict):
+        if not isinstance(target_dict, MutableMapping):
             raise ValueError(f"Put error: Target is not a dictionary. Got {type(target_dict)}.")
         
         # 2. Resolve Key and Value
@@ -196,6 +333,8 @@ class PutInstruction(Instruction):
 
 
 class InputInstruction(Instruction):
+    slot = None
+
     def __init__(self, var_name: str, prompt: str):
         self.var_name = var_name
         self.prompt = prompt
@@ -212,43 +351,51 @@ class InputInstruction(Instruction):
             except ValueError:
                 pass # Keep as string
                 
-        environment.set_variable(self.var_name, user_input)
+        if self.slot is None:
+            environment.set_variable(self.var_name, user_input)
+        else:
+            environment.set_local(self.slot, user_input)
 
 
 class ImportInstruction(Instruction):
-    def __init__(self, path_expression):
+    """
+    ["import", "lib.jss"] runs the module's top-level code in the current
+    globals; ["import", "lib.jss", "m"] runs it in its own environment and
+    binds m to its ModuleNamespace. Either way a module runs at most once:
+    repeated imports (loops, diamonds) only look the registry up.
+    """
+    expression_fields = ('path_expression',)
+    slot = None
+
+    def __init__(self, path_expression, alias: str = None):
         self.path_expression = path_expression
+        self.alias = alias
 
     def execute(self, env):
-        # 1. On résout le chemin du fichier
+        # 1. On résout le chemin du fichier (dossier de l'importeur, cwd, puis JSONSCRIPT_PATH)
         filename = str(ExpressionEvaluator.evaluate(self.path_expression, env))
         
-        # Imports locaux pour éviter les cycles
-        from jsonscript.factory import InstructionFactory
-        
         try:
-            raw_instructions = []
-
-            # --- CAS 1 : Fichier JSS  ---
-            if filename.endswith(".jss"):
-                from jsonscript.compiler import JSSCompiler # Import local du compilateur
-                with open(filename, "r", encoding="utf-8") as f:
-                    source_code = f.read()
-                
-                # On compile à la volée
-                compiler = JSSCompiler()
-                raw_instructions = compiler.compile(source_code)
-
-            # --- CAS 2 : Fichier JSON (Legacy) ---
+            path = env.modules.resolve(filename, env.current_module)
+
+            if self.alias is None:
+                if path not in env.imported:
+                    # Marqué avant l'exécution : un import circulaire s'arrête là
+                    env.imported.add(path)
+                    self._run_module(path, env)
+                return
+
+            namespace = env.modules.namespaces.get(path)
+            if namespace is None:
+                module_env = env.module_environment(path)
+                namespace = env.modules.namespaces[path] = ModuleNamespace(path, module_env)
+                module_env.imported.add(path)
+                self._run_module(path, module_env)
+
+            if self.slot is None:
+                env.set_variable(self.alias, namespace)
             else:
-                import json
-                with open(filename, "r", encoding="utf-8") as f:
-                    raw_instructions = json.load(f)
-                print(f"DEBUG: Importing JSON module '{filename}'...")
-            
-            # 3. Exécution des instructions importées dans l'environnement actuel
-            for raw_item in raw_instructions:
-                InstructionFactory.build(raw_item).execute(env)
+                env.set_local(self.slot, namespace)
 
         except FileNotFoundError:
             print(f"Import Error: File '{filename}' not found.")
@@ -256,38 +403,66 @@ class ImportInstruction(Instruction):
             # Affiche l'erreur complète pour le debug
             print(f"Import Error in '{filename}': {e}")
 
+    @staticmethod
+    def _run_module(path: str, env: Environment) -> None:
+        # Import local pour éviter les cycles
+        from jsonscript.factory import InstructionFactory
+
+        instructions = InstructionFactory.build_block(env.modules.load_raw(path))
+        if env.resolver is not None:
+            env.resolver.resolve(instructions)
+
+        importer = env.current_module
+        env.current_module = path
+        # Le module s'exécute dans les globales, même importé depuis le corps d'une fonction
+        outer = env.enter_globals()
+        try:
+            for instruction in instructions:
+                if env.expression_compiler is not None:
+                    instruction.compile_expressions(env.expression_compiler)
+                if instruction.execute(env) is not None:
+                    break # return / break hors fonction : fin du module
+        finally:
+            env.exit_globals(outer)
+            env.current_module = importer
+
 
 class TryCatchInstruction(Instruction):
-    def __init__(self, try_body: List[Any], error_var_name: str, catch_body: List[Any]):
+    block_fields = ('try_body', 'catch_body')
+    slot = None
+
+    def __init__(self, try_body: List[Instruction], error_var_name: str, catch_body: List[Instruction]):
         self.try_body = try_body
         self.error_var_name = error_var_name
         self.catch_body = catch_body
 
     def execute(self, environment: Environment):
-        # Local import to avoid circular dependency
-        from .factory import InstructionFactory
-
         try:
             # 1. Attempt to execute the instructions in the 'try' block
-            for raw_instruction in self.try_body:
-                InstructionFactory.build(raw_instruction).execute(environment)
-
-        except ReturnValue:
-            # CRITICAL: If a return happens inside the try block, 
-            # we must NOT catch it as an error. We let it bubble up.
-            raise
+            # (return / break / continue are statuses, not errors: they go through)
+            for instruction in self.try_body:
+                status = instruction.execute(environment)
+                if status is not None:
+                    return status
 
         except Exception as e:
             # 2. If an error occurs (DivByZero, FileNotFoud, etc.)
             # Store the error message in a variable
-            environment.set_variable(self.error_var_name, str(e))
+            if self.slot is None:
+                environment.set_variable(self.error_var_name, str(e))
+            else:
+                environment.set_local(self.slot, str(e))
             
             # 3. Execute the 'catch' block
-            for raw_instruction in self.catch_body:
-                InstructionFactory.build(raw_instruction).execute(environment)
+            for instruction in self.catch_body:
+                status = instruction.execute(environment)
+                if status is not None:
+                    return status
 
 
 class SleepInstruction(Instruction):
+    expression_fields = ('duration_expression',)
+
     def __init__(self, duration_expression: Any):
         self.duration_expression = duration_expression
 
@@ -308,16 +483,24 @@ class ClassDefInstruction(Instruction):
         # On nettoie un peu le format des méthodes pour qu'il soit uniforme
         clean_methods = {}
         for method_name, method_data in self.methods.items():
-            # method_data est une liste [ [params], [body] ]
+            # method_data est une liste [ [params], [body compilé] ] (+ taille de frame si résolue)
             clean_methods[method_name] = {
                 "params": method_data[0],
-                "body": method_data[1]
+                "body": method_data[1],
+                "frame_size": method_data[2] if len(method_data) > 2 else None
             }
             
         environment.define_class(self.name, self.init_params, clean_methods, self.parent_name)
 
+    def compile_expressions(self, compiler) -> None:
+        for method_data in self.methods.values():
+            for instruction in method_data[1]:
+                instruction.compile_expressions(compiler)
+
 
 class CallMethodInstruction(Instruction):
+    expression_fields = ('raw_expression',)
+
     def __init__(self, raw_expression: List[Any]):
         self.raw_expression = raw_expression
 
@@ -327,6 +510,8 @@ class CallMethodInstruction(Instruction):
         ExpressionEvaluator.evaluate(self.raw_expression, environment)
 
 class SetAttrInstruction(Instruction):
+    expression_fields = ('raw_expression',)
+
     def __init__(self, raw_expression: List[Any]):
         self.raw_expression = raw_expression
 
@@ -336,6 +521,8 @@ class SetAttrInstruction(Instruction):
 
 
 class ThrowInstruction(Instruction):
+    expression_fields = ('message_expression',)
+
     def __init__(self, message_expression: Any):
         self.message_expression = message_expression
 
@@ -347,6 +534,8 @@ class ThrowInstruction(Instruction):
         raise RuntimeError(msg)
 
 class AssertInstruction(Instruction):
+    expression_fields = ('condition', 'error_message')
+
     def __init__(self, condition: Any, error_message: Any):
         self.condition = condition
         self.error_message = error_message
@@ -359,15 +548,15 @@ class AssertInstruction(Instruction):
 
 
 class SwitchInstruction(Instruction):
-    def __init__(self, test_expr: Any, cases: List[List[Any]], default_block: List[Any] = None):
+    expression_fields = ('test_expr',)
+    block_fields = ('default_block',)
+
+    def __init__(self, test_expr: Any, cases: List[List[Any]], default_block: List[Instruction] = None):
         self.test_expr = test_expr
-        self.cases = cases # Liste de paires [ [valeur_declencheur, [instructions]], ... ]
+        self.cases = cases # Liste de paires [ [valeur_declencheur, [instructions compilées]], ... ]
         self.default_block = default_block if default_block is not None else []
 
     def execute(self, environment: Environment):
-        # Local import
-        from .factory import InstructionFactory
-
         # 1. On évalue la valeur qu'on teste (ex: "admin")
         test_val = ExpressionEvaluator.evaluate(self.test_expr, environment)
         
@@ -384,14 +573,25 @@ class SwitchInstruction(Instruction):
             if test_val == case_val:
                 match_found = True
                 # Exécution du bloc correspondant
-                for raw_inst in case_body:
-                    InstructionFactory.build(raw_inst).execute(environment)
+                for instruction in case_body:
+                    status = instruction.execute(environment)
+                    if status is not None:
+                        return status
                 return # On sort du switch (comportement moderne)
 
         # 3. Si aucun cas ne correspond, on lance le default
         if not match_found and self.default_block:
-            for raw_inst in self.default_block:
-                InstructionFactory.build(raw_inst).execute(environment)
+            for instruction in self.default_block:
+                status = instruction.execute(environment)
+                if status is not None:
+                    return status
+
+    def compile_expressions(self, compiler) -> None:
+        super().compile_expressions(compiler)
+        for case_entry in self.cases:
+            case_entry[0] = compiler.compile(case_entry[0])
+            for instruction in case_entry[1]:
+                instruction.compile_expressions(compiler)
 
 
 class ExpressionInstruction(Instruction):
@@ -399,6 +599,8 @@ class ExpressionInstruction(Instruction):
     Executes a standalone expression (e.g. ["fs_mkdir", "path"] or ["exec", "cmd"]).
     Useful for native commands that have side effects but no return value capture.
     """
+    expression_fields = ('raw_expression',)
+
     def __init__(self, raw_expression: List[Any]):
         self.raw_expression = raw_expression
 
@@ -0,0 +1,60 @@
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+
+DEFAULT_MEMO_SIZE = 128
+
+
+class MemoCache:
+    """
+    Bounded LRU cache of a memoized script function, keyed by its resolved arguments
+    and their types (1, 1.0 and true are distinct calls). Calls with an unhashable
+    argument (list, dict...) bypass the cache.
+    """
+
+    def __init__(self, max_size: Optional[int] = None):
+        max_size = DEFAULT_MEMO_SIZE if max_size is None else int(max_size)
+        if max_size < 1:
+            raise ValueError(f"Invalid memo size: {max_size}")
+        self.max_size = max_size
+        self._entries: 'OrderedDict[Tuple, Any]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bypassed = 0
+
+    def key(self, args: List[Any]) -> Optional[Tuple]:
+        """Cache key of a call, None if an argument is unhashable."""
+        key = tuple([(type(arg), arg) for arg in args])
+        try:
+            hash(key)
+        except TypeError:
+            self.bypassed += 1
+            return None
+        return key
+
+    def lookup(self, key: Tuple) -> Tuple[bool, Any]:
+        entries = self._entries
+        if key in entries:
+            entries.move_to_end(key)
+            self.hits += 1
+            return True, entries[key]
+        self.misses += 1
+        return False, None
+
+    def store(self, key: Tuple, value: Any) -> None:
+        entries = self._entries
+        entries[key] = value
+        if len(entries) > self.max_size:
+            entries.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "bypassed": self.bypassed,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+        }
@@ -0,0 +1,80 @@
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+
+# Dossiers de recherche supplémentaires des imports, séparés par os.pathsep (comme PYTHONPATH)
+PATH_ENV_VAR = "JSONSCRIPT_PATH"
+
+
+class ModuleNamespace:
+    """
+    Value bound by ["import", "x.jss", "m"]: the module ran once in its own
+    Environment, whose functions are called with m.f(...) (call_method) and
+    whose global variables are read with m.name (get_attr).
+    """
+    __slots__ = ("path", "env")
+
+    def __init__(self, path: str, env: Any):
+        self.path = path
+        self.env = env
+
+    def call(self, name: str, resolved_args: List[Any]) -> Any:
+        from jsonscript.handlers.core import call_function
+        func_def = self.env._functions.get(name)
+        if func_def is None:
+            raise ValueError(f"Module '{self.path}' has no function '{name}'.")
+        return call_function(self.env, name, func_def, resolved_args)
+
+    def get_member(self, name: str) -> Any:
+        globals_ = self.env._scopes[0]
+        if name not in globals_:
+            raise ValueError(f"Module '{self.path}' has no member '{name}'.")
+        return globals_[name]
+
+    def __repr__(self):
+        return f"<module '{self.path}'>"
+
+
+class ModuleRegistry:
+    """
+    Modules of a program, keyed by resolved absolute path.
+
+    Shared by the main Environment and the environments of namespaced modules.
+    Each Environment also records in `imported` the paths already executed
+    into its own globals, so a plain import runs once per environment and a
+    namespaced import once per program.
+    """
+
+    def __init__(self, search_path: Optional[List[str]] = None):
+        if search_path is None:
+            search_path = [p for p in os.environ.get(PATH_ENV_VAR, "").split(os.pathsep) if p]
+        self.search_path = search_path
+        self.namespaces: Dict[str, ModuleNamespace] = {}
+
+    def resolve(self, filename: str, importer: Optional[str] = None) -> str:
+        """
+        Absolute path of an imported file. Relative names are looked up in the
+        importing file's directory, then the working directory, then JSONSCRIPT_PATH.
+        """
+        if os.path.isabs(filename):
+            candidates = [filename]
+        else:
+            directories = [os.path.dirname(os.path.abspath(importer))] if importer else []
+            directories.append(os.getcwd())
+            directories.extend(self.search_path)
+            candidates = [os.path.join(directory, filename) for directory in directories]
+
+        for candidate in candidates:
+            if os.path.isfile(candidate):
+                return os.path.normpath(os.path.abspath(candidate))
+        raise FileNotFoundError(filename)
+
+    @staticmethod
+    def load_raw(path: str) -> List[Any]:
+        """Raw instructions of a module (.jss compiled through the AST cache, .json loaded)."""
+        if path.endswith(".jss"):
+            from jsonscript.ast_cache import load_jss
+            return load_jss(path)
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
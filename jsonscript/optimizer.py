@@ -0,0 +1,185 @@
+from typing import Any, Dict, List
+from jsonscript.environment import Environment
+from jsonscript.evaluator import ExpressionEvaluator
+
+
+# Commandes sans effet de bord : évaluables à la compilation quand leurs arguments sont littéraux
+PURE_COMMANDS = frozenset({
+    "+", "-", "*", "/", "%",
+    "==", "!=", "<", ">", "<=", ">=",
+    "sqrt", "pow", "abs", "round", "floor", "ceil", "PI", "to_int", "min", "max",
+    "concat", "upper", "lower", "trim", "replace", "substring",
+    "contains", "index_of", "starts_with", "ends_with",
+})
+
+# Instructions après lesquelles le reste du bloc est inatteignable
+TERMINATORS = frozenset({"return", "break", "continue", "throw"})
+
+SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+class ASTOptimizer:
+    """
+    Optimisation du JSON brut, entre JSSCompiler.compile et InstructionFactory.build.
+
+    -O0 : aucune transformation.
+    -O1 : suppression des commentaires, repli des expressions pures constantes
+          (["+", 1, 2] -> 3, concaténations de littéraux...).
+    -O2 : -O1 + élimination des branches mortes (if / while / switch / assert
+          à condition littérale) et des instructions inatteignables.
+    """
+
+    def __init__(self, level: int = 1):
+        if level not in (0, 1, 2):
+            raise ValueError(f"Invalid optimization level: {level}")
+        self.level = level
+        self.stats: Dict[str, int] = {
+            "folded_expressions": 0,
+            "removed_comments": 0,
+            "removed_branches": 0,
+            "removed_unreachable": 0,
+        }
+        self._scratch_env = Environment()
+
+    def optimize(self, raw_program: List[Any]) -> List[Any]:
+        if self.level == 0:
+            return raw_program
+        return self.optimize_block(raw_program)
+
+    def report(self) -> str:
+        stats = self.stats
+        return (
+            f"Optimizer (-O{self.level}): "
+            f"folded {stats['folded_expressions']} constant expression(s), "
+            f"removed {stats['removed_comments']} comment(s), "
+            f"{stats['removed_branches']} dead branch(es), "
+            f"{stats['removed_unreachable']} unreachable statement(s)."
+        )
+
+    # --- Blocs ---
+    def optimize_block(self, block: List[Any]) -> List[Any]:
+        result = []
+        for index, raw in enumerate(block):
+            result.extend(self.optimize_statement(raw))
+
+            if self.level >= 2 and raw and raw[0] in TERMINATORS and index + 1 < len(block):
+                self.stats["removed_unreachable"] += len(block) - index - 1
+                break
+        return result
+
+    def optimize_statement(self, raw: List[Any]) -> List[Any]:
+        """Returns the list of statements replacing `raw` (empty if removed)."""
+        command = raw[0]
+
+        if command == "comment":
+            self.stats["removed_comments"] += 1
+            return []
+
+        if command == "set" and len(raw) >= 3:
+            return [["set", raw[1], self.optimize_expression(raw[2])]]
+
+        if command == "function" and len(raw) >= 4:
+            return [["function", raw[1], raw[2], self.optimize_block(raw[3]), *raw[4:]]]
+
+        if command == "while" and len(raw) >= 3:
+            condition = self.optimize_expression(raw[1])
+            if self.level >= 2 and self._is_literal(condition) and not condition:
+                self.stats["removed_branches"] += 1
+                return []
+            return [["while", condition, self.optimize_block(raw[2])]]
+
+        if command == "for_range" and len(raw) >= 6:
+            bounds = [self.optimize_expression(expr) for expr in raw[2:5]]
+            return [["for_range", raw[1], *bounds, self.optimize_block(raw[5])]]
+
+        if command == "for_each" and len(raw) >= 4:
+            return [["for_each", raw[1], self.optimize_expression(raw[2]), self.optimize_block(raw[3])]]
+
+        if command == "if" and len(raw) >= 3:
+            condition = self.optimize_expression(raw[1])
+            true_body = self.optimize_block(raw[2])
+            false_body = self.optimize_block(raw[3]) if len(raw) > 3 else []
+
+            if self.level >= 2 and self._is_literal(condition):
+                self.stats["removed_branches"] += 1
+                return true_body if condition else false_body
+
+            return [["if", condition, true_body, false_body]] if false_body else [["if", condition, true_body]]
+
+        if command == "try" and len(raw) >= 4:
+            return [["try", self.optimize_block(raw[1]), raw[2], self.optimize_block(raw[3])]]
+
+        if command == "class" and len(raw) >= 4:
+            methods = {
+                method_name: [method_data[0], self.optimize_block(method_data[1])]
+                for method_name, method_data in raw[3].items()
+            }
+            return [["class", raw[1], raw[2], methods, *raw[4:]]]
+
+        if command == "assert" and len(raw) >= 3:
+            condition = self.optimize_expression(raw[1])
+            if self.level >= 2 and self._is_literal(condition) and condition:
+                self.stats["removed_branches"] += 1
+                return []
+            return [["assert", condition, self.optimize_expression(raw[2])]]
+
+        if command == "switch" and len(raw) >= 3:
+            return self.optimize_switch(raw)
+
+        if command in ("input", "break", "continue"):
+            return [raw]
+
+        # print, return, push, put, import, sleep, throw et expressions utilisées comme instructions :
+        # tous leurs arguments sont des expressions
+        if isinstance(command, str) and ExpressionEvaluator.lookup(command) is None:
+            return [[command, *[self.optimize_expression(arg) for arg in raw[1:]]]]
+
+        return [self.optimize_expression(raw)]
+
+    def optimize_switch(self, raw: List[Any]) -> List[Any]:
+        test_expr = self.optimize_expression(raw[1])
+        cases = [
+            [self.optimize_expression(case_val), self.optimize_block(case_body)]
+            for case_val, case_body in raw[2]
+        ]
+        default_block = self.optimize_block(raw[3]) if len(raw) > 3 else []
+
+        if self.level >= 2 and self._is_literal(test_expr) and all(self._is_literal(case[0]) for case in cases):
+            self.stats["removed_branches"] += 1
+            for case_val, case_body in cases:
+                if test_expr == case_val:
+                    return case_body
+            return default_block
+
+        return [["switch", test_expr, cases, default_block]]
+
+    # --- Expressions ---
+    @staticmethod
+    def _is_literal(expression: Any) -> bool:
+        return isinstance(expression, SCALAR_TYPES)
+
+    def optimize_expression(self, expression: Any) -> Any:
+        if not isinstance(expression, list) or not expression:
+            return expression
+
+        command = expression[0]
+        if command == "lambda" and len(expression) >= 2:
+            return ["lambda", *expression[1:-1], self.optimize_expression(expression[-1])]
+        if not isinstance(command, str) or ExpressionEvaluator.lookup(command) is None:
+            # Liste de données brute : laissée intacte (elle n'est jamais évaluée)
+            return expression
+
+        args = [self.optimize_expression(arg) if isinstance(arg, list) else arg for arg in expression[1:]]
+        optimized = [command, *args]
+
+        if command in PURE_COMMANDS and all(self._is_literal(arg) for arg in args):
+            try:
+                value = ExpressionEvaluator.evaluate(optimized, self._scratch_env)
+            except Exception:
+                # Erreur (ex: division par zéro) : on la laisse se produire à l'exécution
+                return optimized
+            if self._is_literal(value):
+                self.stats["folded_expressions"] += 1
+                return value
+
+        return optimized
@@ -0,0 +1,156 @@
+from typing import Any, Dict, Iterator, List
+from jsonscript.evaluator import ExpressionEvaluator
+from jsonscript.instructions import (
+    ClassDefInstruction,
+    ForEachInstruction,
+    ForRangeInstruction,
+    FunctionDefInstruction,
+    ImportInstruction,
+    InputInstruction,
+    Instruction,
+    PrintInstruction,
+    SetInstruction,
+    SwitchInstruction,
+    TailCallInstruction,
+    TryCatchInstruction,
+)
+
+
+# Modes de portée acceptés par JsonScript.run / main.py --scoping
+SCOPING_MODES = ("lexical", "dynamic")
+DEFAULT_SCOPING = "lexical"
+
+
+class Resolver:
+    """
+    Lexical resolution pass over built instructions (tree and closure engines).
+
+    Inside each function and method body, every variable that is a parameter or
+    assigned in the body gets a slot index in an array-backed frame:
+      - ["get", name] becomes ["local", slot, name],
+      - set / for_range / input / try / import ... as write to `instruction.slot`
+        (for_each to `instruction.slots`, one per loop variable),
+      - the definition records the frame size so calls use Environment.push_frame.
+
+    JsonScript has no closures, so a reference is either a slot of the current
+    frame or a global: other names keep the by-name lookup, and a function no
+    longer sees its caller's locals. Without this pass (dynamic mode) every
+    call opens a dict scope as before.
+    """
+
+    def resolve(self, instructions: List[Instruction]) -> None:
+        for instruction in self._walk(instructions):
+            if isinstance(instruction, FunctionDefInstruction):
+                instruction.frame_size = self._resolve_function(instruction.params, instruction.body)
+            elif isinstance(instruction, ClassDefInstruction):
+                for method_data in instruction.methods.values():
+                    # Slot 0 : this
+                    frame_size = self._resolve_function(["this", *method_data[0]], method_data[1])
+                    del method_data[2:]
+                    method_data.append(frame_size)
+
+    # --- Parcours ---
+    @staticmethod
+    def _blocks(instruction: Instruction) -> Iterator[List[Instruction]]:
+        """Nested blocks executed in the same frame (function and method bodies excluded)."""
+        if isinstance(instruction, (FunctionDefInstruction, ClassDefInstruction)):
+            return
+        for field in instruction.block_fields:
+            yield getattr(instruction, field)
+        if isinstance(instruction, SwitchInstruction):
+            for case_entry in instruction.cases:
+                yield case_entry[1]
+
+    def _walk(self, block: List[Instruction]) -> Iterator[Instruction]:
+        """Every instruction of the block, nested blocks included, in the same frame."""
+        for instruction in block:
+            yield instruction
+            for nested in self._blocks(instruction):
+                yield from self._walk(nested)
+
+    # --- Résolution d'une fonction ---
+    def _resolve_function(self, params: List[str], body: List[Instruction]) -> int:
+        slots: Dict[str, int] = {}
+        for name in params:
+            slots.setdefault(name, len(slots))
+
+        instructions = list(self._walk(body))
+        for instruction in instructions:
+            for name in self._assigned_names(instruction):
+                slots.setdefault(name, len(slots))
+
+        for instruction in instructions:
+            if isinstance(instruction, ForEachInstruction):
+                instruction.slots = [slots[name] for name in instruction.var_names]
+            else:
+                name = self._assigned_name(instruction)
+                if name is not None:
+                    instruction.slot = slots[name]
+            self._rewrite_expressions(instruction, slots)
+        # (les paramètres des lambdas ont pu ajouter des slots)
+
+        # Fonctions et classes définies dans le corps : résolues avec leur propre frame
+        self.resolve([i for i in instructions if isinstance(i, (FunctionDefInstruction, ClassDefInstruction))])
+        return len(slots)
+
+    @classmethod
+    def _assigned_names(cls, instruction: Instruction) -> List[str]:
+        if isinstance(instruction, ForEachInstruction):
+            return instruction.var_names
+        name = cls._assigned_name(instruction)
+        return [] if name is None else [name]
+
+    @staticmethod
+    def _assigned_name(instruction: Instruction) -> Any:
+        if isinstance(instruction, SetInstruction):
+            return instruction.name
+        if isinstance(instruction, (ForRangeInstruction, InputInstruction)):
+            return instruction.var_name
+        if isinstance(instruction, TryCatchInstruction):
+            return instruction.error_var_name
+        if isinstance(instruction, ImportInstruction):
+            return instruction.alias
+        return None
+
+    def _rewrite_expressions(self, instruction: Instruction, slots: Dict[str, int]) -> None:
+        if isinstance(instruction, (FunctionDefInstruction, ClassDefInstruction)):
+            return
+        for field in instruction.expression_fields:
+            setattr(instruction, field, self._rewrite(getattr(instruction, field), slots))
+        if isinstance(instruction, (PrintInstruction, TailCallInstruction)):
+            instruction.args = [self._rewrite(arg, slots) for arg in instruction.args]
+        elif isinstance(instruction, SwitchInstruction):
+            for case_entry in instruction.cases:
+                case_entry[0] = self._rewrite(case_entry[0], slots)
+
+    def _rewrite(self, expression: Any, slots: Dict[str, int], names: Dict[str, int] = None) -> Any:
+        """
+        `slots` is the function's slot table (new slots are allocated there),
+        `names` the visible names when they differ (inside a lambda).
+        """
+        if not isinstance(expression, list) or not expression:
+            return expression
+        if names is None:
+            names = slots
+
+        command = expression[0]
+        if command == "lambda" and len(expression) >= 2:
+            # ["lambda", "x", body] -> ["lambda", slot, body] : les paramètres prennent de nouveaux slots
+            # de la frame englobante, le corps voit aussi les locaux de la fonction
+            inner = dict(names)
+            params = []
+            for name in expression[1:-1]:
+                slot = len(slots)
+                slots[f"<lambda>{slot}"] = slot # Nom impossible en JsonScript : slot réservé
+                inner[name] = slot
+                params.append(slot)
+            return ["lambda", *params, self._rewrite(expression[-1], slots, inner)]
+
+        if not isinstance(command, str) or ExpressionEvaluator.lookup(command) is None:
+            # Liste de données brute : jamais évaluée, laissée intacte
+            return expression
+
+        if command == "get" and len(expression) > 1 and isinstance(expression[1], str) and expression[1] in names:
+            return ["local", names[expression[1]], expression[1]]
+
+        return [command, *[self._rewrite(arg, slots, names) for arg in expression[1:]]]
@@ -1,25 +1,71 @@
 import json
-from typing import List, Optional
+from typing import Any, Callable, Iterable, Iterator, List, Optional
 from jsonscript.environment import Environment
 from jsonscript.instructions import Instruction
 from jsonscript.factory import InstructionFactory
-from jsonscript.exceptions import ReturnValue
+from jsonscript.signals import RETURN, outside_loop_error
+from jsonscript.resolver import Resolver, DEFAULT_SCOPING, SCOPING_MODES
+from jsonscript.inline_cache import CallSiteCompiler
+from jsonscript.streaming import iter_json_array
+
+
+# Moteurs d'évaluation des expressions disponibles
+ENGINES = ("tree", "closure")
 
 
 class JsonScript:
-    def __init__(self, instructions: List[Instruction]):
+    def __init__(self, instructions: Iterable[Instruction], filename: Optional[str] = None):
         self.instructions = instructions
+        # Fichier source du programme : les imports relatifs partent de son dossier
+        self.filename = filename
+
+    def run(self, environment: Optional[Environment] = None, engine: str = "tree", scoping: str = DEFAULT_SCOPING) -> Environment:
+        """
+        Executes the program.
+
+        :param engine: "tree" walks the raw JSON expressions (default),
+                       "closure" compiles every expression into Python closures first.
+        :param scoping: "lexical" resolves function locals to frame slots first (default, see Resolver),
+                        "dynamic" looks variables up by name through the scope stack (compatibility mode).
+        """
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine '{engine}'. Expected one of: {', '.join(ENGINES)}.")
+        if scoping not in SCOPING_MODES:
+            raise ValueError(f"Unknown scoping '{scoping}'. Expected one of: {', '.join(SCOPING_MODES)}.")
 
-    def run(self, environment: Optional[Environment] = None) -> Environment:
         env = environment if environment is not None else Environment()
+        if self.filename is not None:
+            env.current_module = self.filename
+
+        # La résolution réécrit les expressions brutes : elle passe avant leur compilation
+        if scoping == "lexical":
+            env.resolver = Resolver()
+
+        if engine == "closure":
+            from jsonscript.expression_compiler import ExpressionCompiler
+            env.expression_compiler = ExpressionCompiler()
+        else:
+            # Moteur "tree" : seuls les sites call_method sont compilés (caches d'appel)
+            env.expression_compiler = CallSiteCompiler()
 
         try:
+            # Une instruction de premier niveau est résolue et compilée juste avant de s'exécuter :
+            # un programme en flux (stream_file) n'est jamais entièrement en mémoire
             for i in self.instructions:
-                i.execute(env)
-        except ReturnValue:
-            print("Error: 'return' used outside of a function.")
+                if env.resolver is not None:
+                    env.resolver.resolve([i])
+                i.compile_expressions(env.expression_compiler)
+                status = i.execute(env)
+                if status == RETURN:
+                    print("Error: 'return' used outside of a function.")
+                    break
+                if status is not None:
+                    raise outside_loop_error(status)
         except Exception as e:
             print(f"Runtime Error: {e}")
+        finally:
+            # Fichiers laissés ouverts par file_open : vidés et fermés avec le programme
+            env.close_files()
 
         return env
     
@@ -28,8 +74,31 @@ class JsonScript:
         try:
             with open(filename, "r", encoding="utf-8") as f:
                 data = json.load(f)
-            return cls([InstructionFactory.build(x) for x in data])
+            return cls([InstructionFactory.build(x) for x in data], filename)
         except Exception as e:
             print(f"Loading Error: {e}")
             return cls([])
-        
\ No newline at end of file
+
+    @classmethod
+    def stream_file(cls, filename: str, transform: Optional[Callable[[Any], List[Any]]] = None) -> 'JsonScript':
+        """
+        Program whose top-level instructions are read, built and executed one at
+        a time while run() goes through the file: memory is bounded by the
+        largest single instruction. `transform` maps a raw instruction to the
+        list of raw instructions to build (e.g. an optimizer pass).
+
+        The instructions can be iterated once. A syntax error (or any error while
+        building an instruction) stops the program with a "Loading Error" after
+        the preceding instructions have run, as from_file reports it.
+        """
+        def instructions() -> Iterator[Instruction]:
+            try:
+                with open(filename, "r", encoding="utf-8") as f:
+                    for raw in iter_json_array(f):
+                        for built in (transform(raw) if transform is not None else [raw]):
+                            yield InstructionFactory.build(built)
+            except Exception as e:
+                # Les erreurs d'exécution naissent chez l'appelant, pas dans ce générateur
+                print(f"Loading Error: {e}")
+
+        return cls(instructions(), filename)
@@ -0,0 +1,17 @@
+"""
+Completion status returned by Instruction.execute.
+
+None means the instruction completed normally. Otherwise the enclosing loop
+or call checks the code, instead of catching a Python exception.
+"""
+
+BREAK = 1
+CONTINUE = 2
+RETURN = 3      # la valeur retournée est dans Environment.return_value
+TAIL_CALL = 4   # l'appel à effectuer est dans Environment.tail_call
+
+
+def outside_loop_error(status: int) -> RuntimeError:
+    """Error for a break / continue that reached a function or program boundary."""
+    keyword = "break" if status == BREAK else "continue"
+    return RuntimeError(f"'{keyword}' used outside of a loop.")
@@ -0,0 +1,111 @@
+import json
+from typing import Any, Iterator, TextIO
+
+
+# Taille des lectures du fichier source (en caractères)
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = _WHITESPACE + ",]"
+
+# Un littéral coupé par la fin du tampon ("tru", "-Infin") échoue sur son premier caractère :
+# une erreur plus loin de la fin que le plus long littéral n'est pas due à la coupure
+_LONGEST_LITERAL = len("-Infinity")
+
+
+def _may_be_truncated(error: json.JSONDecodeError, size: int) -> bool:
+    """True if the decoding error may come from an element cut by the end of the buffer."""
+    return error.msg.startswith("Unterminated string") or error.pos > size - _LONGEST_LITERAL
+
+
+def iter_json_array(stream: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Any]:
+    """
+    Yields the elements of the top-level JSON array read from `stream`, each
+    one as soon as it is complete.
+
+    Only the current element and one read chunk are kept in memory. Elements
+    are decoded with json.JSONDecoder.raw_decode; an element cut by the end of
+    the buffer is retried once more text has been read (the read size doubles
+    with the element, so a large element is decoded in amortized linear time).
+    Raises json.JSONDecodeError on malformed input, after yielding the
+    elements that precede the error: a malformed element is reported as soon
+    as the error is away from the end of the buffer, without reading the rest
+    of the file (an unterminated string is only known at end of file).
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    eof = False
+
+    def fill(min_size: int) -> bool:
+        """Appends at least `min_size` characters (fewer at end of file). False at end of file."""
+        nonlocal buffer, pos, eof
+        if eof:
+            return False
+        # On oublie la partie déjà consommée avant d'agrandir le tampon
+        buffer = buffer[pos:]
+        pos = 0
+        read = 0
+        while read < min_size:
+            chunk = stream.read(max(chunk_size, min_size - read))
+            if not chunk:
+                eof = True
+                break
+            buffer += chunk
+            read += len(chunk)
+        return read > 0
+
+    def skip_whitespace() -> bool:
+        """Moves `pos` to the next significant character. False at end of input."""
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            if pos < len(buffer):
+                return True
+            if not fill(chunk_size):
+                return False
+
+    def syntax_error(message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, buffer, pos)
+
+    if not skip_whitespace() or buffer[pos] != "[":
+        raise syntax_error("Expecting '[' (a program is a JSON array)")
+    pos += 1
+
+    if not skip_whitespace():
+        raise syntax_error("Unterminated array")
+    if buffer[pos] == "]":
+        return
+
+    while True:
+        # Décodage de l'élément courant, en relisant tant qu'il est coupé par la fin du tampon
+        while True:
+            try:
+                element, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError as error:
+                if _may_be_truncated(error, len(buffer)) and fill(max(chunk_size, len(buffer) - pos)):
+                    continue
+                raise
+            # Un nombre coupé par la fin du tampon ("12" puis "34", "1." puis "5") se décode aussi :
+            # il n'est complet que suivi d'un séparateur
+            if (isinstance(element, (int, float)) and (end == len(buffer) or buffer[end] not in _DELIMITERS)
+                    and fill(chunk_size)):
+                continue
+            break
+
+        pos = end
+        yield element
+
+        if not skip_whitespace():
+            raise syntax_error("Unterminated array")
+        if buffer[pos] == "]":
+            pos += 1
+            if skip_whitespace():
+                raise syntax_error("Extra data after the program array")
+            return
+        if buffer[pos] != ",":
+            raise syntax_error("Expecting ',' delimiter")
+        pos += 1
+        if not skip_whitespace():
+            raise syntax_error("Unterminated array")
@@ -0,0 +1,43 @@
+"""
+Bytecode backend for JsonScript.
+
+    from jsonscript.vm import run_program
+    run_program(JSSCompiler().compile(source))
+
+The raw JSON AST is compiled into flat bytecode (BytecodeCompiler) and
+executed by a dispatch loop with its own heap-allocated call stack
+(VirtualMachine). Native commands are delegated to the existing handlers.
+"""
+from typing import Any, List, Optional
+from jsonscript.environment import Environment
+from jsonscript.resolver import DEFAULT_SCOPING
+from jsonscript.vm.compiler import BytecodeCompiler, CodeObject, disassemble
+from jsonscript.vm.machine import VirtualMachine, VMFunction
+
+
+def run_program(raw_program: List[Any], environment: Optional[Environment] = None,
+                filename: Optional[str] = None, scoping: str = DEFAULT_SCOPING) -> Environment:
+    """Compiles and runs a raw program, reporting errors like JsonScript.run."""
+    env = environment if environment is not None else Environment()
+    if filename is not None:
+        env.current_module = filename
+
+    try:
+        code = BytecodeCompiler().compile_program(raw_program)
+        VirtualMachine(env, scoping).run(code)
+    except Exception as e:
+        print(f"Runtime Error: {e}")
+    finally:
+        env.close_files()
+
+    return env
+
+
+__all__ = [
+    "BytecodeCompiler",
+    "CodeObject",
+    "VirtualMachine",
+    "VMFunction",
+    "disassemble",
+    "run_program",
+]
@@ -0,0 +1,430 @@
+import operator
+from typing import Any, List, Optional
+from jsonscript.evaluator import ExpressionEvaluator
+from jsonscript.instructions import InputInstruction
+from jsonscript.vm import opcodes as op
+
+
+class CodeObject:
+    """A compiled body: flat bytecode plus the metadata needed to call it."""
+    __slots__ = ("name", "params", "code")
+
+    def __init__(self, name: str, params: List[str], code: List[Any]):
+        self.name = name
+        self.params = params
+        self.code = code
+
+    def __repr__(self):
+        return f"<CodeObject {self.name} ({len(self.code) // 2} ops)>"
+
+
+class _Loop:
+    """Compile-time context of the innermost loop (targets for break/continue)."""
+    __slots__ = ("continue_target", "break_jumps", "try_depth")
+
+    def __init__(self, continue_target: int, try_depth: int):
+        self.continue_target = continue_target
+        self.break_jumps: List[int] = []
+        self.try_depth = try_depth
+
+
+class BytecodeCompiler:
+    """
+    Compiles the raw JSON AST (output of JSSCompiler.compile or a .json program)
+    into CodeObjects for the VirtualMachine.
+
+    Function and method bodies are compiled once, when their definition is compiled.
+    """
+
+    _BINARY = {
+        "-": operator.sub,
+        "*": operator.mul,
+        "%": operator.mod,
+        "==": operator.eq,
+        "!=": operator.ne,
+        "<": operator.lt,
+        ">": operator.gt,
+        "<=": operator.le,
+        ">=": operator.ge,
+    }
+
+    def __init__(self, in_function: bool = False):
+        self.in_function = in_function
+        self.code: List[Any] = []
+        self._loops: List[_Loop] = []
+        self._try_depth = 0
+
+    # --- Points d'entrée ---
+    def compile_program(self, raw_program: List[Any], name: str = "<program>") -> CodeObject:
+        self.compile_block(raw_program)
+        self.emit(op.CONST, None)
+        self.emit(op.RETURN)
+        return CodeObject(name, [], self.code)
+
+    @staticmethod
+    def compile_function(name: str, params: List[str], body: List[Any]) -> CodeObject:
+        compiler = BytecodeCompiler(in_function=True)
+        compiler.compile_block(body)
+        compiler.emit(op.CONST, None)
+        compiler.emit(op.RETURN)
+        return CodeObject(name, params, compiler.code)
+
+    # --- Helpers ---
+    def emit(self, opcode: int, arg: Any = None) -> int:
+        self.code.append(opcode)
+        self.code.append(arg)
+        return len(self.code) - 2
+
+    def label(self) -> int:
+        return len(self.code)
+
+    def patch(self, index: int, target: Optional[int] = None) -> None:
+        self.code[index + 1] = self.label() if target is None else target
+
+    @staticmethod
+    def is_command(expression: Any) -> bool:
+        if not isinstance(expression, list) or not expression:
+            return False
+        command = expression[0]
+        return isinstance(command, str) and ExpressionEvaluator.lookup(command) is not None
+
+    # --- Statements ---
+    def compile_block(self, block: List[Any]) -> None:
+        for raw_instruction in block:
+            self.compile_statement(raw_instruction)
+
+    def compile_statement(self, raw: List[Any]) -> None:
+        command = raw[0]
+
+        if command == "comment":
+            return
+
+        if command == "set":
+            if len(raw) < 3:
+                raise ValueError("Invalid parameters for 'set'.")
+            self.compile_expression(raw[2])
+            self.emit(op.STORE, raw[1])
+            return
+
+        if command == "print":
+            for arg in raw[1:]:
+                self.compile_expression(arg)
+            self.emit(op.PRINT, len(raw) - 1)
+            return
+
+        if command == "function":
+            if len(raw) < 4:
+                raise ValueError("Invalid function definition.")
+            options = raw[4] if len(raw) > 4 else None
+            if options is not None and not isinstance(options, dict):
+                raise ValueError("Invalid function options: expected an object.")
+            code = BytecodeCompiler.compile_function(raw[1], raw[2], raw[3])
+            # Options {"memo": true, "memo_size": n} : la VM crée un cache neuf à chaque définition
+            memo_options = options if options and options.get("memo") else None
+            self.emit(op.MAKE_FUNCTION, (raw[1], code, memo_options))
+            return
+
+        if command == "return":
+            self.compile_expression(raw[1])
+            self.emit(op.RETURN, not self.in_function)
+            return
+
+        if command in ("break", "continue"):
+            self.compile_loop_exit(command)
+            return
+
+        if command == "while":
+            if len(raw) < 3: raise ValueError("Invalid while loop.")
+            self.compile_while(raw[1], raw[2])
+            return
+
+        if command == "for_range":
+            if len(raw) < 6: raise ValueError("Invalid for_range loop.")
+            self.compile_for_range(raw[1], raw[2], raw[3], raw[4], raw[5])
+            return
+
+        if command == "for_each":
+            if len(raw) < 4: raise ValueError("Invalid for_each loop.")
+            self.compile_for_each(raw[1] if isinstance(raw[1], list) else [raw[1]], raw[2], raw[3])
+            return
+
+        if command == "if":
+            if len(raw) < 3:
+                raise ValueError("Invalid 'if' instruction.")
+            self.compile_if(raw[1], raw[2], raw[3] if len(raw) > 3 else [])
+            return
+
+        if command == "push":
+            self.compile_expression(raw[1])
+            self.compile_expression(raw[2])
+            self.emit(op.APPEND)
+            return
+
+        if command == "put":
+            if len(raw) < 4:
+                raise ValueError("Invalid put.")
+            self.compile_expression(raw[1])
+            self.compile_expression(raw[2])
+            self.compile_expression(raw[3])
+            self.emit(op.PUT_ITEM)
+            return
+
+        if command == "input":
+            if len(raw) < 3:
+                raise ValueError("Invalid input.")
+            # La logique de conversion est partagée avec le moteur "tree"
+            self.emit(op.INPUT, InputInstruction(var_name=raw[1], prompt=raw[2]))
+            return
+
+        if command == "import":
+            if len(raw) > 2:
+                raise ValueError("Namespaced imports ('import ... as') are not supported by the vm engine.")
+            self.compile_expression(raw[1])
+            self.emit(op.IMPORT)
+            return
+
+        if command == "try":
+            if len(raw) < 4:
+                raise ValueError("Invalid try-catch block.")
+            self.compile_try(raw[1], raw[2], raw[3])
+            return
+
+        if command == "sleep":
+            if len(raw) < 2:
+                raise ValueError("Invalid sleep instruction.")
+            self.compile_expression(raw[1])
+            self.emit(op.SLEEP)
+            return
+
+        if command == "class":
+            if len(raw) < 4:
+                raise ValueError("Invalid class instruction")
+            methods = {
+                method_name: BytecodeCompiler.compile_function(method_name, method_data[0], method_data[1])
+                for method_name, method_data in raw[3].items()
+            }
+            parent = raw[4] if len(raw) > 4 else None
+            self.emit(op.MAKE_CLASS, (raw[1], raw[2], methods, parent))
+            return
+
+        if command == "throw":
+            self.compile_expression(raw[1])
+            self.emit(op.THROW)
+            return
+
+        if command == "assert":
+            if len(raw) < 3:
+                raise ValueError("Invalid assert.")
+            self.compile_expression(raw[1])
+            jump = self.emit(op.JUMP_IF_TRUE)
+            self.compile_expression(raw[2])
+            self.emit(op.ASSERT_FAIL)
+            self.patch(jump)
+            return
+
+        if command == "switch":
+            if len(raw) < 3:
+                raise ValueError("Invalid switch.")
+            self.compile_switch(raw[1], raw[2], raw[3] if len(raw) > 3 else [])
+            return
+
+        # Expression native utilisée comme instruction (call, call_method, set_attr, fs_mkdir...)
+        if isinstance(command, str):
+            self.compile_expression(raw)
+            self.emit(op.POP)
+            return
+
+        raise ValueError(f"Unknown command: {command}")
+
+    def compile_loop_exit(self, command: str) -> None:
+        if not self._loops:
+            self.emit(op.CONST, f"'{command}' used outside of a loop.")
+            self.emit(op.THROW)
+            return
+
+        loop = self._loops[-1]
+        # On quitte les blocs try ouverts depuis le début de la boucle
+        for _ in range(self._try_depth - loop.try_depth):
+            self.emit(op.POP_TRY)
+
+        if command == "break":
+            loop.break_jumps.append(self.emit(op.JUMP))
+        else:
+            self.emit(op.JUMP, loop.continue_target)
+
+    def compile_while(self, condition: Any, body: List[Any]) -> None:
+        start = self.label()
+        self.compile_expression(condition)
+        exit_jump = self.emit(op.JUMP_IF_FALSE)
+
+        loop = _Loop(start, self._try_depth)
+        self._loops.append(loop)
+        self.compile_block(body)
+        self._loops.pop()
+
+        self.emit(op.JUMP, start)
+        self.patch(exit_jump)
+        for jump in loop.break_jumps:
+            self.patch(jump)
+
+    def compile_for_range(self, var_name: str, start: Any, end: Any, step: Any, body: List[Any]) -> None:
+        self.compile_expression(start)
+        self.compile_expression(end)
+        self.compile_expression(step)
+        self.emit(op.FOR_RANGE)
+
+        head = self.label()
+        exit_jump = self.emit(op.FOR_ITER)
+        self.emit(op.STORE, var_name)
+
+        loop = _Loop(head, self._try_depth)
+        self._loops.append(loop)
+        self.compile_block(body)
+        self._loops.pop()
+
+        self.emit(op.JUMP, head)
+        # Sortie (fin normale ou break) : on retire l'itérateur de la pile
+        self.patch(exit_jump)
+        for jump in loop.break_jumps:
+            self.patch(jump)
+        self.emit(op.POP)
+
+    def compile_for_each(self, var_names: List[str], iterable: Any, body: List[Any]) -> None:
+        self.compile_expression(iterable)
+        self.emit(op.GET_ITER, len(var_names) == 2)
+
+        head = self.label()
+        exit_jump = self.emit(op.FOR_ITER)
+        if len(var_names) == 2:
+            self.emit(op.UNPACK_PAIR)
+        for name in var_names:
+            self.emit(op.STORE, name)
+
+        loop = _Loop(head, self._try_depth)
+        self._loops.append(loop)
+        self.compile_block(body)
+        self._loops.pop()
+
+        self.emit(op.JUMP, head)
+        self.patch(exit_jump)
+        for jump in loop.break_jumps:
+            self.patch(jump)
+        self.emit(op.POP)
+
+    def compile_if(self, condition: Any, true_body: List[Any], false_body: List[Any]) -> None:
+        self.compile_expression(condition)
+        else_jump = self.emit(op.JUMP_IF_FALSE)
+        self.compile_block(true_body)
+
+        if false_body:
+            end_jump = self.emit(op.JUMP)
+            self.patch(else_jump)
+            self.compile_block(false_body)
+            self.patch(end_jump)
+        else:
+            self.patch(else_jump)
+
+    def compile_try(self, try_body: List[Any], error_var_name: str, catch_body: List[Any]) -> None:
+        setup = self.emit(op.SETUP_TRY)
+        self._try_depth += 1
+        self.compile_block(try_body)
+        self._try_depth -= 1
+        self.emit(op.POP_TRY)
+        end_jump = self.emit(op.JUMP)
+
+        # Le message d'erreur est empilé par la VM avant de sauter ici
+        self.patch(setup)
+        self.emit(op.STORE, error_var_name)
+        self.compile_block(catch_body)
+        self.patch(end_jump)
+
+    def compile_switch(self, test_expr: Any, cases: List[List[Any]], default_block: List[Any]) -> None:
+        self.compile_expression(test_expr)
+        end_jumps = []
+
+        for case_val_expr, case_body in cases:
+            self.emit(op.DUP)
+            self.compile_expression(case_val_expr)
+            self.emit(op.BINARY, operator.eq)
+            next_jump = self.emit(op.JUMP_IF_FALSE)
+            self.emit(op.POP) # La valeur testée n'est plus utile
+            self.compile_block(case_body)
+            end_jumps.append(self.emit(op.JUMP))
+            self.patch(next_jump)
+
+        self.emit(op.POP)
+        self.compile_block(default_block)
+        for jump in end_jumps:
+            self.patch(jump)
+
+    # --- Expressions ---
+    def compile_expression(self, expression: Any) -> None:
+        if not self.is_command(expression):
+            # Littéral (ou liste de données brute), comme ExpressionEvaluator
+            self.emit(op.CONST, expression)
+            return
+
+        command = expression[0]
+        args = expression[1:]
+
+        if command not in ("call", "call_method") and not ExpressionEvaluator.is_builtin(command):
+            # Commande remplacée par register_command / register_handler : pas d'opcode dédié
+            # (les appels de fonctions et de méthodes restent ceux de la pile de la VM)
+            self.compile_native(command, args)
+            return
+
+        if command == "get":
+            if not args: raise ValueError("Invalid 'get' expression.")
+            self.emit(op.LOAD, args[0])
+            return
+
+        if command == "+":
+            self.compile_expression(args[0])
+            self.compile_expression(args[1])
+            self.emit(op.ADD)
+            return
+
+        if command == "/":
+            # Même ordre d'évaluation que MathHandler : le dénominateur d'abord
+            self.compile_expression(args[1])
+            self.compile_expression(args[0])
+            self.emit(op.DIV)
+            return
+
+        if command in self._BINARY:
+            self.compile_expression(args[0])
+            self.compile_expression(args[1])
+            self.emit(op.BINARY, self._BINARY[command])
+            return
+
+        if command == "call":
+            for arg in args[1:]:
+                self.compile_expression(arg)
+            self.emit(op.CALL, (args[0], len(args) - 1))
+            return
+
+        if command == "call_method":
+            self.compile_expression(args[0])
+            for arg in args[2:]:
+                self.compile_expression(arg)
+            self.emit(op.CALL_METHOD, (args[1], len(args) - 2))
+            return
+
+        self.compile_native(command, args)
+
+    def compile_native(self, command: str, args: List[Any]) -> None:
+        # Commande native : les arguments sont évalués par la VM puis passés au handler.
+        # Les noms littéraux (classe, attribut...) s'évaluent en eux-mêmes.
+        for arg in args:
+            self.compile_expression(arg)
+        self.emit(op.NATIVE, (ExpressionEvaluator.lookup(command), len(args)))
+
+
+def disassemble(code_object: CodeObject) -> str:
+    """Human readable listing of a CodeObject (debug helper)."""
+    lines = [f"{code_object!r} params={code_object.params}"]
+    code = code_object.code
+    for pc in range(0, len(code), 2):
+        arg = code[pc + 1]
+        lines.append(f"  {pc:>5}  {op.NAMES[code[pc]]:<14} {'' if arg is None else repr(arg)}")
+    return "\n".join(lines)
@@ -0,0 +1,458 @@
+import time
+from collections.abc import MutableMapping
+from typing import Any, List, Optional
+from jsonscript.classes import instance_class_name
+from jsonscript.environment import Environment
+from jsonscript.evaluator import ExpressionEvaluator
+from jsonscript.handlers.object import find_method
+from jsonscript.instructions import loop_items
+from jsonscript.memo import MemoCache
+from jsonscript.resolver import DEFAULT_SCOPING, SCOPING_MODES
+from jsonscript.vm.opcodes import (
+    ADD,
+    APPEND,
+    ASSERT_FAIL,
+    BINARY,
+    CALL,
+    CALL_METHOD,
+    CONST,
+    DIV,
+    DUP,
+    FOR_ITER,
+    FOR_RANGE,
+    GET_ITER,
+    IMPORT,
+    INPUT,
+    JUMP,
+    JUMP_IF_FALSE,
+    JUMP_IF_TRUE,
+    LOAD,
+    MAKE_CLASS,
+    MAKE_FUNCTION,
+    NATIVE,
+    POP,
+    POP_TRY,
+    PRINT,
+    PUT_ITEM,
+    RETURN,
+    SETUP_TRY,
+    SLEEP,
+    STORE,
+    THROW,
+    UNPACK_PAIR,
+)
+from jsonscript.vm.compiler import BytecodeCompiler, CodeObject
+
+
+# Types de frame
+PROGRAM = 0     # programme principal (pas de scope dédié)
+FUNCTION = 1    # fonction ou méthode (ouvre un scope)
+MODULE = 2      # fichier importé (exécuté dans le scope courant)
+
+
+def _identity(value: Any, env: Environment) -> Any:
+    """Evaluator given to handlers: the VM has already evaluated every argument."""
+    return value
+
+
+class Frame:
+    """An activation record, allocated on the VM's heap call stack."""
+    __slots__ = ("code", "pc", "stack", "try_blocks", "kind", "name", "memo", "outer")
+
+    def __init__(self, code: CodeObject, kind: int, name: Optional[str] = None):
+        self.code = code
+        self.pc = 0
+        self.stack: List[Any] = []
+        self.try_blocks: List[tuple] = []  # (adresse du catch, profondeur de pile)
+        self.kind = kind
+        self.name = name
+        self.memo = None # (MemoCache, clé) : résultat à mémoriser au RETURN
+        self.outer = None # Portées masquées pendant un module ou un appel lexical (Environment.enter_globals)
+
+
+class VMFunction:
+    """
+    Script function compiled to bytecode.
+    Registered as a native function so handlers (GUI callbacks...) can still call it.
+    `memo` is its MemoCache when the function is memoized.
+    """
+    __slots__ = ("vm", "code", "memo")
+
+    def __init__(self, vm: 'VirtualMachine', code: CodeObject, memo: Optional[MemoCache] = None):
+        self.vm = vm
+        self.code = code
+        self.memo = memo
+
+    def __call__(self, *args):
+        memo = self.memo
+        key = memo.key(args) if memo is not None else None
+        if key is not None:
+            found, cached = memo.lookup(key)
+            if found:
+                return cached
+        result = self.vm.call(self.code, list(args))
+        if key is not None:
+            memo.store(key, result)
+        return result
+
+
+class VirtualMachine:
+    """
+    Stack-based interpreter for CodeObjects.
+
+    JsonScript calls push a Frame on a heap-allocated list instead of recursing
+    in Python, so deep script recursion is bounded by memory, not by
+    sys.getrecursionlimit(). Variables still live in the Environment scopes.
+
+    With scoping="lexical" (default) a call only sees its own scope and the
+    globals, like the tree interpreter's slots; "dynamic" keeps the caller's
+    scopes visible.
+    """
+
+    def __init__(self, environment: Optional[Environment] = None, scoping: str = DEFAULT_SCOPING):
+        if scoping not in SCOPING_MODES:
+            raise ValueError(f"Unknown scoping '{scoping}'. Expected one of: {', '.join(SCOPING_MODES)}.")
+        self.env = environment if environment is not None else Environment()
+        self.lexical = scoping == "lexical"
+
+    # --- Points d'entrée ---
+    def run(self, code: CodeObject) -> Any:
+        return self._execute(Frame(code, PROGRAM))
+
+    def call(self, code: CodeObject, args: List[Any]) -> Any:
+        """Calls a compiled function from Python (re-entrant)."""
+        return self._execute(self._function_frame(code, args, None))
+
+    # --- Helpers ---
+    def _function_frame(self, code: CodeObject, args: List[Any], this: Any) -> Frame:
+        param_names = code.params
+        if len(args) != len(param_names):
+            raise ValueError(f"Function '{code.name}' expects {len(param_names)} args, got {len(args)}.")
+
+        env = self.env
+        frame = Frame(code, FUNCTION)
+        if self.lexical:
+            # Portées de l'appelant masquées jusqu'au retour (exit_globals)
+            frame.outer = env.enter_globals()
+        env.enter_scope()
+        if this is not None:
+            env.set_variable("this", this)
+        for name, val in zip(param_names, args):
+            env.set_variable(name, val)
+        return frame
+
+    def _exit_function(self, frame: Frame) -> None:
+        if frame.outer is not None:
+            self.env.exit_globals(frame.outer)
+        else:
+            self.env.exit_scope()
+
+    def _load_module(self, path: str) -> CodeObject:
+        return BytecodeCompiler().compile_program(self.env.modules.load_raw(path), name=path)
+
+    def _importer(self, frames: List[Frame]) -> Optional[str]:
+        """File whose top-level code is running: base of relative imports."""
+        for frame in reversed(frames):
+            if frame.kind == MODULE:
+                return frame.name
+        return self.env.current_module
+
+    def _find_method(self, instance: Any, method_name: str) -> Any:
+        class_name = instance_class_name(instance)
+        if class_name is None:
+            raise ValueError("Target is not a valid object instance.")
+        return find_method(self.env, class_name, method_name)
+
+    # --- Boucle principale ---
+    def _execute(self, base_frame: Frame) -> Any:
+        frames = [base_frame]
+        while True:
+            try:
+                return self._dispatch(frames)
+            except Exception as error:
+                self._unwind(frames, error)
+
+    def _unwind(self, frames: List[Frame], error: Exception) -> None:
+        """Routes a Python exception to the nearest 'try' block, popping frames as needed."""
+        while frames:
+            frame = frames[-1]
+            if frame.try_blocks:
+                handler, depth = frame.try_blocks.pop()
+                del frame.stack[depth:]
+                frame.stack.append(str(error))
+                frame.pc = handler
+                return
+
+            frames.pop()
+            if frame.kind == FUNCTION:
+                self._exit_function(frame)
+            elif frame.kind == MODULE:
+                self.env.exit_globals(frame.outer)
+                if frames:
+                    # Comme ImportInstruction : l'erreur est affichée et l'exécution continue
+                    print(f"Import Error in '{frame.name}': {error}")
+                    return
+
+        raise error
+
+    def _dispatch(self, frames: List[Frame]) -> Any:
+        env = self.env
+        get_variable = env.get_variable
+        set_variable = env.set_variable
+
+        frame = frames[-1]
+        code = frame.code.code
+        stack = frame.stack
+        push = stack.append
+        pop = stack.pop
+        pc = frame.pc
+
+        while True:
+            opcode = code[pc]
+            arg = code[pc + 1]
+            pc += 2
+
+            if opcode == LOAD:
+                push(get_variable(arg))
+
+            elif opcode == CONST:
+                push(arg)
+
+            elif opcode == STORE:
+                set_variable(arg, pop())
+
+            elif opcode == BINARY:
+                right = pop()
+                stack[-1] = arg(stack[-1], right)
+
+            elif opcode == JUMP_IF_FALSE:
+                if not pop():
+                    pc = arg
+
+            elif opcode == JUMP:
+                pc = arg
+
+            elif opcode == ADD:
+                val2 = pop()
+                val1 = stack[-1]
+                # Concaténation style JavaScript (même règle que MathHandler)
+                if isinstance(val1, str) or isinstance(val2, str):
+                    stack[-1] = str(val1) + str(val2)
+                else:
+                    stack[-1] = val1 + val2
+
+            elif opcode == FOR_ITER:
+                value = next(stack[-1], _EXHAUSTED)
+                if value is _EXHAUSTED:
+                    pc = arg
+                else:
+                    push(value)
+
+            elif opcode == NATIVE:
+                func, argc = arg
+                if argc:
+                    args = stack[-argc:]
+                    del stack[-argc:]
+                else:
+                    args = []
+                push(func(args, env, _identity))
+
+            elif opcode == CALL:
+                func_name, argc = arg
+                if argc:
+                    args = stack[-argc:]
+                    del stack[-argc:]
+                else:
+                    args = []
+
+                func_def = env.get_function(func_name)
+                ref = func_def.get("ref")
+                if isinstance(ref, VMFunction):
+                    memo = ref.memo
+                    if memo is not None:
+                        memo_key = memo.key(args)
+                        if memo_key is not None:
+                            found, cached = memo.lookup(memo_key)
+                            if found:
+                                push(cached)
+                                continue
+                    # Appel sans récursion Python : on empile une nouvelle frame
+                    frame.pc = pc
+                    frame = self._function_frame(ref.code, args, None)
+                    if memo is not None and memo_key is not None:
+                        frame.memo = (memo, memo_key)
+                    frames.append(frame)
+                    code = frame.code.code
+                    stack = frame.stack
+                    push = stack.append
+                    pop = stack.pop
+                    pc = 0
+                else:
+                    # Fonction Python native ou définie par le moteur "tree"
+                    push(ExpressionEvaluator.lookup("call")([func_name, *args], env, _identity))
+
+            elif opcode == RETURN:
+                value = pop()
+                finished = frames.pop()
+                if finished.kind == FUNCTION:
+                    self._exit_function(finished)
+                    if finished.memo is not None:
+                        memo, memo_key = finished.memo
+                        memo.store(memo_key, value)
+                elif finished.kind == MODULE:
+                    env.exit_globals(finished.outer)
+                elif arg and finished.kind == PROGRAM:
+                    print("Error: 'return' used outside of a function.")
+
+                if not frames:
+                    return value
+
+                frame = frames[-1]
+                code = frame.code.code
+                stack = frame.stack
+                push = stack.append
+                pop = stack.pop
+                pc = frame.pc
+                if finished.kind != MODULE:
+                    push(value)
+
+            elif opcode == POP:
+                pop()
+
+            elif opcode == JUMP_IF_TRUE:
+                if pop():
+                    pc = arg
+
+            elif opcode == DUP:
+                push(stack[-1])
+
+            elif opcode == DIV:
+                numerator = pop()
+                denom = stack[-1]
+                if denom == 0:
+                    raise ValueError("Division by zero")
+                stack[-1] = numerator / denom
+
+            elif opcode == CALL_METHOD:
+                method_name, argc = arg
+                if argc:
+                    args = stack[-argc:]
+                    del stack[-argc:]
+                else:
+                    args = []
+                instance = pop()
+
+                method_def = self._find_method(instance, method_name)
+                body = method_def["body"]
+                if isinstance(body, CodeObject):
+                    frame.pc = pc
+                    frame = self._function_frame(body, args, instance)
+                    frames.append(frame)
+                    code = frame.code.code
+                    stack = frame.stack
+                    push = stack.append
+                    pop = stack.pop
+                    pc = 0
+                else:
+                    # Classe définie par le moteur "tree"
+                    push(ExpressionEvaluator.lookup("call_method")([instance, method_name, *args], env, _identity))
+
+            elif opcode == FOR_RANGE:
+                step_val = int(pop())
+                end_val = int(pop())
+                start_val = int(pop())
+                push(iter(range(start_val, end_val, step_val)))
+
+            elif opcode == GET_ITER:
+                push(iter(loop_items(pop(), arg)))
+
+            elif opcode == UNPACK_PAIR:
+                key, value = pop()
+                push(value)
+                push(key)
+
+            elif opcode == PRINT:
+                if arg:
+                    values = stack[-arg:]
+                    del stack[-arg:]
+                else:
+                    values = []
+                print("".join(str(val) for val in values))
+
+            elif opcode == APPEND:
+                value = pop()
+                target_list = pop()
+                if not isinstance(target_list, list):
+                    raise ValueError(f"Push error: Target is not a list. Got {type(target_list)}.")
+                target_list.append(value)
+
+            elif opcode == PUT_ITEM:
+                value = pop()
+                key = pop()
+                target_dict = pop()
+                if not isinstance(target_dict, MutableMapping):
+                    raise ValueError(f"Put error: Target is not a dictionary. Got {type(target_dict)}.")
+                target_dict[key] = value
+
+            elif opcode == SETUP_TRY:
+                frame.try_blocks.append((arg, len(stack)))
+
+            elif opcode == POP_TRY:
+                frame.try_blocks.pop()
+
+            elif opcode == THROW:
+                raise RuntimeError(str(pop()))
+
+            elif opcode == ASSERT_FAIL:
+                raise AssertionError(f"Assertion Failed: {pop()}")
+
+            elif opcode == MAKE_FUNCTION:
+                func_name, func_code, memo_options = arg
+                memo = MemoCache(memo_options.get("memo_size")) if memo_options is not None else None
+                env.register_native_function(func_name, VMFunction(self, func_code, memo), memo)
+
+            elif opcode == MAKE_CLASS:
+                class_name, init_params, methods, parent_name = arg
+                clean_methods = {
+                    method_name: {"params": method_code.params, "body": method_code}
+                    for method_name, method_code in methods.items()
+                }
+                env.define_class(class_name, init_params, clean_methods, parent_name)
+
+            elif opcode == IMPORT:
+                filename = str(pop())
+                try:
+                    path = env.modules.resolve(filename, self._importer(frames))
+                    if path in env.imported:
+                        continue # Module déjà exécuté : import en O(1)
+                    env.imported.add(path)
+                    module_code = self._load_module(path)
+                except FileNotFoundError:
+                    print(f"Import Error: File '{filename}' not found.")
+                    continue
+                except Exception as e:
+                    print(f"Import Error in '{filename}': {e}")
+                    continue
+
+                frame.pc = pc
+                frame = Frame(module_code, MODULE, path)
+                # Le module s'exécute dans les globales, même importé depuis le corps d'une fonction
+                frame.outer = env.enter_globals()
+                frames.append(frame)
+                code = frame.code.code
+                stack = frame.stack
+                push = stack.append
+                pop = stack.pop
+                pc = 0
+
+            elif opcode == INPUT:
+                arg.execute(env)
+
+            elif opcode == SLEEP:
+                time.sleep(float(pop()))
+
+            else:
+                raise RuntimeError(f"VM: unknown opcode {opcode}")
+
+
+_EXHAUSTED = object()
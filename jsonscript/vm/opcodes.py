@@ -0,0 +1,60 @@
+"""
+Opcodes of the JsonScript virtual machine.
+
+A compiled body is a flat list [op, arg, op, arg, ...]: every opcode takes
+exactly one argument slot (None when unused), so the interpreter always
+advances the program counter by 2.
+"""
+
+# --- Pile de valeurs ---
+CONST = 0           # arg: valeur littérale à empiler
+POP = 1             # dépile et ignore
+LOAD = 2            # arg: nom de variable
+STORE = 3           # arg: nom de variable (dépile la valeur)
+
+# --- Opérateurs ---
+ADD = 10            # "+" avec concaténation style JavaScript
+DIV = 11            # "/" (pile: dénominateur, numérateur)
+BINARY = 12         # arg: fonction du module operator (-, *, %, comparaisons)
+
+# --- Sauts ---
+JUMP = 20               # arg: cible
+JUMP_IF_FALSE = 21      # arg: cible (dépile la condition)
+JUMP_IF_TRUE = 22       # arg: cible (dépile la condition)
+
+# --- Appels ---
+NATIVE = 30         # arg: (fonction de la table de dispatch, nb d'arguments)
+CALL = 31           # arg: (nom de fonction, nb d'arguments)
+CALL_METHOD = 32    # arg: (nom de méthode, nb d'arguments) ; pile: instance, args...
+RETURN = 33         # arg: True si "return" écrit hors fonction
+
+# --- Définitions ---
+MAKE_FUNCTION = 40  # arg: (nom, CodeObject)
+MAKE_CLASS = 41     # arg: (nom, params, {méthode: CodeObject}, parent)
+
+# --- Boucles ---
+FOR_RANGE = 50      # dépile step, end, start et empile l'itérateur range()
+FOR_ITER = 51       # arg: cible de sortie ; empile l'élément suivant
+GET_ITER = 52       # arg: True pour des paires ; dépile l'itérable et empile l'itérateur de for_each
+UNPACK_PAIR = 53    # dépile une paire (clé, valeur) et empile valeur puis clé
+
+# --- Exceptions ---
+SETUP_TRY = 60      # arg: adresse du bloc catch
+POP_TRY = 61
+THROW = 62          # dépile le message
+ASSERT_FAIL = 63    # dépile le message
+
+# --- Instructions diverses ---
+PRINT = 70          # arg: nb de valeurs à afficher
+APPEND = 71         # pile: liste, valeur
+PUT_ITEM = 72       # pile: dict, clé, valeur
+INPUT = 73          # arg: InputInstruction
+IMPORT = 74         # dépile le chemin du module
+SLEEP = 75          # dépile la durée
+DUP = 76            # duplique le sommet de pile
+
+
+NAMES = {
+    value: name for name, value in globals().items()
+    if name.isupper() and isinstance(value, int)
+}
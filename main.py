@@ -1,9 +1,22 @@
+import time
+
+# Référence du rapport --startup-report : tout ce qui suit compte comme temps d'import
+_STARTED = time.perf_counter()
+
 import sys
 import json
-from jsonscript.runner import JsonScript
+import argparse
+from contextlib import contextmanager
+from jsonscript.runner import JsonScript, ENGINES
+from jsonscript.resolver import DEFAULT_SCOPING, SCOPING_MODES
 from jsonscript.factory import InstructionFactory
 from jsonscript.environment import Environment
-from jsonscript.compiler import JSSCompiler
+from jsonscript.ast_cache import configure_cache, load_jss
+from jsonscript.optimizer import ASTOptimizer
+from jsonscript.evaluator import ExpressionEvaluator, BUILTIN_HANDLERS
+from jsonscript.signals import RETURN, outside_loop_error
+
+_IMPORTED = time.perf_counter()
 
 def run_repl():
     """
@@ -43,7 +56,12 @@ def run_repl():
             # On construit une instruction à la volée et on l'exécute
             try:
                 instruction = InstructionFactory.build(raw_instruction)
-                instruction.execute(env)
+                status = instruction.execute(env)
+                # Même contrôle que JsonScript.run : la ligne est un programme de premier niveau
+                if status == RETURN:
+                    print("Error: 'return' used outside of a function.")
+                elif status is not None:
+                    raise outside_loop_error(status)
             except Exception as e:
                 print(f"Runtime Error: {e}")
 
@@ -52,28 +70,150 @@ def run_repl():
         except Exception as e:
             print(f"Shell Error: {e}")
 
+def parse_cli(argv):
+    """
+    Parse les options de l'interpréteur.
+    Les arguments inconnus sont laissés au script (commande native "args").
+    """
+    parser = argparse.ArgumentParser(prog="main.py", description="JsonScript interpreter")
+    parser.add_argument("filename", nargs="?", help="Fichier .json ou .jss à exécuter (REPL si absent)")
+    parser.add_argument("--engine", choices=ENGINES + ("vm", "python"), default="tree",
+                        help="Moteur d'exécution (défaut : tree, vm = machine virtuelle à bytecode, "
+                             "python = module Python généré et mis en cache)")
+    parser.add_argument("--emit-python", metavar="OUT.py",
+                        help="Traduit le programme en module Python dans OUT.py sans l'exécuter")
+    parser.add_argument("--scoping", choices=SCOPING_MODES, default=None,
+                        help="Résolution des variables : lexical (défaut, une fonction ne voit que ses "
+                             "locaux et les globales) ou dynamic (compatibilité : une fonction voit les "
+                             "variables de son appelant). Le moteur python est toujours lexical")
+    parser.add_argument("-O", dest="optimize", type=int, choices=(0, 1, 2), default=None,
+                        help="Niveau d'optimisation de l'AST : -O0 aucune, -O1 (défaut) repli des constantes "
+                             "et suppression des commentaires, -O2 élimine aussi le code mort")
+    parser.add_argument("--no-cache", dest="cache", action="store_false",
+                        help="Recompile les sources .jss (et les modules Python de --engine=python) "
+                             "sans lire ni écrire le cache __jsscache__")
+    parser.add_argument("--cache-dir", metavar="DIR", default=None,
+                        help="Dossier unique pour les ASTs compilés et les modules Python (défaut : __jsscache__ à côté de "
+                             "chaque source, ou $JSONSCRIPT_CACHE_DIR)")
+    parser.add_argument("--stream", action="store_true",
+                        help="Programme .json (moteurs tree/closure uniquement) : lit, construit et exécute les "
+                             "instructions de premier niveau une par une au fil du fichier")
+    parser.add_argument("--startup-report", action="store_true",
+                        help="Affiche à la fin le temps passé en imports, compilation, optimisation, "
+                             "construction et exécution, et les handlers chargés")
+    options, _ = parser.parse_known_args(argv)
+
+    # Le code Python généré n'a qu'une portée : un --scoping contraire est refusé, pas ignoré
+    if (options.engine == "python" or options.emit_python) and options.scoping not in (None, "lexical"):
+        parser.error("--engine=python only supports --scoping=lexical")
+    options.scoping = options.scoping or DEFAULT_SCOPING
+
+    # --stream n'existe que pour les programmes .json des moteurs tree/closure : refusé plutôt qu'ignoré
+    if options.stream:
+        if options.emit_python or options.engine not in ENGINES:
+            engine = "python" if options.emit_python else options.engine
+            parser.error(f"--stream is not supported by --engine={engine}")
+        if options.filename and options.filename.endswith(".jss"):
+            parser.error("--stream only applies to .json programs")
+    return options
+
+
+def optimize_program(raw_instructions, options):
+    """
+    Passe d'optimisation entre la compilation JSS / le chargement JSON et InstructionFactory.build.
+    Le rapport n'est affiché que si le niveau a été demandé explicitement (-O0/-O1/-O2).
+    """
+    level = 1 if options.optimize is None else options.optimize
+    optimizer = ASTOptimizer(level)
+    optimized = optimizer.optimize(raw_instructions)
+    if options.optimize is not None:
+        print(optimizer.report())
+    return optimized
+
+
+class StartupReport:
+    """Durée des phases d'un lancement (python main.py script --startup-report)."""
+
+    def __init__(self):
+        self.phases = [("imports", _IMPORTED - _STARTED)]
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - start))
+
+    def report(self) -> str:
+        lines = ["--- Startup report ---"]
+        for name, elapsed in self.phases:
+            lines.append(f"  {name:<10} {elapsed * 1000:8.2f} ms")
+        lines.append(f"  {'total':<10} {(time.perf_counter() - _STARTED) * 1000:8.2f} ms")
+
+        load_times = ExpressionEvaluator.load_times
+        loaded = ", ".join(f"{name} {elapsed * 1000:.2f} ms" for name, elapsed in load_times.items())
+        lines.append(f"  handlers imported on first use ({len(load_times)}/{len(BUILTIN_HANDLERS)}, "
+                     f"included above): {loaded or 'none'}")
+        return "\n".join(lines)
+
+
 def main():
+    options = parse_cli(sys.argv[1:])
+    configure_cache(options.cache, options.cache_dir)
+    startup = StartupReport()
+    try:
+        run(options, startup)
+    finally:
+        if options.startup_report:
+            print(startup.report())
+
+
+def run(options, startup):
     # Vérifie les arguments passés au script
-    if len(sys.argv) > 1:
+    if options.filename:
         # Mode Fichier : python main.py mon_fichier.json
-        filename = sys.argv[1]
+        filename = options.filename
+
+        # Backend AOT : le module Python est mis en cache à côté de la source
+        if options.emit_python or options.engine == "python":
+            from jsonscript.aot import emit_python, run_file
+            try:
+                if options.emit_python:
+                    emit_python(filename, options.emit_python)
+                    print(f"Python module written to '{options.emit_python}'.")
+                else:
+                    with startup.phase("run"):
+                        run_file(filename)
+            except FileNotFoundError:
+                print(f"Error: File '{filename}' not found.")
+            except Exception as e:
+                print(f"Compilation/Execution Error: {e}")
+            return
 
         if filename.endswith(".jss"):
             print(f"Compiling '{filename}'...")
             try:
-                # Lecture
-                with open(filename, "r", encoding="utf-8") as f:
-                    source_code = f.read()
-                
-                # Compilation (JSS -> Liste d'instructions JSON)
-                compiler = JSSCompiler()
-                raw_instructions = compiler.compile(source_code)
+                # Compilation (JSS -> Liste d'instructions JSON), ou AST relu depuis le cache
+                with startup.phase("compile"):
+                    raw_instructions = load_jss(filename)
+                with startup.phase("optimize"):
+                    raw_instructions = optimize_program(raw_instructions, options)
+
+                if options.engine == "vm":
+                    from jsonscript.vm import run_program
+                    print("--- Running Compiled Code (VM) ---")
+                    with startup.phase("run"):
+                        run_program(raw_instructions, filename=filename, scoping=options.scoping)
+                    return
 
-                instructions_objects = [InstructionFactory.build(raw) for raw in raw_instructions]
+                with startup.phase("build"):
+                    instructions_objects = [InstructionFactory.build(raw) for raw in raw_instructions]
                 
                 # Exécution directe (sans passer par from_file car on a déjà la liste)
                 print("--- Running Compiled Code ---")
-                JsonScript(instructions_objects).run()
+                with startup.phase("run"):
+                    JsonScript(instructions_objects, filename).run(engine=options.engine, scoping=options.scoping)
 
             except FileNotFoundError:
                 print(f"Error: File '{filename}' not found.")
@@ -81,8 +221,44 @@ def main():
                 print(f"Compilation/Execution Error: {e}")
 
         # 2. Cas fichier .json (Standard)
+        elif options.engine == "vm":
+            from jsonscript.vm import run_program
+            try:
+                with startup.phase("load"), open(filename, "r", encoding="utf-8") as f:
+                    raw_instructions = json.load(f)
+            except Exception as e:
+                print(f"Loading Error: {e}")
+                return
+            with startup.phase("optimize"):
+                raw_instructions = optimize_program(raw_instructions, options)
+            with startup.phase("run"):
+                run_program(raw_instructions, filename=filename, scoping=options.scoping)
+
+        elif options.stream:
+            # Lecture incrémentale : la mémoire est bornée par la plus grosse instruction
+            try:
+                optimizer = ASTOptimizer(1 if options.optimize is None else options.optimize)
+                program = JsonScript.stream_file(filename, transform=lambda raw: optimizer.optimize([raw]))
+                with startup.phase("run"):
+                    program.run(engine=options.engine, scoping=options.scoping)
+                if options.optimize is not None:
+                    print(optimizer.report())
+            except Exception as e:
+                print(f"Compilation/Execution Error: {e}")
+
         else:
-            JsonScript.from_file(filename).run()
+            try:
+                with startup.phase("load"), open(filename, "r", encoding="utf-8") as f:
+                    raw_instructions = json.load(f)
+                with startup.phase("optimize"):
+                    raw_instructions = optimize_program(raw_instructions, options)
+                with startup.phase("build"):
+                    instructions_objects = [InstructionFactory.build(raw) for raw in raw_instructions]
+            except Exception as e:
+                print(f"Loading Error: {e}")
+                return
+            with startup.phase("run"):
+                JsonScript(instructions_objects, filename).run(engine=options.engine, scoping=options.scoping)
 
     else:
         # Mode Interactif : python main.py
@@ -0,0 +1,37 @@
+import pytest
+
+from jsonscript.compiler import JSSCompiler
+from jsonscript.factory import InstructionFactory
+from jsonscript.resolver import DEFAULT_SCOPING
+from jsonscript.runner import JsonScript
+
+
+# (engine, scoping) couples run by the engine-parametrized tests: INTERPRETERS for
+# run_program, ENGINES for run_jss (which also runs the generated Python code)
+INTERPRETERS = [(engine, scoping) for engine in ("tree", "closure", "vm") for scoping in ("lexical", "dynamic")]
+ENGINES = INTERPRETERS + [("python", "lexical")]
+
+
+def run_program(raw_program, engine="tree", scoping=DEFAULT_SCOPING, environment=None):
+    """Runs a raw JSON program on an interpreter engine, returns its Environment."""
+    if engine == "vm":
+        from jsonscript.vm import run_program as run_vm
+        return run_vm(raw_program, environment, scoping=scoping)
+    instructions = [InstructionFactory.build(raw) for raw in raw_program]
+    return JsonScript(instructions).run(environment, engine=engine, scoping=scoping)
+
+
+@pytest.fixture
+def run_jss(capsys, tmp_path):
+    """Runs .jss source on an engine and returns the printed lines."""
+    def run(source, engine="tree", scoping=DEFAULT_SCOPING, environment=None):
+        if engine == "python":
+            from jsonscript.aot import run_file
+            path = tmp_path / "program.jss"
+            path.write_text(source, encoding="utf-8")
+            run_file(str(path))
+        else:
+            run_program(JSSCompiler().compile(source), engine, scoping, environment)
+        return capsys.readouterr().out.splitlines()
+
+    return run
@@ -0,0 +1,75 @@
+import os
+
+import jsonscript.ast_cache
+from jsonscript.aot import PythonTranspiler, emit_python, run_file
+from jsonscript.ast_cache import ASTCache
+
+from test_vm import EXPECTED, PROGRAM
+
+
+def write_source(tmp_path, text, name="program.jss"):
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def cached_modules(tmp_path):
+    directory = tmp_path / "__jsscache__"
+    return sorted(os.listdir(directory)) if directory.exists() else []
+
+
+def count_transpilations(monkeypatch):
+    calls = []
+    transpile = PythonTranspiler.transpile
+
+    def counting(self, *args, **kwargs):
+        calls.append(1)
+        return transpile(self, *args, **kwargs)
+
+    monkeypatch.setattr(PythonTranspiler, "transpile", counting)
+    return calls
+
+
+def test_generated_python_matches_the_tree_engine(run_jss):
+    assert run_jss(PROGRAM, "tree") == EXPECTED
+    assert run_jss(PROGRAM, "python") == EXPECTED
+
+
+def test_emitted_module_is_valid_python(tmp_path):
+    output = tmp_path / "out.py"
+    emit_python(write_source(tmp_path, PROGRAM), str(output))
+    compile(output.read_text(encoding="utf-8"), str(output), "exec")
+
+
+def test_unchanged_source_is_transpiled_once(tmp_path, capsys, monkeypatch):
+    calls = count_transpilations(monkeypatch)
+    path = write_source(tmp_path, 'print "hello"')
+    run_file(path)
+    run_file(path)
+    assert capsys.readouterr().out.splitlines() == ["hello", "hello"]
+    assert len(calls) == 1
+    assert len(cached_modules(tmp_path)) == 1
+
+
+def test_changed_source_replaces_its_cached_module(tmp_path, capsys, monkeypatch):
+    calls = count_transpilations(monkeypatch)
+    path = write_source(tmp_path, 'print "v1"')
+    run_file(path)
+    first = cached_modules(tmp_path)
+    write_source(tmp_path, 'print "v2"')
+    run_file(path)
+    assert capsys.readouterr().out.splitlines() == ["v1", "v2"]
+    assert len(calls) == 2
+    second = cached_modules(tmp_path)
+    assert len(second) == 1 and second != first
+
+
+def test_disabled_cache_writes_nothing(tmp_path, capsys, monkeypatch):
+    monkeypatch.setattr(jsonscript.ast_cache, "_default_cache", ASTCache(enabled=False))
+    calls = count_transpilations(monkeypatch)
+    path = write_source(tmp_path, 'print "hello"')
+    run_file(path)
+    run_file(path)
+    assert capsys.readouterr().out.splitlines() == ["hello", "hello"]
+    assert len(calls) == 2
+    assert cached_modules(tmp_path) == []
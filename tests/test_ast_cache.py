@@ -0,0 +1,104 @@
+import os
+
+import pytest
+
+import jsonscript.ast_cache
+from jsonscript.ast_cache import ASTCache
+from jsonscript.compiler import JSSCompiler
+
+
+@pytest.fixture
+def compilations(monkeypatch):
+    """Number of JSSCompiler.compile calls made by the test."""
+    calls = []
+    compile_source = JSSCompiler.compile
+
+    def counting(self, source_code):
+        calls.append(source_code)
+        return compile_source(self, source_code)
+
+    monkeypatch.setattr(JSSCompiler, "compile", counting)
+    return calls
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "program.jss"
+    path.write_text('print "v1"', encoding="utf-8")
+    return path
+
+
+def test_unchanged_source_is_compiled_once(source, compilations):
+    cache = ASTCache()
+    assert cache.load(str(source)) == [["print", "v1"]]
+    assert os.path.exists(cache.cache_path(str(source)))
+    assert ASTCache().load(str(source)) == [["print", "v1"]]
+    assert len(compilations) == 1
+
+
+def test_changed_source_is_recompiled(source, compilations):
+    cache = ASTCache()
+    cache.load(str(source))
+    source.write_text('print "version 2"', encoding="utf-8")
+    assert cache.load(str(source)) == [["print", "version 2"]]
+    assert cache.load(str(source)) == [["print", "version 2"]]
+    assert len(compilations) == 2
+
+
+def test_same_size_change_with_a_new_mtime_is_recompiled(source, compilations):
+    cache = ASTCache()
+    cache.load(str(source))
+    stat = os.stat(source)
+    source.write_text('print "v2"', encoding="utf-8")
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert cache.load(str(source)) == [["print", "v2"]]
+    assert len(compilations) == 2
+
+
+def test_touched_source_with_the_same_content_is_not_recompiled(source, compilations):
+    cache = ASTCache()
+    cache.load(str(source))
+    stat = os.stat(source)
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert cache.load(str(source)) == [["print", "v1"]]
+    assert cache.load(str(source)) == [["print", "v1"]]
+    assert len(compilations) == 1
+
+
+def test_corrupted_cache_file_is_recompiled(source, compilations):
+    cache = ASTCache()
+    cache.load(str(source))
+    path = cache.cache_path(str(source))
+    with open(path, "r+b") as f:
+        f.truncate(os.path.getsize(path) - 3)
+    assert cache.load(str(source)) == [["print", "v1"]]
+    assert len(compilations) == 2
+
+
+def test_new_compiler_version_invalidates_the_cache(source, compilations, monkeypatch):
+    ASTCache().load(str(source))
+    monkeypatch.setattr(jsonscript.ast_cache, "COMPILER_VERSION", jsonscript.ast_cache.COMPILER_VERSION + 1)
+    assert ASTCache().load(str(source)) == [["print", "v1"]]
+    assert len(compilations) == 2
+
+
+def test_disabled_cache_compiles_every_time_and_writes_nothing(source, compilations, tmp_path):
+    cache = ASTCache(enabled=False)
+    cache.load(str(source))
+    cache.load(str(source))
+    assert len(compilations) == 2
+    assert not (tmp_path / "__jsscache__").exists()
+
+
+def test_cache_dir_keeps_homonymous_sources_apart(tmp_path, compilations):
+    first, second = tmp_path / "a", tmp_path / "b"
+    first.mkdir()
+    second.mkdir()
+    (first / "main.jss").write_text('print "a"', encoding="utf-8")
+    (second / "main.jss").write_text('print "b"', encoding="utf-8")
+    cache = ASTCache(cache_dir=str(tmp_path / "cache"))
+    for _ in range(2):
+        assert cache.load(str(first / "main.jss")) == [["print", "a"]]
+        assert cache.load(str(second / "main.jss")) == [["print", "b"]]
+    assert len(compilations) == 2
+    assert len(os.listdir(tmp_path / "cache")) == 2
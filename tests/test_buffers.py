@@ -0,0 +1,50 @@
+import pytest
+
+import jsonscript.buffers
+from jsonscript.buffers import Buffer
+
+from conftest import ENGINES
+
+
+DATA = b"abc\nxaaay\nabcabc\n\nend-aa"
+NEEDLES = [b"abc", b"\n", b"a", b"aa", b"aaa", b"end", b"missing", b"c\na", DATA]
+
+
+@pytest.mark.parametrize("needle", NEEDLES)
+@pytest.mark.parametrize("start", [0, 1, 5, len(DATA), -3, -100])
+def test_find_matches_bytes_find(needle, start):
+    assert Buffer(DATA).find(needle, start) == DATA.find(needle, start)
+
+
+def test_find_in_a_slice_is_relative_to_the_slice():
+    part = Buffer(DATA).slice(4, 10)
+    assert part.find(b"aaa") == 1
+    assert part.find(b"abc") == -1
+
+
+@pytest.mark.parametrize("needle", NEEDLES + [b""])
+@pytest.mark.parametrize("window", [4, 5, 7, 1 << 24])
+def test_count_matches_bytes_count_across_windows(monkeypatch, needle, window):
+    # Petites fenêtres : les occurrences à cheval sur deux fenêtres sont comptées une fois
+    monkeypatch.setattr(jsonscript.buffers, "_COUNT_WINDOW", window)
+    data = DATA * 3
+    assert Buffer(data).count(needle) == data.count(needle)
+
+
+@pytest.mark.parametrize("engine, scoping", ENGINES)
+def test_buf_find_and_buf_count_builtins(run_jss, engine, scoping):
+    source = """
+    var b = buf_from_str("one,two,,three,")
+    print(buf_find(b, ","))
+    print(buf_find(b, ",", 4))
+    print(buf_find(b, buf_from_str("three")))
+    print(buf_find(b, "four"))
+    print(buf_count(b, ","))
+    print(buf_count(buf_slice(b, 4), ","))
+    print(buf_count(buf_from_str("aaaa"), "aa"))
+    """
+    assert run_jss(source, engine, scoping) == ["3", "7", "9", "-1", "4", "3", "2"]
+
+
+def test_buf_find_rejects_a_non_buffer(run_jss):
+    assert run_jss('print(buf_find("text", "t"))') == ["Runtime Error: 'buf_find' expects a buffer, got str."]
@@ -0,0 +1,74 @@
+import pytest
+
+from conftest import ENGINES, run_program
+
+
+INSTANCES = """
+class Person(name, age) {
+    hello() { return "hi " + this.name }
+}
+var p = new Person("ann", 3)
+print(type(p))
+print(p == new Person("ann", 3))
+print(p == new Person("bob", 3))
+print(p == {"__class__": "Person", "__data__": {"name": "ann", "age": 3}})
+print(len(p))
+print(at(p, "__class__"))
+print(at(at(p, "__data__"), "name"))
+put(at(p, "__data__"), "name", "zed")
+print(p.hello())
+"""
+
+
+@pytest.mark.parametrize("engine, scoping", ENGINES)
+def test_instances_read_as_their_former_dict_layout(run_jss, engine, scoping):
+    assert run_jss(INSTANCES, engine, scoping) == [
+        "dict", "True", "False", "True", "2", "Person", "ann", "hi zed",
+    ]
+
+
+@pytest.mark.parametrize("engine, scoping", ENGINES)
+def test_methods_are_inherited_and_overridden(run_jss, engine, scoping):
+    source = """
+    class Animal(name) {
+        speak() { return this.name + " makes a sound" }
+        kind() { return "animal" }
+    }
+    class Dog(name) extends Animal {
+        speak() { return this.name + " barks" }
+    }
+    var d = new Dog("rex")
+    print(d.speak())
+    print(d.kind())
+    print(d)
+    """
+    assert run_jss(source, engine, scoping) == [
+        "rex barks", "animal", "{'__class__': 'Dog', '__data__': {'name': 'rex'}}",
+    ]
+
+
+@pytest.mark.parametrize("engine, scoping", ENGINES)
+def test_methods_and_attributes_of_instances_in_dict_layout(run_jss, engine, scoping):
+    source = """
+    class Person(name) {
+        hello() { return "hi " + this.name }
+    }
+    var q = {"__class__": "Person", "__data__": {"name": "ann"}}
+    print(q.hello())
+    print(q.name)
+    var r = parse_json(to_json(new Person("dan")))
+    print(r.hello())
+    """
+    assert run_jss(source, engine, scoping) == ["hi ann", "ann", "hi dan"]
+
+
+@pytest.mark.parametrize("engine", ["tree", "closure", "vm"])
+def test_set_attr_writes_to_the_data_of_a_dict_instance(engine):
+    env = run_program([
+        ["class", "Box", ["v"], {"get": [[], [["return", ["get_attr", ["get", "this"], "v"]]]]}],
+        ["set", "b", {"__class__": "Box", "__data__": {"v": 1}}],
+        ["set_attr", ["get", "b"], "v", 2],
+        ["set", "out", ["call_method", ["get", "b"], "get"]],
+    ], engine)
+    assert env.get_variable("b") == {"__class__": "Box", "__data__": {"v": 2}}
+    assert env.get_variable("out") == 2
@@ -0,0 +1,20 @@
+import pytest
+
+from jsonscript.environment import Environment
+from jsonscript.handlers.collection import CollectionHandler
+
+
+def unique(values):
+    return CollectionHandler().unique([values], Environment(), lambda value, env: value)
+
+
+@pytest.mark.parametrize("values, expected", [
+    ([3, 1, 3, 2, 1], [3, 1, 2]),
+    ([1, True, 1.0, 1, True], [1, True, 1.0]),
+    ([0, False, 0.0, "0"], [0, False, 0.0, "0"]),
+    ([[1], 1, [1], True], [[1], 1, True]),
+])
+def test_unique_keeps_values_of_different_types(values, expected):
+    result = unique(values)
+    assert result == expected
+    assert [type(value) for value in result] == [type(value) for value in expected]
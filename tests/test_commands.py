@@ -0,0 +1,69 @@
+import importlib
+
+import pytest
+
+from jsonscript.compiler import NATIVE_COMMANDS
+from jsonscript.handlers.commands import BUILTIN_HANDLERS
+
+from conftest import ENGINES
+
+
+def load(module_name, class_name):
+    if module_name.endswith(".gui"):
+        pytest.importorskip("tkinter")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+@pytest.mark.parametrize("module_name, class_name, commands", BUILTIN_HANDLERS,
+                         ids=[class_name for _, class_name, _ in BUILTIN_HANDLERS])
+def test_handler_commands_match_the_builtin_table(module_name, class_name, commands):
+    handler_type = load(module_name, class_name)
+    assert handler_type.commands == commands
+    assert set(handler_type().command_table()) == commands
+
+
+def test_native_commands_are_builtin_commands():
+    builtin = set().union(*(commands for _, _, commands in BUILTIN_HANDLERS))
+    assert NATIVE_COMMANDS - builtin == {"push", "put"}
+    assert "get" not in NATIVE_COMMANDS and "new" not in NATIVE_COMMANDS
+
+
+@pytest.mark.parametrize("engine, scoping", ENGINES)
+def test_script_functions_shadow_native_commands(run_jss, engine, scoping):
+    source = """
+    func sum(a, b) { return a + b }
+    func reverse(s) { return "rev:" + s }
+    func find(x) { return "found " + x }
+    print(sum(1, 2))
+    print(reverse("ab"))
+    print(find("k"))
+    print(len(reverse("x")))
+    """
+    assert run_jss(source, engine, scoping) == ["3", "rev:ab", "found k", "5"]
+
+
+@pytest.mark.parametrize("engine, command", [
+    (engine, command) for engine in ("tree", "closure", "vm") for command in ("+", "<", "get", "call_method")
+    if (engine, command) != ("vm", "call_method")  # la vm exécute les appels sur sa propre pile
+])
+def test_register_command_overrides_specialised_commands(monkeypatch, engine, command):
+    from conftest import run_program
+    from jsonscript.evaluator import ExpressionEvaluator
+
+    builtin = ExpressionEvaluator.lookup(command)
+    calls = []
+
+    def traced(args, env, evaluator):
+        calls.append(command)
+        return builtin(args, env, evaluator)
+
+    monkeypatch.setitem(ExpressionEvaluator._commands, command, traced)
+    env = run_program([
+        ["class", "Box", ["v"], {"get": [[], [["return", ["get_attr", ["get", "this"], "v"]]]]}],
+        ["set", "b", ["new", "Box", 2]],
+        ["set", "x", ["call_method", ["get", "b"], "get"]],
+        ["set", "y", ["+", ["get", "x"], 1]],
+        ["set", "z", ["<", ["get", "x"], ["get", "y"]]],
+    ], engine)
+    assert (env.get_variable("y"), env.get_variable("z")) == (3, True)
+    assert calls
@@ -0,0 +1,95 @@
+import pytest
+
+from conftest import ENGINES, INTERPRETERS, run_program
+
+
+LOOPS = """
+func first_over(list, limit) {
+    for (x in list) {
+        var i = 0
+        while (i < 3) {
+            if (x * i > limit) { return x }
+            i = i + 1
+        }
+    }
+    return 0 - 1
+}
+print(first_over([1, 2, 5, 9], 8))
+print(first_over([1], 8))
+
+var out = []
+for (i, 0, 10, 1) {
+    if (i % 2 == 0) { continue }
+    if (i > 7) { break }
+    push(out, i)
+}
+print(out)
+
+var j = 0
+while (j < 100) {
+    j = j + 1
+    switch (j) {
+        case 5:
+            break
+    }
+}
+print(j)
+"""
+
+TRY_BODIES = [
+    ["function", "guarded", ["n"], [
+        ["try", [
+            ["if", [">", ["get", "n"], 0], [["return", "positive"]]],
+            ["throw", "negative"],
+        ], "e", [["return", ["concat", "caught ", ["get", "e"]]]]],
+    ]],
+    ["print", ["call", "guarded", 1]],
+    ["print", ["call", "guarded", 0]],
+    ["set", "k", 0],
+    ["while", ["<", ["get", "k"], 10], [
+        ["set", "k", ["+", ["get", "k"], 1]],
+        ["try", [["if", ["==", ["get", "k"], 3], [["break"]]]], "e", []],
+    ]],
+    ["print", ["get", "k"]],
+]
+
+
+@pytest.mark.parametrize("engine, scoping", ENGINES)
+def test_return_break_and_continue_leave_the_right_construct(run_jss, engine, scoping):
+    assert run_jss(LOOPS, engine, scoping) == ["5", "-1", "[1, 3, 5, 7]", "5"]
+
+
+@pytest.mark.parametrize("engine, scoping", INTERPRETERS)
+def test_status_crosses_try_bodies(capsys, engine, scoping):
+    run_program(TRY_BODIES, engine, scoping)
+    assert capsys.readouterr().out.splitlines() == ["positive", "caught negative", "3"]
+
+
+@pytest.mark.parametrize("engine, scoping", INTERPRETERS)
+def test_break_outside_a_loop_stops_the_program(capsys, engine, scoping):
+    program = [
+        ["function", "stray", [], [["break"]]],
+        ["call", "stray"],
+        ["print", "unreached"],
+    ]
+    run_program(program, engine, scoping)
+    assert capsys.readouterr().out.splitlines() == ["Runtime Error: 'break' used outside of a loop."]
+
+
+@pytest.mark.parametrize("engine, scoping", INTERPRETERS)
+def test_top_level_return_stops_the_program(capsys, engine, scoping):
+    run_program([["print", "before"], ["return", 1], ["print", "after"]], engine, scoping)
+    assert capsys.readouterr().out.splitlines() == ["before", "Error: 'return' used outside of a function."]
+
+
+def test_repl_reports_statuses_outside_a_loop_or_function(capsys, monkeypatch):
+    from main import run_repl
+    lines = iter(['["break"]', '["return", 1]', '["continue"]', '["print", "still running"]', "exit"])
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(lines))
+    run_repl()
+    assert capsys.readouterr().out.splitlines()[3:] == [
+        "Runtime Error: 'break' used outside of a loop.",
+        "Error: 'return' used outside of a function.",
+        "Runtime Error: 'continue' used outside of a loop.",
+        "still running",
+    ]
@@ -0,0 +1,71 @@
+import pytest
+
+from jsonscript.environment import Environment
+
+from conftest import INTERPRETERS
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = tmp_path / "people.csv"
+    path.write_text("name,age,city\nann,31,Lyon\nbob,25,Nice\ncyd,40,Paris\n", encoding="utf-8")
+    return str(path)
+
+
+def counting_environment():
+    env = Environment()
+    env.register_native_function("open_count", lambda: len(env.open_files))
+    return env
+
+
+@pytest.mark.parametrize("engine, scoping", INTERPRETERS + [("python", "lexical")])
+def test_csv_open_streams_rows_with_options(run_jss, csv_file, engine, scoping):
+    source = f"""
+    for (row in csv_open("{csv_file}", {{"columns": ["name"], "skip": 1, "limit": 1}})) {{
+        print(row)
+    }}
+    var ages = []
+    for (row in csv_open("{csv_file}")) {{ push(ages, at(row, "age")) }}
+    print(ages)
+    """
+    assert run_jss(source, engine, scoping) == ["{'name': 'bob'}", "['31', '25', '40']"]
+
+
+@pytest.mark.parametrize("engine, scoping", INTERPRETERS)
+def test_early_break_does_not_keep_csv_files_open(run_jss, csv_file, engine, scoping):
+    source = f"""
+    for (i, 0, 300, 1) {{
+        for (row in csv_open("{csv_file}")) {{ break }}
+    }}
+    print(open_count())
+    """
+    assert run_jss(source, engine, scoping, counting_environment()) == ["0"]
+
+
+@pytest.mark.parametrize("engine, scoping", INTERPRETERS)
+def test_dropped_writer_is_flushed(run_jss, tmp_path, engine, scoping):
+    out = tmp_path / "out.csv"
+    source = f"""
+    var w = csv_writer_open("{out}", {{"columns": ["a", "b"]}})
+    csv_write_row(w, {{"a": 1, "b": 2}})
+    w = 0
+    print(open_count())
+    print(read_file("{out}"))
+    """
+    # Le fichier se termine par une fin de ligne CSV, print en ajoute une
+    assert run_jss(source, engine, scoping, counting_environment()) == ["0", "a,b", "1,2", ""]
+
+
+@pytest.mark.parametrize("engine, scoping", INTERPRETERS)
+def test_open_handles_are_closed_at_the_end_of_the_run(run_jss, csv_file, tmp_path, engine, scoping):
+    env = counting_environment()
+    source = f"""
+    var rows = csv_open("{csv_file}")
+    var w = csv_writer_open("{tmp_path / 'kept.csv'}")
+    csv_write_row(w, ["x", "y"])
+    print(open_count())
+    """
+    assert run_jss(source, engine, scoping, env) == ["2"]
+    assert len(env.open_files) == 0
+    assert env.get_variable("rows")._file.closed
+    assert (tmp_path / "kept.csv").read_bytes() == b"x,y\r\n"
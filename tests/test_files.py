@@ -0,0 +1,81 @@
+import pytest
+
+from conftest import ENGINES
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    path = tmp_path / "app.log"
+    path.write_text("start\n", encoding="utf-8")
+    return path
+
+
+@pytest.mark.parametrize("engine, scoping", ENGINES)
+def test_buffered_appends_reach_the_disk_on_flush_and_close(run_jss, log_file, engine, scoping):
+    source = f"""
+    var f = file_open("{log_file}", "a")
+    file_write_line(f, "one")
+    file_write(f, "two", "-", 2)
+    file_write_line(f)
+    print read_file("{log_file}")
+    file_flush(f)
+    print read_file("{log_file}")
+    file_write_line(f, "three")
+    file_close(f)
+    file_close(f)
+    print read_file("{log_file}")
+    """
+    assert run_jss(source, engine, scoping) == [
+        "start", "",
+        "start", "one", "two-2", "",
+        "start", "one", "two-2", "three", "",
+    ]
+
+
+@pytest.mark.parametrize("engine, scoping", ENGINES)
+def test_handles_left_open_are_flushed_at_the_end_of_the_run(run_jss, log_file, engine, scoping):
+    source = f"""
+    var kept = file_open("{log_file}", "a")
+    file_write_line(kept, "kept")
+    func log(line) {{
+        var local = file_open("{log_file}.2", "w")
+        file_write_line(local, line)
+        return 0
+    }}
+    log("dropped")
+    """
+    run_jss(source, engine, scoping)
+    assert log_file.read_text(encoding="utf-8") == "start\nkept\n"
+    assert (log_file.parent / "app.log.2").read_text(encoding="utf-8") == "dropped\n"
+
+
+def test_full_buffer_and_line_buffering_write_before_close(run_jss, log_file):
+    source = f"""
+    var small = file_open("{log_file}", "a", {{"buffer_size": 8}})
+    file_write(small, "0123456789abcdef")
+    print len(read_file("{log_file}")) > 6
+    var live = file_open("{log_file}.live", "w", {{"line_buffered": true}})
+    file_write_line(live, "seen")
+    print read_file("{log_file}.live")
+    """
+    assert run_jss(source) == ["True", "seen", ""]
+
+
+def test_writes_after_close_are_errors(run_jss, log_file):
+    source = f"""
+    var f = file_open("{log_file}", "a")
+    file_close(f)
+    file_write(f, "late")
+    """
+    assert run_jss(source) == [f"Runtime Error: 'file_write': file '{log_file}' is closed."]
+    assert log_file.read_text(encoding="utf-8") == "start\n"
+
+
+def test_binary_appends_accept_buffers(run_jss, log_file):
+    source = f"""
+    var f = file_open("{log_file}", "ab")
+    file_write_line(f, buf_from_str("bytes"))
+    file_close(f)
+    """
+    run_jss(source)
+    assert log_file.read_bytes() == b"start\nbytes\n"
@@ -0,0 +1,94 @@
+import gc
+import os
+import weakref
+
+import pytest
+
+from jsonscript.environment import Environment
+from jsonscript.handlers.io import ChunkReader, LineReader
+
+from conftest import INTERPRETERS
+
+
+@pytest.fixture
+def text_file(tmp_path):
+    path = tmp_path / "lines.txt"
+    path.write_text("first\nsecond\r\n\nlast", encoding="utf-8")
+    return str(path)
+
+
+def counting_environment():
+    """Environment with an open_count() native returning the number of registered open files."""
+    env = Environment()
+    env.register_native_function("open_count", lambda: len(env.open_files))
+    return env
+
+
+def test_line_reader_strips_line_endings_and_closes_when_exhausted(text_file):
+    table = Environment().open_files
+    reader = LineReader(text_file, table)
+    assert len(table) == 1
+    assert list(reader) == ["first", "second", "", "last"]
+    assert reader._file.closed
+    assert len(table) == 0
+
+
+def test_chunk_reader_closes_when_exhausted(text_file):
+    table = Environment().open_files
+    reader = ChunkReader(text_file, 4, table)
+    chunks = [bytes(chunk.view) for chunk in reader]
+    assert b"".join(chunks) == open(text_file, "rb").read()
+    assert all(len(chunk) == 4 for chunk in chunks[:-1])
+    assert reader._file.closed
+    assert len(table) == 0
+
+
+def test_dropped_reader_leaves_the_table(text_file):
+    table = Environment().open_files
+    reader = LineReader(text_file, table)
+    file = weakref.ref(reader._file)
+    del reader
+    gc.collect()
+    assert len(table) == 0
+    # Plus aucune référence au fichier : il a été fermé en étant collecté
+    assert file() is None
+
+
+@pytest.mark.parametrize("engine, scoping", INTERPRETERS)
+def test_early_break_does_not_keep_files_open(run_jss, text_file, engine, scoping):
+    source = f"""
+    for (i, 0, 300, 1) {{
+        for (line in read_lines("{text_file}")) {{ break }}
+        for (chunk in read_chunks("{text_file}", 2)) {{ break }}
+        var kept = read_lines("{text_file}")
+    }}
+    print(open_count())
+    """
+    assert run_jss(source, engine, scoping, counting_environment()) == ["1"]
+
+
+@pytest.mark.skipif(not os.path.isdir("/proc/self/fd"), reason="needs /proc/self/fd")
+def test_early_break_releases_descriptors_on_the_python_engine(run_jss, text_file):
+    source = f"""
+    for (i, 0, 300, 1) {{
+        for (line in read_lines("{text_file}")) {{ break }}
+    }}
+    print("done")
+    """
+    before = len(os.listdir("/proc/self/fd"))
+    assert run_jss(source, "python") == ["done"]
+    assert len(os.listdir("/proc/self/fd")) <= before + 1
+
+
+@pytest.mark.parametrize("engine, scoping", INTERPRETERS)
+def test_readers_left_open_are_closed_at_the_end_of_the_run(run_jss, text_file, engine, scoping):
+    env = counting_environment()
+    source = f"""
+    var lines = read_lines("{text_file}")
+    var chunks = read_chunks("{text_file}", 3)
+    print(open_count())
+    """
+    assert run_jss(source, engine, scoping, env) == ["2"]
+    assert len(env.open_files) == 0
+    assert env.get_variable("lines")._file.closed
+    assert env.get_variable("chunks")._file.closed
@@ -0,0 +1,71 @@
+import pytest
+
+from jsonscript.memo import MemoCache
+
+from conftest import ENGINES
+
+
+FIB = """
+memo func fib(n) {
+    if (n < 2) { return n }
+    return fib(n - 1) + fib(n - 2)
+}
+print(fib(60))
+print(cache_stats("fib"))
+"""
+
+
+@pytest.mark.parametrize("engine, scoping", ENGINES)
+def test_memoized_recursion_hits_the_cache(run_jss, engine, scoping):
+    assert run_jss(FIB, engine, scoping) == [
+        "1548008755920",
+        "{'hits': 58, 'misses': 61, 'evictions': 0, 'bypassed': 0, 'size': 61, 'max_size': 128}",
+    ]
+
+
+@pytest.mark.parametrize("engine, scoping", ENGINES)
+def test_bounded_cache_evicts_and_unhashable_arguments_bypass_it(run_jss, engine, scoping):
+    source = """
+    var calls = []
+    memo(2) func square(x) {
+        push(calls, x)
+        return x * x
+    }
+    memo func total(list) { return sum(list) }
+    print(square(1) + square(2) + square(1) + square(3) + square(2))
+    print(calls)
+    print(total([1, 2]) + total([1, 2]))
+    print(cache_stats("square"))
+    print(cache_stats("total"))
+    """
+    assert run_jss(source, engine, scoping) == [
+        "19",
+        "[1, 2, 3, 2]",
+        "6",
+        "{'hits': 1, 'misses': 4, 'evictions': 2, 'bypassed': 0, 'size': 2, 'max_size': 2}",
+        "{'hits': 0, 'misses': 0, 'evictions': 0, 'bypassed': 2, 'size': 0, 'max_size': 128}",
+    ]
+
+
+def test_keys_include_argument_types():
+    cache = MemoCache(4)
+    cache.store(cache.key([1]), "int")
+    assert cache.lookup(cache.key([1])) == (True, "int")
+    assert cache.lookup(cache.key([1.0])) == (False, None)
+    assert cache.lookup(cache.key([True])) == (False, None)
+
+
+def test_least_recently_used_entry_is_evicted_first():
+    cache = MemoCache(2)
+    cache.store(("a",), 1)
+    cache.store(("b",), 2)
+    cache.lookup(("a",))
+    cache.store(("c",), 3)
+    assert cache.lookup(("b",)) == (False, None)
+    assert cache.lookup(("a",)) == (True, 1)
+    assert cache.stats()["evictions"] == 1
+
+
+def test_invalid_size_is_rejected():
+    with pytest.raises(ValueError):
+        MemoCache(0)
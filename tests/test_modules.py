@@ -0,0 +1,61 @@
+import pytest
+
+from conftest import ENGINES
+
+
+@pytest.fixture
+def modules(tmp_path, monkeypatch):
+    """Writes .jss modules in a temporary working directory."""
+    monkeypatch.chdir(tmp_path)
+
+    def write(**sources):
+        for name, text in sources.items():
+            (tmp_path / f"{name}.jss").write_text(text, encoding="utf-8")
+
+    return write
+
+
+LIB = """
+print "loading lib"
+var loads = 1
+func twice(n) { return n * 2 }
+"""
+
+
+@pytest.mark.parametrize("engine, scoping", ENGINES)
+def test_repeated_and_diamond_imports_run_the_module_once(run_jss, modules, engine, scoping):
+    modules(
+        lib=LIB,
+        left='import "lib.jss"\nprint "loading left"',
+        right='import "lib.jss"\nprint "loading right"',
+    )
+    source = """
+    import "left.jss"
+    import "right.jss"
+    import "lib.jss"
+    for (i, 0, 3, 1) { import "lib.jss" }
+    print twice(21)
+    """
+    assert run_jss(source, engine, scoping) == ["loading lib", "loading left", "loading right", "42"]
+
+
+# Les moteurs vm et python ne gèrent pas les imports avec "as"
+@pytest.mark.parametrize("engine, scoping", [("tree", "dynamic"), ("tree", "lexical"), ("closure", "lexical")])
+def test_namespaced_imports_share_one_module_instance(run_jss, modules, engine, scoping):
+    modules(lib=LIB)
+    source = """
+    import "lib.jss" as a
+    import "lib.jss" as b
+    print a.twice(5)
+    print b.loads
+    """
+    assert run_jss(source, engine, scoping) == ["loading lib", "10", "1"]
+
+
+@pytest.mark.parametrize("engine, scoping", ENGINES)
+def test_circular_imports_stop_at_the_module_being_loaded(run_jss, modules, engine, scoping):
+    modules(
+        ping='print "ping"\nimport "pong.jss"',
+        pong='print "pong"\nimport "ping.jss"',
+    )
+    assert run_jss('import "ping.jss"\nprint "done"', engine, scoping) == ["ping", "pong", "done"]
@@ -0,0 +1,94 @@
+import pytest
+
+from conftest import run_program
+from jsonscript.compiler import JSSCompiler
+from jsonscript.optimizer import ASTOptimizer
+
+
+@pytest.mark.parametrize("expression, folded", [
+    (["+", 2, 3], 5),
+    (["+", "a", 1], "a1"),
+    (["*", ["+", 1, 2], ["-", 10, 4]], 18),
+    (["<", ["+", 1, 1], 3], True),
+    (["upper", ["concat", "ab", "c"]], "ABC"),
+    (["max", 3, 9], 9),
+])
+def test_pure_constant_expressions_are_folded(expression, folded):
+    optimizer = ASTOptimizer(1)
+    assert optimizer.optimize([["print", expression]]) == [["print", folded]]
+    assert optimizer.stats["folded_expressions"] >= 1
+
+
+@pytest.mark.parametrize("expression", [
+    ["+", ["get", "x"], 1],
+    ["/", 1, 0],
+    ["random"],
+    ["len", [1, 2]],
+])
+def test_expressions_that_cannot_be_folded_are_kept(expression):
+    assert ASTOptimizer(1).optimize([["print", expression]]) == [["print", expression]]
+
+
+def test_partially_constant_expressions_fold_their_constant_parts():
+    program = [["print", ["+", ["get", "x"], ["*", 2, 3]]]]
+    assert ASTOptimizer(1).optimize(program) == [["print", ["+", ["get", "x"], 6]]]
+
+
+def test_level_one_strips_comments_but_keeps_branches():
+    program = [["comment", "note"], ["if", ["==", 1, 2], [["print", "a"]], [["print", "b"]]]]
+    assert ASTOptimizer(1).optimize(program) == [["if", False, [["print", "a"]], [["print", "b"]]]]
+
+
+def test_level_zero_changes_nothing():
+    program = [["comment", "note"], ["print", ["+", 2, 3]]]
+    assert ASTOptimizer(0).optimize(program) == program
+
+
+@pytest.mark.parametrize("statement, replacement", [
+    (["if", ["==", 1, 1], [["print", "yes"]], [["print", "no"]]], [["print", "yes"]]),
+    (["if", ["==", 1, 2], [["print", "yes"]], [["print", "no"]]], [["print", "no"]]),
+    (["if", False, [["print", "yes"]]], []),
+    (["while", ["<", 2, 1], [["print", "never"]]], []),
+    (["assert", ["==", 1, 1], "always true"], []),
+    (["switch", ["+", 1, 1], [[1, [["print", "one"]]], [2, [["print", "two"]]]], [["print", "other"]]],
+     [["print", "two"]]),
+    (["switch", 5, [[1, [["print", "one"]]]], [["print", "other"]]], [["print", "other"]]),
+])
+def test_level_two_eliminates_dead_branches(statement, replacement):
+    optimizer = ASTOptimizer(2)
+    assert optimizer.optimize([statement]) == replacement
+    assert optimizer.stats["removed_branches"] == 1
+
+
+def test_level_two_keeps_branches_on_runtime_conditions():
+    statement = ["if", ["get", "x"], [["print", "yes"]], [["print", "no"]]]
+    assert ASTOptimizer(2).optimize([statement]) == [statement]
+
+
+def test_level_two_removes_statements_after_a_terminator():
+    program = [["function", "f", [], [
+        ["return", 1],
+        ["print", "unreachable"],
+        ["print", "also unreachable"],
+    ]]]
+    optimizer = ASTOptimizer(2)
+    assert optimizer.optimize(program) == [["function", "f", [], [["return", 1]]]]
+    assert optimizer.stats["removed_unreachable"] == 2
+
+
+def test_optimized_program_prints_the_same_output(capsys):
+    source = """
+    var x = 2 * 3 + 1
+    if (x > 5) { print "big " + x } else { print "small" }
+    if (1 == 2) { print "dead" }
+    func f(n) {
+        return n * (10 - 8)
+        print "unreachable"
+    }
+    print f(x)
+    """
+    raw_program = JSSCompiler().compile(source)
+    run_program(raw_program)
+    expected = capsys.readouterr().out.splitlines()
+    run_program(ASTOptimizer(2).optimize(raw_program))
+    assert capsys.readouterr().out.splitlines() == expected == ["big 7", "14"]
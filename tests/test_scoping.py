@@ -0,0 +1,70 @@
+import pytest
+
+
+SHADOWED = """
+var secret = "global"
+
+func inner() {
+    return secret
+}
+
+func outer() {
+    var secret = 42
+    var seen = inner()
+    return seen
+}
+
+print(outer())
+print(secret)
+"""
+
+LOCALS = """
+var total = 10
+
+func add_all(list) {
+    var total = total + 1
+    for (x in list) {
+        total = total + x
+    }
+    return total
+}
+
+print(add_all([1, 2, 3]))
+print(total)
+"""
+
+
+@pytest.mark.parametrize("engine", ["tree", "closure", "vm"])
+def test_lexical_scoping_hides_the_callers_locals(run_jss, engine):
+    assert run_jss(SHADOWED, engine, "lexical") == ["global", "global"]
+
+
+@pytest.mark.parametrize("engine", ["tree", "closure", "vm"])
+def test_dynamic_scoping_sees_the_callers_locals(run_jss, engine):
+    assert run_jss(SHADOWED, engine, "dynamic") == ["42", "global"]
+
+
+def test_python_engine_is_lexical(run_jss):
+    assert run_jss(SHADOWED, "python") == ["global", "global"]
+
+
+@pytest.mark.parametrize("engine, scoping", [
+    ("tree", "lexical"), ("tree", "dynamic"), ("closure", "lexical"), ("closure", "dynamic"),
+    ("vm", "lexical"), ("vm", "dynamic"), ("python", "lexical"),
+])
+def test_local_shadowing_a_global_reads_it_until_assigned(run_jss, engine, scoping):
+    assert run_jss(LOCALS, engine, scoping) == ["17", "10"]
+
+
+@pytest.mark.parametrize("engine", ["tree", "closure", "vm", "python"])
+def test_lexical_is_the_default_on_every_engine(run_jss, engine):
+    from main import parse_cli
+    assert run_jss(SHADOWED, engine) == ["global", "global"]
+    assert parse_cli(["prog.jss", f"--engine={engine}"]).scoping == "lexical"
+
+
+def test_python_engine_rejects_dynamic_scoping():
+    from main import parse_cli
+    with pytest.raises(SystemExit):
+        parse_cli(["prog.jss", "--engine=python", "--scoping=dynamic"])
+    assert parse_cli(["prog.jss", "--engine=vm", "--scoping=dynamic"]).scoping == "dynamic"
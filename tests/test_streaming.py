@@ -0,0 +1,109 @@
+import io
+import json
+import re
+
+import pytest
+
+from jsonscript.runner import JsonScript
+from jsonscript.streaming import iter_json_array
+
+
+DOCUMENT = """ [
+  ["print", "a ] tricky, \\"string\\" [ é"],
+  12345, -0.5e3, 1.25,
+  {"nested": [[1, 2], {"k": "v"}], "empty": []},
+  true, null, "",
+  ["set", "x", [1, [2, [3]]]]
+] """
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 1 << 16])
+def test_elements_match_json_loads_whatever_the_chunk_size(chunk_size):
+    elements = list(iter_json_array(io.StringIO(DOCUMENT), chunk_size=chunk_size))
+    assert elements == json.loads(DOCUMENT)
+
+
+@pytest.mark.parametrize("text", ["[]", "  [ \n ]  "])
+def test_empty_array(text):
+    assert list(iter_json_array(io.StringIO(text), chunk_size=1)) == []
+
+
+@pytest.mark.parametrize("text, message", [
+    ('{"a": 1}', "Expecting '['"),
+    ("", "Expecting '['"),
+    ("[1, 2", "Unterminated array"),
+    ("[1, 2] 3", "Extra data"),
+    ("[1 2]", "Expecting ',' delimiter"),
+])
+def test_malformed_programs_raise(text, message):
+    with pytest.raises(json.JSONDecodeError, match=re.escape(message)):
+        list(iter_json_array(io.StringIO(text), chunk_size=2))
+
+
+def test_elements_before_an_error_are_yielded():
+    elements = iter_json_array(io.StringIO('[["a"], ["b"], oops]'), chunk_size=4)
+    assert next(elements) == ["a"]
+    assert next(elements) == ["b"]
+    with pytest.raises(json.JSONDecodeError):
+        next(elements)
+
+
+def write_program(tmp_path, text):
+    path = tmp_path / "program.json"
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+@pytest.mark.parametrize("engine", ["tree", "closure"])
+def test_stream_file_runs_instructions_as_they_are_read(tmp_path, capsys, engine):
+    path = write_program(tmp_path, '[["set", "x", 2], ["print", ["*", ["get", "x"], 21]], ["print", "done"]]')
+    env = JsonScript.stream_file(path).run(engine=engine)
+    assert capsys.readouterr().out.splitlines() == ["42", "done"]
+    assert env.get_variable("x") == 2
+
+
+@pytest.mark.parametrize("program", [
+    '[["print", "before"], ["print", "cut"',
+    '[["print", "before"], ["function", "f"], ["print", "after"]]',
+])
+def test_stream_file_reports_loading_errors_after_the_preceding_instructions(tmp_path, capsys, program):
+    JsonScript.stream_file(write_program(tmp_path, program)).run()
+    out = capsys.readouterr().out.splitlines()
+    assert out[0] == "before"
+    assert out[1].startswith("Loading Error: ")
+    assert len(out) == 2
+
+
+def test_stream_file_reports_runtime_errors_as_such(tmp_path, capsys):
+    path = write_program(tmp_path, '[["print", "before"], ["print", ["/", 1, 0]], ["print", "after"]]')
+    JsonScript.stream_file(path).run()
+    assert capsys.readouterr().out.splitlines() == ["before", "Runtime Error: Division by zero"]
+
+
+def test_stream_file_applies_the_transform(tmp_path, capsys):
+    path = write_program(tmp_path, '[["print", 1], ["print", 2]]')
+    JsonScript.stream_file(path, transform=lambda raw: [raw, raw]).run()
+    assert capsys.readouterr().out.splitlines() == ["1", "1", "2", "2"]
+
+
+@pytest.mark.parametrize("malformed", ["[1 2]", '{"a" 1}', "[tru]", '"bad \\x escape"', "-"])
+def test_malformed_element_is_reported_without_reading_the_rest(malformed):
+    stream = io.StringIO('[["a"], ' + malformed + ", " + '["padding"], ' * 10000 + '["z"]]')
+    elements = iter_json_array(stream, chunk_size=16)
+    assert next(elements) == ["a"]
+    with pytest.raises(json.JSONDecodeError):
+        next(elements)
+    assert stream.tell() < 200
+
+
+@pytest.mark.parametrize("argv", [
+    ["prog.json", "--stream", "--engine=vm"],
+    ["prog.json", "--stream", "--engine=python"],
+    ["prog.json", "--stream", "--emit-python=out.py"],
+    ["prog.jss", "--stream"],
+])
+def test_stream_is_rejected_where_it_would_be_ignored(argv):
+    from main import parse_cli
+    with pytest.raises(SystemExit):
+        parse_cli(argv)
+    assert parse_cli(["prog.json", "--stream", "--engine=closure"]).stream
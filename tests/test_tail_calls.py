@@ -0,0 +1,90 @@
+import sys
+
+import pytest
+
+from conftest import INTERPRETERS, run_program
+
+
+DEPTH = sys.getrecursionlimit() * 5
+
+COUNTDOWN = f"""
+func count(n, acc) {{
+    if (n == 0) {{ return acc }}
+    return count(n - 1, acc + 1)
+}}
+print(count({DEPTH}, 0))
+"""
+
+MUTUAL = f"""
+func is_even(n) {{
+    if (n == 0) {{ return "even" }}
+    return is_odd(n - 1)
+}}
+func is_odd(n) {{
+    if (n == 0) {{ return "odd" }}
+    return is_even(n - 1)
+}}
+print(is_even({DEPTH + 1}))
+"""
+
+
+@pytest.mark.parametrize("engine, scoping", INTERPRETERS)
+def test_self_tail_recursion_runs_in_constant_stack(run_jss, engine, scoping):
+    assert run_jss(COUNTDOWN, engine, scoping) == [str(DEPTH)]
+
+
+@pytest.mark.parametrize("engine, scoping", INTERPRETERS)
+def test_mutual_tail_recursion_runs_in_constant_stack(run_jss, engine, scoping):
+    assert run_jss(MUTUAL, engine, scoping) == ["odd"]
+
+
+def test_python_engine_loops_self_tail_calls(run_jss):
+    assert run_jss(COUNTDOWN, "python") == [str(DEPTH)]
+
+
+def test_dynamic_tail_call_sees_the_callers_locals(run_jss):
+    source = """
+    var secret = "global"
+    func inner() { return secret }
+    func outer() {
+        var secret = 42
+        return inner()
+    }
+    print(outer())
+    """
+    assert run_jss(source, "tree", "dynamic") == ["42"]
+    assert run_jss(source, "tree", "lexical") == ["global"]
+
+
+@pytest.mark.parametrize("engine, scoping", INTERPRETERS)
+def test_non_tail_recursion_still_returns(run_jss, engine, scoping):
+    source = """
+    func depth(n) {
+        if (n == 0) { return 0 }
+        return 1 + depth(n - 1)
+    }
+    print(depth(50))
+    """
+    assert run_jss(source, engine, scoping) == ["50"]
+
+
+def test_dynamic_tail_chain_closes_its_scopes():
+    from jsonscript.compiler import JSSCompiler
+    env = run_program(JSSCompiler().compile(COUNTDOWN), "tree", "dynamic")
+    assert len(env._scopes) == 1
+
+
+@pytest.mark.parametrize("source", [COUNTDOWN, MUTUAL], ids=["self", "mutual"])
+def test_dynamic_tail_chain_reuses_a_single_scope(run_jss, source):
+    from jsonscript.environment import Environment
+    env = Environment()
+    depths = set()
+
+    def scope_depth():
+        depths.add(len(env._scopes))
+        return 0
+
+    env.register_native_function("scope_depth", scope_depth)
+    run_jss(source.replace("return acc", "return acc + scope_depth()")
+                  .replace('return "odd"', 'return "odd" + scope_depth()'), "tree", "dynamic", env)
+    assert depths == {2}
@@ -0,0 +1,95 @@
+import sys
+
+from conftest import run_program
+
+
+PROGRAM = """
+class Shape(name) {
+    describe() { return this.name + " has area " + this.area() }
+    area() { return 0 }
+}
+class Square(name, side) extends Shape {
+    area() { return this.side * this.side }
+}
+func fib(n) {
+    if (n < 2) { return n }
+    return fib(n - 1) + fib(n - 2)
+}
+func label(n) {
+    switch (n % 3) {
+        case 0:
+            return "fizz"
+        case 1:
+            return "one"
+        default:
+            return "other"
+    }
+}
+var total = 0
+for (i, 0, 10, 1) {
+    if (i == 3) { continue }
+    if (i == 8) { break }
+    total = total + i
+}
+print total
+print fib(15)
+var sq = new Square("sq", 3)
+print sq.describe()
+print label(total)
+var i = 0
+while (i < 4) { i = i + 1 }
+print i
+for (k, v in {"a": 1, "b": 2}) { print k + "=" + v }
+for (w in split("x,y", ",")) { print upper(w) }
+print sum(range(5)) + max([4, 9, 2])
+print map(x => x * 2, [1, 2, 3])
+print filter(x => x > 1, [1, 2, 3])
+print 7 / 2
+print "n" + 1 + 2
+print [1, "a", true] == [1, "a", true]
+"""
+
+EXPECTED = [
+    "25", "610", "sq has area 9", "one", "4", "a=1", "b=2", "X", "Y", "19",
+    "[2, 4, 6]", "[2, 3]", "3.5", "n12", "True",
+]
+
+
+def test_vm_output_matches_the_tree_engine(run_jss):
+    assert run_jss(PROGRAM, "tree") == EXPECTED
+    assert run_jss(PROGRAM, "vm") == EXPECTED
+
+
+ERRORS = [
+    ["function", "check", ["n"], [
+        ["assert", [">", ["get", "n"], 0], "n must be positive"],
+        ["return", ["get", "n"]],
+    ]],
+    ["try", [["print", ["/", 1, 0]]], "err", [["print", ["get", "err"]]]],
+    ["try", [["throw", "custom"]], "err", [["print", ["get", "err"]]]],
+    ["try", [["print", ["call", "check", -1]]], "err", [["print", ["get", "err"]]]],
+    ["print", ["call", "check", 5]],
+    ["print", ["/", 1, 0]],
+    ["print", "not reached"],
+]
+
+
+def test_vm_errors_match_the_tree_engine(capsys):
+    run_program(ERRORS, "tree")
+    tree_output = capsys.readouterr().out.splitlines()
+    run_program(ERRORS, "vm")
+    assert capsys.readouterr().out.splitlines() == tree_output
+    assert tree_output == ["Division by zero", "custom", "Assertion Failed: n must be positive", "5",
+                               "Runtime Error: Division by zero"]
+
+
+def test_vm_recursion_is_not_limited_by_the_python_stack(run_jss):
+    depth = sys.getrecursionlimit() * 2
+    source = f"""
+    func depth(n) {{
+        if (n == 0) {{ return 0 }}
+        return 1 + depth(n - 1)
+    }}
+    print depth({depth})
+    """
+    assert run_jss(source, "vm") == [str(depth)]